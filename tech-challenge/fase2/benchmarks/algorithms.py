@@ -0,0 +1,259 @@
+"""
+Benchmark dos algoritmos de alocação em instâncias geradas com semente, em várias escalas.
+
+Cada caso (algoritmo x ordens x operadores) roda em um processo novo, com tempo, pico de memória, fitness,
+ordens não alocadas e horas extras; os resultados podem ser comparados com uma execução anterior (--baseline).
+
+Uso (a partir da pasta fase2):
+    python benchmarks/algorithms.py --orders 100 1000 --operators 5 50 --baseline resultados_benchmark/benchmark.csv
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import algorithms
+from functions import common_functions as cf
+from functions.chromosome import set_seed
+from functions.eligibility import EligibilityIndex
+from functions.instance_generator import generate_instance
+from functions.instance_table import order_values, operator_values
+
+# Escalas padrão (ordens x operadores).
+DEFAULT_ORDERS = [100, 1_000, 10_000, 100_000]
+DEFAULT_OPERATORS = [5, 50, 500]
+
+# Maior instância executada por algoritmo (acima disso o caso é registrado como "skipped").
+DEFAULT_MAX_ORDERS = {
+    "genetic_algorithm": 100_000,
+    "linear_programming_algorithm": 10_000,
+    "greedy_algorithm": 100_000,
+    "human_allocation": 100_000,
+}
+
+# Colunas que identificam um caso ao comparar com a linha de base.
+CASE_COLUMNS = ["algorithm", "n_orders", "n_operators", "days", "seed"]
+
+# Tolerâncias padrão da comparação com a linha de base.
+DEFAULT_TOLERANCES = {
+    "time": 0.25,       # Aumento relativo aceito no tempo de execução.
+    "time_slack": 0.05,  # Folga absoluta (s) no tempo, para casos muito rápidos.
+    "memory": 0.20,     # Aumento relativo aceito no pico de memória.
+    "fitness": 1e-6,    # Queda relativa aceita no fitness.
+}
+
+params = {
+    "_DAYS": 5,
+    "_SEED": 42,
+    "_POPULATION_SIZE": 50,
+    "_GENERATIONS": 50,
+    "_LP_TIME_LIMIT": 60,
+    "_LP_GAP": 0.01,
+    "_TIMEOUT": 900,    # Tempo máximo (s) de cada caso, incluindo a geração da instância.
+}
+
+def run_algorithm(name, operators, orders, days, index, options):
+    """
+    Executa um dos algoritmos do registro `functions.algorithms` e retorna a solução.
+
+    Detalhes:
+    - O índice de elegibilidade é construído antes e compartilhado, como em `main.py`.
+    - A programação linear aceita ordens não alocadas, pois a restrição de alocação obrigatória torna
+      inviáveis as instâncias com mais horas do que capacidade.
+    """
+    module = algorithms[name]
+    if name == "genetic_algorithm":
+        from functions.genetic_engine import GeneticEngine
+        with GeneticEngine(operators, orders, days=days, population_size=options["_POPULATION_SIZE"],
+                           generations=options["_GENERATIONS"], index=index) as engine:
+            return engine.run()
+    if name == "linear_programming_algorithm":
+        return module.linear_programming_allocation(operators, orders, days, index=index,
+                                                    time_limit=options["_LP_TIME_LIMIT"], gap=options["_LP_GAP"],
+                                                    allow_unassigned=True)
+    if name == "greedy_algorithm":
+        return module.greedy_allocation(operators, orders, days, index=index)
+    if name == "human_allocation":
+        return module.human_allocation(operators, orders, days, index=index)
+    raise ValueError(f"Algoritmo sem execução no benchmark: {name}")
+
+def solution_metrics(solution, operators, orders, days):
+    """
+    Ordens não alocadas e horas extras (acima da capacidade diária de cada operador) de uma solução.
+    """
+    allocations = [(order_id, allocation["operator"], allocation["day"])
+                   for order_id, allocation in solution["orders"].items() if allocation["operator"] is not None]
+    order_position = {order_id: i for i, order_id in enumerate(orders)}
+    operator_position = {operator_id: i for i, operator_id in enumerate(operators)}
+
+    hours = order_values(orders, "estimated_hours")[[order_position[order_id] for order_id, _, _ in allocations]]
+    slot = np.array([operator_position[operator] * (days + 1) + day for _, operator, day in allocations], dtype=np.int64)
+    load = np.bincount(slot, weights=hours, minlength=len(operators) * (days + 1)).reshape(len(operators), days + 1)
+    capacity = operator_values(operators, "hours_per_day")[:, None]
+
+    return {
+        "unassigned": len(orders) - len(allocations),
+        "overtime_hours": float(np.maximum(0, load - capacity).sum()),
+    }
+
+def _peak_memory_mb():
+    # ru_maxrss em KB no Linux; inclui os processos filhos já encerrados (ex.: o CBC da programação linear).
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _run_case(connection, name, n_orders, n_operators, days, seed, options):
+    """
+    Processo de um caso: gera a instância, executa o algoritmo e envia as medições ao processo principal.
+    """
+    try:
+        start = time.perf_counter()
+        operators, orders = generate_instance(n_orders, n_operators, seed=seed)
+        index = EligibilityIndex(operators, orders)
+        setup_time = time.perf_counter() - start
+
+        # Algoritmo genético reproduzível para a mesma semente.
+        random.seed(seed)
+        set_seed(seed)
+
+        start = time.perf_counter()
+        solution = run_algorithm(name, operators, orders, days, index, options)
+        wall_time = time.perf_counter() - start
+
+        result = {
+            "status": "ok",
+            "setup_time": setup_time,
+            "wall_time": wall_time,
+            "peak_memory_mb": _peak_memory_mb(),
+            "fitness": float(cf.calculate_fitness(solution, operators, orders, days, index)),
+        }
+        result.update(solution_metrics(solution, operators, orders, days))
+    except Exception as e:
+        result = {"status": "error", "error": repr(e)}
+    connection.send(result)
+    connection.close()
+
+def run_case(name, n_orders, n_operators, days, seed, options, timeout):
+    """
+    Executa um caso em um processo novo, isolando o pico de memória e permitindo interromper casos lentos.
+
+    Returns:
+        dict: Medições do caso, com `status` "ok", "timeout" ou "error".
+    """
+    context = multiprocessing.get_context("spawn")
+    parent_connection, child_connection = context.Pipe(duplex=False)
+    process = context.Process(target=_run_case, daemon=True,
+                              args=(child_connection, name, n_orders, n_operators, days, seed, options))
+    process.start()
+    child_connection.close()
+
+    if parent_connection.poll(timeout):
+        try:
+            result = parent_connection.recv()
+        except EOFError:
+            # O processo terminou sem responder (ex.: sem memória).
+            result = {"status": "error", "error": "processo encerrado sem resultado"}
+    else:
+        process.terminate()
+        result = {"status": "timeout", "wall_time": timeout}
+    process.join()
+    return result
+
+def run_benchmark(algorithm_names, orders_grid, operators_grid, days, seed, options, timeout, max_orders=None):
+    """
+    Executa todos os algoritmos em todas as escalas (produto das listas de ordens e de operadores).
+
+    Returns:
+        pd.DataFrame: Uma linha por caso, com as colunas de `CASE_COLUMNS` e as medições.
+    """
+    max_orders = {**DEFAULT_MAX_ORDERS, **(max_orders or {})}
+    rows = []
+    for n_orders, n_operators in itertools.product(orders_grid, operators_grid):
+        for name in algorithm_names:
+            case = {"algorithm": name, "n_orders": n_orders, "n_operators": n_operators, "days": days, "seed": seed}
+            if n_orders > max_orders.get(name, float("inf")):
+                rows.append({**case, "status": "skipped"})
+                continue
+            result = run_case(name, n_orders, n_operators, days, seed, options, timeout)
+            rows.append({**case, **result})
+            print(f"{name:30s} {n_orders:>7d} ordens {n_operators:>4d} operadores: {result['status']}"
+                  + (f" em {result['wall_time']:.2f}s, fitness {result['fitness']:.1f}, "
+                     f"{result['unassigned']} não alocadas, {result['peak_memory_mb']:.0f} MB"
+                     if result["status"] == "ok" else f" {result.get('error', '')}"))
+
+    columns = CASE_COLUMNS + ["status", "setup_time", "wall_time", "peak_memory_mb", "fitness", "unassigned",
+                              "overtime_hours", "error"]
+    return pd.DataFrame(rows).reindex(columns=columns)
+
+def compare_with_baseline(results, baseline, tolerances=None):
+    """
+    Compara os resultados com uma execução anterior e lista as regressões.
+
+    Args:
+        results (pd.DataFrame): Resultados atuais (ver `run_benchmark`).
+        baseline (pd.DataFrame): Resultados da linha de base, no mesmo formato.
+        tolerances (dict, opcional): Tolerâncias (ver `DEFAULT_TOLERANCES`).
+
+    Returns:
+        pd.DataFrame: Uma linha por regressão: caso, métrica, valor da linha de base e valor atual.
+
+    Detalhes:
+    - Casos que eram "ok" e deixaram de ser são regressões de status.
+    - Tempo e memória são regressões acima da tolerância relativa; o fitness, quando cai além da tolerância;
+      e as ordens não alocadas e horas extras, quando aumentam.
+    - Casos que não existem na linha de base são ignorados.
+    """
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    merged = results.merge(baseline, on=CASE_COLUMNS, suffixes=("", "_baseline"))
+    checks = [
+        ("status", (merged["status_baseline"] == "ok") & (merged["status"] != "ok")),
+        ("wall_time", merged["wall_time"] > merged["wall_time_baseline"] * (1 + tolerances["time"])
+                      + tolerances["time_slack"]),
+        ("peak_memory_mb", merged["peak_memory_mb"] > merged["peak_memory_mb_baseline"] * (1 + tolerances["memory"])),
+        ("fitness", merged["fitness"] < merged["fitness_baseline"]
+                    - merged["fitness_baseline"].abs() * tolerances["fitness"]),
+        ("unassigned", merged["unassigned"] > merged["unassigned_baseline"]),
+        ("overtime_hours", merged["overtime_hours"] > merged["overtime_hours_baseline"]),
+    ]
+    regressions = []
+    for metric, failed in checks:
+        for _, row in merged[failed.fillna(False).astype(bool)].iterrows():
+            regressions.append({**{column: row[column] for column in CASE_COLUMNS}, "metric": metric,
+                                "baseline": row[f"{metric}_baseline"], "current": row[metric]})
+    return pd.DataFrame(regressions, columns=CASE_COLUMNS + ["metric", "baseline", "current"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de alocação em várias escalas.")
+    parser.add_argument('--algorithms', nargs='+', choices=list(algorithms.keys()), default=list(algorithms.keys()), help="Algoritmos executados.")
+    parser.add_argument('--orders', nargs='+', type=int, default=DEFAULT_ORDERS, help="Números de ordens das instâncias.")
+    parser.add_argument('--operators', nargs='+', type=int, default=DEFAULT_OPERATORS, help="Números de operadores das instâncias.")
+    parser.add_argument('--days', type=int, default=params["_DAYS"], help="Número de dias do planejamento.")
+    parser.add_argument('--seed', type=int, default=params["_SEED"], help="Semente das instâncias e do algoritmo genético.")
+    parser.add_argument('--timeout', type=float, default=params["_TIMEOUT"], help="Tempo máximo (s) de cada caso.")
+    parser.add_argument('--max-orders', nargs='+', default=[], metavar="ALGORITMO=N", help="Maior número de ordens executado por algoritmo (ex.: linear_programming_algorithm=1000).")
+    parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resultados_benchmark", "benchmark.csv"), help="Arquivo CSV com os resultados.")
+    parser.add_argument('--baseline', help="CSV de uma execução anterior: regressões em relação a ele fazem o benchmark terminar com erro.")
+    args = parser.parse_args()
+
+    max_orders = {name: int(value) for name, value in (item.split("=", 1) for item in args.max_orders)}
+    results = run_benchmark(args.algorithms, args.orders, args.operators, args.days, args.seed, params,
+                            args.timeout, max_orders)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    results.to_csv(args.output, index=False)
+    print(f"Resultados salvos em: {args.output}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, pd.read_csv(args.baseline))
+        if not regressions.empty:
+            print("\nRegressões em relação à linha de base:\n", regressions.to_string(index=False))
+            sys.exit(1)
+        print("Nenhuma regressão em relação à linha de base.")
@@ -0,0 +1,95 @@
+"""
+Benchmark de alocações de memória por geração do algoritmo genético.
+
+Compara, para uma mesma instância, a geração de filhos (crossover + mutação):
+- "dict + deepcopy": formato em dicionário copiando o filho com `copy.deepcopy` antes da mutação
+  (comportamento anterior de `mutate`);
+- "dict compartilhado": formato em dicionário com as alocações compartilhadas entre pais e filhos;
+- "cromossomo (copy-on-write)": cromossomos compactos, que só duplicam os vetores na primeira mutação aceita.
+
+Uso (a partir da pasta fase2):
+    python benchmarks/copy_on_write.py --orders 2000 --operators 20 --population 50
+"""
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import common_functions as cf
+from functions import genetic_algorithm as ga
+from functions.chromosome import GenomeLayout
+from functions.eligibility import EligibilityIndex
+from functions.population_fitness import evaluate_population
+
+def run_generation(population, operators, orders, days, mutation_rate, elitism_size, index, deep_copy):
+    """
+    Gera uma nova população a partir da elite, como no loop principal de `main.py`.
+    """
+    new_population = [population[0]]
+    while len(new_population) < len(population):
+        parent1, parent2 = random.choices(population[:elitism_size], k=2)
+        child = ga.crossover(parent1, parent2, operators, orders, days, index)
+        if deep_copy:
+            child = copy.deepcopy(child)
+        child = ga.mutate(child, operators, orders, mutation_rate, days, index)
+        new_population.append(child)
+    return new_population
+
+def measure(label, population, args, operators, orders, index, deep_copy=False):
+    """
+    Mede o tempo e a memória alocada (pico e retida) em média por geração.
+    """
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    peak_total = 0
+    for _ in range(args.generations):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        population = run_generation(population, operators, orders, args.days, args.mutation_rate,
+                                    args.elitism, index, deep_copy)
+        _, peak = tracemalloc.get_traced_memory()
+        peak_total += peak - baseline
+    elapsed = time.perf_counter() - start_time
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:28s} | {elapsed / args.generations * 1000:10.1f} ms/geração | "
+          f"{peak_total / args.generations / 1024:12.1f} KiB alocados/geração | "
+          f"{retained / 1024:10.1f} KiB retidos")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de alocações por geração do algoritmo genético.")
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--operators", type=int, default=20)
+    parser.add_argument("--population", type=int, default=50)
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--elitism", type=int, default=5)
+    parser.add_argument("--mutation-rate", type=float, default=0.3)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    operators, orders = cf.create_initial_data(args.orders, args.operators)
+    index = EligibilityIndex(operators, orders)
+    layout = GenomeLayout(operators, orders, args.days, index)
+
+    dict_population = [ga.create_initial_solution(operators, orders, args.days, index=index)
+                       for _ in range(args.population)]
+    evaluate_population(dict_population, layout)
+    dict_population.sort(key=lambda individual: individual["fitness"], reverse=True)
+
+    chromosome_population = [ga.Chromosome.from_solution(individual, layout) for individual in dict_population]
+
+    print(f"Instância: {args.orders} ordens, {args.operators} operadores, população {args.population}")
+    measure("dict + deepcopy", dict_population, args, operators, orders, index, deep_copy=True)
+    measure("dict compartilhado", dict_population, args, operators, orders, index)
+    measure("cromossomo (copy-on-write)", chromosome_population, args, operators, orders, index)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Diretório raiz dos testes: permite importar o pacote `functions` a partir de tests/.
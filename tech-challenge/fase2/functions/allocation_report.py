@@ -0,0 +1,254 @@
+import io
+import numpy as np
+import pandas as pd
+
+# Prioridades na ordem em que aparecem no relatório.
+REPORT_PRIORITIES = ['urgente', 'alta', 'média', 'baixa']
+
+def _percent(part, total):
+    return (part / total) * 100 if total else 0
+
+def compute_allocation_report(df, unassigned_orders, orders):
+    """
+    Calcula todas as seções do relatório de alocação, sem gerar texto.
+
+    Args:
+        df (pd.DataFrame): DataFrame com a solução de alocação (ver `solution_to_dataframe`).
+        unassigned_orders (list): Lista de ordens não alocadas.
+        orders (dict): Dicionário com informações das ordens.
+
+    Returns:
+        dict: {"metrics": métricas principais, "sections": dados de cada seção para `render_allocation_report`}.
+
+    Detalhes:
+    - Cada seção é calculada com uma única agregação (`groupby`/`value_counts`) sobre o DataFrame, em vez de
+      filtrar o DataFrame inteiro por operador, dia e prioridade.
+    - A compatibilidade de habilidades do atendimento é calculada uma vez por par distinto
+      (habilidades da ordem, habilidades do operador).
+    """
+    total_ordens = len(orders)
+    ordens_alocadas = df['id_ordem'].nunique()
+    ordens_nao_alocadas = len(unassigned_orders)
+
+    # 2. Quantidade de ordens por prioridade.
+    priority_counts = df['prioridade'].astype(object).value_counts()
+    by_priority = [(prioridade, int(priority_counts.get(prioridade, 0))) for prioridade in REPORT_PRIORITIES]
+
+    # 3. Ordens e horas por operador, na ordem em que os operadores aparecem na solução.
+    operator_groups = df.groupby('id_operador', sort=False).agg(
+        n_ordens=('id_ordem', 'size'), horas_total=('horas_estimadas', 'sum'), horas_disp=('horas_disponiveis', 'first'))
+    by_operator = list(operator_groups.itertuples(name=None))
+
+    # 4. Prazos.
+    atraso = df['atraso'].to_numpy()
+    ordens_no_prazo = int((atraso <= 0).sum())
+    late = df.loc[atraso > 0, ['id_ordem', 'atraso', 'prioridade']]
+    delays = list(zip(late['id_ordem'], late['atraso'], late['prioridade']))
+
+    # 5. Atendimento pelos critérios do fitness: compatibilidade calculada por par distinto de habilidades.
+    pair_codes, pairs = pd.factorize(pd.MultiIndex.from_arrays([df['Serviços'].astype(object),
+                                                                 df['habilidades_operador'].astype(object)]))
+    pair_match = np.empty(len(pairs), dtype=np.float64)
+    for i, (servicos, habilidades) in enumerate(pairs):
+        required_skills = set(servicos.split(" | "))
+        operator_skills = set(habilidades.split(" | "))
+        pair_match[i] = len(required_skills.intersection(operator_skills)) / len(required_skills)
+    skill_match_percent = pair_match[pair_codes]
+
+    dentro_prazo = atraso <= 0
+    horas_ok = df['horas_estimadas'].to_numpy() <= df['horas_disponiveis'].to_numpy()
+    category = np.select([(skill_match_percent == 1) & dentro_prazo & horas_ok, skill_match_percent >= 0.5],
+                         ['total', 'parcial'], 'inadequado')
+
+    detail_columns = ['id_ordem', 'Serviços', 'id_operador', 'habilidades_operador', 'inicio_esperado', 'dia']
+    atendimentos = {}
+    for tipo in ['total', 'parcial', 'inadequado']:
+        rows = df.loc[category == tipo, detail_columns]
+        atendimentos[tipo] = list(zip(*(rows[column] for column in detail_columns)))
+
+    # 6. Ordens, horas e prioridades por dia.
+    day_totals = df.groupby('dia').agg(n_ordens=('id_ordem', 'size'), horas=('horas_estimadas', 'sum'))
+    day_priority = df.groupby(['dia', df['prioridade'].astype(object)]).size()
+    by_day = []
+    for dia, n_ordens, horas in day_totals.itertuples(name=None):
+        counts = day_priority.loc[dia]
+        by_day.append((dia, n_ordens, horas,
+                       [(prioridade, int(counts[prioridade])) for prioridade in REPORT_PRIORITIES if prioridade in counts]))
+
+    # 7. Ordens não alocadas agrupadas por prioridade.
+    unassigned_by_priority = {}
+    for order_id in unassigned_orders:
+        unassigned_by_priority.setdefault(orders[order_id]['priority'], []).append(order_id)
+
+    total_atendidos = len(atendimentos['total'])
+    parcial_atendidos = len(atendimentos['parcial'])
+    inadequados = len(atendimentos['inadequado'])
+
+    metrics = {
+        'total_ordens': total_ordens,
+        'ordens_alocadas': ordens_alocadas,
+        'ordens_nao_alocadas': ordens_nao_alocadas,
+        'taxa_alocacao': _percent(ordens_alocadas, total_ordens),
+        'matches_perfeitos': total_atendidos,
+        'taxa_matches_perfeitos': _percent(total_atendidos, ordens_alocadas),
+        'compatibilidade_media': df['compatibilidade_os_op'].mean()*100 if not df.empty else 0,
+        'ordens_no_prazo': ordens_no_prazo,
+        'taxa_cumprimento_prazo': _percent(ordens_no_prazo, ordens_alocadas),
+        'atendimento_total': total_atendidos,
+        'atendimento_parcial': parcial_atendidos,
+        'atendimento_inadequado': inadequados,
+        'taxa_atendimento_total': _percent(total_atendidos, ordens_alocadas),
+        'taxa_atendimento_parcial': _percent(parcial_atendidos, ordens_alocadas),
+        'taxa_atendimento_inadequado': _percent(inadequados, ordens_alocadas)
+    }
+
+    sections = {
+        'by_priority': by_priority,
+        'by_operator': by_operator,
+        'delays': delays,
+        'atendimentos': atendimentos,
+        'by_day': by_day,
+        'unassigned_by_priority': unassigned_by_priority,
+    }
+
+    return {"metrics": metrics, "sections": sections}
+
+def render_allocation_report(report, orders):
+    """
+    Gera o texto do relatório de alocação em um buffer na memória.
+
+    Args:
+        report (dict): Resultado de `compute_allocation_report`.
+        orders (dict): Dicionário com informações das ordens (detalhes das ordens não alocadas).
+
+    Returns:
+        str: O relatório completo.
+    """
+    metrics = report["metrics"]
+    sections = report["sections"]
+    buffer = io.StringIO()
+
+    def write_output(text):
+        buffer.write(text + '\n')
+
+    ordens_alocadas = metrics['ordens_alocadas']
+
+    write_output("\n" + "=" * 80)
+    write_output("RELATÓRIO DETALHADO DE ALOCAÇÃO".center(80))
+    write_output("=" * 80)
+
+    # 1. Estatísticas Gerais
+    write_output("\n1. ESTATÍSTICAS GERAIS")
+    write_output("-" * 40)
+    write_output(f"Total de Ordens: {metrics['total_ordens']}")
+    write_output(
+        f"Ordens Alocadas: {ordens_alocadas} ({metrics['taxa_alocacao']:.1f}%)")
+    write_output(f"Ordens Não Alocadas: {metrics['ordens_nao_alocadas']}")
+
+    # 2. Análise por Prioridade
+    write_output("\n2. ANÁLISE POR PRIORIDADE")
+    write_output("-" * 40)
+    for prioridade, count in sections['by_priority']:
+        if count > 0:
+            write_output(
+                f"Prioridade {prioridade:8s}: {count:3d} ordens ({_percent(count, ordens_alocadas):5.1f}%)")
+
+    # 3. Análise por Operador
+    write_output("\n3. ANÁLISE POR OPERADOR")
+    write_output("-" * 40)
+    for operador, n_ordens, horas_total, horas_disp in sections['by_operator']:
+        percentual = (horas_total / (horas_disp * 5)) * 100
+        write_output(f"Operador {operador}:")
+        write_output(f"  - Ordens alocadas: {n_ordens}")
+        write_output(
+            f"  - Horas alocadas: {horas_total:.1f}h de {horas_disp * 5:.1f}h ({percentual:.1f}%)")
+
+    # 4. Análise de Prazos
+    write_output("\n4. ANÁLISE DE PRAZOS")
+    write_output("-" * 40)
+    write_output(
+        f"Ordens no Prazo: {metrics['ordens_no_prazo']} ({metrics['taxa_cumprimento_prazo']:.1f}%)")
+
+    if sections['delays']:
+        write_output("\nDetalhamento dos Atrasos:")
+        for ordem_id, atraso, prioridade in sections['delays']:
+            write_output(
+                f"  Ordem {ordem_id}: {atraso} dias de atraso (Prioridade: {prioridade})")
+
+    # 5. Análise de Atendimentos por Fitness
+    write_output("\n5. ANÁLISE DE ATENDIMENTOS POR FITNESS")
+    write_output("-" * 40)
+
+    write_output("Estatísticas Gerais de Atendimento:")
+    write_output(f"  - Atendimento Total:    {metrics['atendimento_total']:3d} ordens ({metrics['taxa_atendimento_total']:5.1f}%)")
+    write_output(f"  - Atendimento Parcial:  {metrics['atendimento_parcial']:3d} ordens ({metrics['taxa_atendimento_parcial']:5.1f}%)")
+    write_output(f"  - Atendimento Inadequado: {metrics['atendimento_inadequado']:3d} ordens ({metrics['taxa_atendimento_inadequado']:5.1f}%)")
+
+    # Análise detalhada por tipo de atendimento
+    write_output("\nDetalhamento dos Atendimentos:")
+
+    atendimentos = sections['atendimentos']
+    if atendimentos['total']:
+        write_output("\nOrdens com Atendimento Total:")
+        for ordem_id, servicos, operador, _, inicio_esperado, dia in atendimentos['total']:
+            write_output(f"  ✓ Ordem {ordem_id}: "
+                         f"Skills={servicos}, "
+                         f"Operador={operador}, "
+                         f"Inicio Esperado={inicio_esperado}, "
+                         f"Dia Alocado={dia}")
+
+    if atendimentos['parcial']:
+        write_output("\nOrdens com Atendimento Parcial:")
+        for ordem_id, servicos, operador, habilidades, inicio_esperado, dia in atendimentos['parcial']:
+            write_output(f"  ⚠ Ordem {ordem_id}: "
+                         f"Skills={servicos}, "
+                         f"Operador={operador} ({habilidades}), "
+                         f"Inicio Esperado={inicio_esperado}, "
+                         f"Dia Alocado={dia}")
+
+    if atendimentos['inadequado']:
+        write_output("\nOrdens com Atendimento Inadequado:")
+        for ordem_id, servicos, operador, habilidades, inicio_esperado, dia in atendimentos['inadequado']:
+            write_output(f"  ✗ Ordem {ordem_id}: "
+                         f"Skills={servicos}, "
+                         f"Operador={operador} ({habilidades}), "
+                         f"Inicio Esperado={inicio_esperado}, "
+                         f"Dia Alocado={dia}")
+
+    # 6. Análise por Dia
+    write_output("\n6. DISTRIBUIÇÃO POR DIA")
+    write_output("-" * 40)
+    for dia, n_ordens, horas, prioridades in sections['by_day']:
+        write_output(f"\nDia {dia}:")
+        write_output(f"  - Total de Ordens: {n_ordens}")
+        write_output(
+            f"  - Horas Alocadas: {horas:.1f}h")
+        write_output(f"  - Distribuição de Prioridades:")
+        for prioridade, count in prioridades:
+            if count > 0:
+                write_output(f"    * {prioridade:8s}: {count:3d}")
+
+    # 7. Ordens Não Alocadas
+    unassigned_by_priority = sections['unassigned_by_priority']
+    if metrics['ordens_nao_alocadas']:
+        write_output("\n7. ORDENS NÃO ALOCADAS")
+        write_output("-" * 40)
+        write_output(f"Total de ordens não alocadas: {metrics['ordens_nao_alocadas']}")
+
+        for priority in REPORT_PRIORITIES:
+            if priority in unassigned_by_priority:
+                orders_list = unassigned_by_priority[priority]
+                write_output(
+                    f"\nPrioridade {priority}: {len(orders_list)} ordens")
+                for order_id in orders_list:
+                    order = orders[order_id]
+                    write_output(f"  - {order_id}: "
+                                 f"Skills={', '.join(order['required_skills'])}, "
+                                 f"Horas={order['estimated_hours']}, "
+                                 f"Prazo={order['expected_start_day']}")
+
+    write_output("\n" + "=" * 80)
+    write_output("FIM DO RELATÓRIO".center(80))
+    write_output("=" * 80)
+
+    return buffer.getvalue()
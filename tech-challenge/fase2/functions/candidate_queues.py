@@ -0,0 +1,102 @@
+from .capacity_ledger import CapacityLedger
+from .eligibility import EligibilityIndex
+from .instance_table import order_values, operator_values
+
+class CandidateQueues:
+    """
+    Filas de operadores candidatos por conjunto de habilidades e dia, com as horas controladas por um `CapacityLedger`.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        days (int): Número de dias do planejamento.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
+
+    Detalhes:
+    - Ordens com as mesmas habilidades exigidas compartilham a fila de operadores elegíveis de cada dia,
+      na ordem de `index.eligible_operators`.
+    - As horas usadas por operador e dia ficam no registro incremental, então verificar se uma ordem cabe é O(1),
+      em vez de somar as horas de todas as ordens já alocadas.
+    - Operadores sem horas livres nem para a menor ordem da instância saem das filas do dia, encurtando as buscas
+      quando a capacidade se esgota.
+    """
+
+    def __init__(self, operators, orders, days, index=None):
+        self.index = index if index is not None else EligibilityIndex(operators, orders)
+        self.days = days
+        self.ledger = CapacityLedger(operator_values(operators, "hours_per_day"), days)
+        estimated_hours = order_values(orders, "estimated_hours")
+        self.min_hours = int(estimated_hours.min()) if len(estimated_hours) else 0
+
+        # Filas criadas sob demanda: queues[dia][conjunto de habilidades] = posições dos operadores.
+        self.queues = [dict() for _ in range(days + 1)]
+
+    def queue(self, skill_set, day):
+        queues = self.queues[day]
+        if skill_set not in queues:
+            queues[skill_set] = [operator for operator in self.index.set_eligible[:, skill_set].nonzero()[0].tolist()
+                                 if self.ledger.available(operator, day) >= self.min_hours]
+        return queues[skill_set]
+
+    def first_fit(self, order_id, hours):
+        """
+        Procura o primeiro dia e, nele, o primeiro operador elegível com horas livres para a ordem.
+
+        Args:
+            order_id (str): Identificador da ordem.
+            hours (int): Horas estimadas da ordem.
+
+        Returns:
+            tuple: (posição do operador, dia), ou None se nenhum operador elegível tiver horas livres.
+        """
+        skill_set = self.index.order_skill_set[self.index.order_position[order_id]]
+        for day in range(1, self.days + 1):
+            for operator in self.queue(skill_set, day):
+                if self.ledger.fits(operator, day, hours):
+                    return operator, day
+        return None
+
+    def assign(self, operator, day, hours):
+        """
+        Registra as horas da ordem alocada e retira o operador das filas do dia se ele não comportar mais nenhuma ordem.
+        """
+        self.ledger.add(operator, day, hours)
+        if self.ledger.available(operator, day) < self.min_hours:
+            for queue in self.queues[day].values():
+                if operator in queue:
+                    queue.remove(operator)
+
+def first_fit_allocation(operators, orders, order_ids, days, index=None):
+    """
+    Aloca as ordens, na sequência informada, ao primeiro dia e operador elegível com horas livres.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        order_ids (iterable): Identificadores das ordens, na ordem em que devem ser alocadas.
+        days (int): Número de dias do planejamento.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
+
+    Returns:
+        dict: Solução no formato {"orders": {order_id: {"day", "operator", "status"}}, "fitness": 0}.
+              Ordens sem operador disponível ficam fora da solução.
+    """
+    candidates = CandidateQueues(operators, orders, days, index)
+    operator_ids = candidates.index.operator_ids
+
+    solution = {
+        "orders": {},
+        "fitness": 0
+    }
+
+    estimated_hours = dict(zip(orders, order_values(orders, "estimated_hours").tolist()))
+    for order_id in order_ids:
+        hours = estimated_hours[order_id]
+        allocation = candidates.first_fit(order_id, hours)
+        if allocation is None:
+            continue
+        operator, day = allocation
+        candidates.assign(operator, day, hours)
+        solution["orders"][order_id] = {"day": day, "operator": operator_ids[operator], "status": "atendida"}
+
+    return solution
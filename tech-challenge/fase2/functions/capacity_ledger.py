@@ -0,0 +1,106 @@
+import numpy as np
+
+class CapacityLedger:
+    """
+    Registro incremental das horas alocadas por operador e dia.
+
+    Args:
+        hours_per_day (list ou np.ndarray): Capacidade diária de cada operador, na ordem dos índices dos operadores.
+        max_days (int): Número de dias do planejamento.
+
+    Detalhes:
+    - Operadores são identificados pela posição (índice) e os dias vão de 1 a max_days.
+    - Adicionar, remover ou mover uma ordem atualiza apenas a célula (operador, dia) envolvida, em O(1),
+      evitando recalcular as horas de cada operador percorrendo todas as ordens.
+    - As células são listas do Python, mais rápidas que o NumPy para leituras e escritas individuais.
+    """
+    __slots__ = ("capacity", "hours", "max_days")
+
+    def __init__(self, hours_per_day, max_days):
+        self.capacity = [int(hours) for hours in hours_per_day]
+        self.max_days = max_days
+        self.hours = [[0] * (max_days + 1) for _ in self.capacity]
+
+    @classmethod
+    def from_assignment(cls, hours_per_day, max_days, operator, day, estimated_hours):
+        """
+        Cria o registro a partir de uma alocação completa (vetores de operador, dia e horas por ordem).
+
+        Args:
+            hours_per_day (np.ndarray): Capacidade diária de cada operador.
+            max_days (int): Número de dias do planejamento.
+            operator (np.ndarray): Índice do operador de cada ordem (negativo se não atribuída).
+            day (np.ndarray): Dia alocado de cada ordem.
+            estimated_hours (np.ndarray): Horas estimadas de cada ordem.
+
+        Returns:
+            CapacityLedger: Registro com as horas acumuladas.
+        """
+        ledger = cls(hours_per_day, max_days)
+        operator = np.asarray(operator, dtype=np.int64)
+        assigned = operator >= 0
+        slots = operator[assigned] * (max_days + 1) + np.asarray(day, dtype=np.int64)[assigned]
+        totals = np.bincount(slots, weights=np.asarray(estimated_hours)[assigned],
+                             minlength=len(ledger.capacity) * (max_days + 1))
+        ledger.hours = totals.astype(np.int64).reshape(len(ledger.capacity), max_days + 1).tolist()
+        return ledger
+
+    def used(self, operator, day):
+        return self.hours[operator][day]
+
+    def available(self, operator, day):
+        return self.capacity[operator] - self.hours[operator][day]
+
+    def fits(self, operator, day, hours):
+        """
+        Indica se o operador ainda comporta `hours` horas no dia sem hora extra.
+        """
+        return self.hours[operator][day] + hours <= self.capacity[operator]
+
+    def add(self, operator, day, hours):
+        self.hours[operator][day] += hours
+
+    def remove(self, operator, day, hours):
+        self.hours[operator][day] -= hours
+
+    def move(self, from_operator, from_day, to_operator, to_day, hours):
+        """
+        Move as horas de uma ordem entre células. Operador negativo indica ordem não atribuída.
+        """
+        if from_operator >= 0:
+            self.hours[from_operator][from_day] -= hours
+        if to_operator >= 0:
+            self.hours[to_operator][to_day] += hours
+
+    def excess(self, operator, day):
+        return max(0, self.hours[operator][day] - self.capacity[operator])
+
+    def total_excess(self):
+        return sum(max(0, hours - capacity)
+                   for capacity, daily in zip(self.capacity, self.hours) for hours in daily[1:])
+
+    def move_excess_delta(self, from_operator, from_day, to_operator, to_day, hours):
+        """
+        Calcula, em O(1), a variação do total de horas excedentes se a ordem for movida.
+
+        Args:
+            from_operator (int): Operador atual (negativo se a ordem não está atribuída).
+            from_day (int): Dia atual.
+            to_operator (int): Novo operador.
+            to_day (int): Novo dia.
+            hours (int): Horas estimadas da ordem.
+
+        Returns:
+            int: Variação das horas excedentes (positiva = mais hora extra).
+        """
+        if from_operator == to_operator and from_day == to_day:
+            return 0
+
+        delta = 0
+        if from_operator >= 0:
+            used, capacity = self.hours[from_operator][from_day], self.capacity[from_operator]
+            delta += max(0, used - hours - capacity) - max(0, used - capacity)
+        if to_operator >= 0:
+            used, capacity = self.hours[to_operator][to_day], self.capacity[to_operator]
+            delta += max(0, used + hours - capacity) - max(0, used - capacity)
+        return delta
@@ -0,0 +1,236 @@
+import glob
+import json
+import os
+import random
+import zlib
+import numpy as np
+from .chromosome import Chromosome, rng, OPERATOR_DTYPE, DAY_DTYPE
+from .common_functions import op_orders_to_dataframe
+from .instance_loader import load_operators, load_orders
+
+# Versão do formato dos arquivos de checkpoint.
+CHECKPOINT_VERSION = 1
+
+# Arquivos do diretório de checkpoint.
+STATE_FILE = "state.json"
+OPERATORS_FILE = "operators.parquet"
+ORDERS_FILE = "orders.parquet"
+BEST_OPERATOR_FILE = "best_operator.bin"
+BEST_DAY_FILE = "best_day.bin"
+
+def _instance_checksum(layout):
+    """
+    Soma de verificação da instância (ordens, operadores e dados usados pelo fitness), para não retomar
+    um checkpoint com outra instância.
+    """
+    checksum = zlib.crc32("\n".join(map(str, layout.order_ids)).encode())
+    checksum = zlib.crc32("\n".join(map(str, layout.operator_ids)).encode(), checksum)
+    for values in (layout.estimated_hours, layout.priority, layout.expected_start_day, layout.hours_per_day,
+                   layout.eligibility.set_match):
+        checksum = zlib.crc32(np.ascontiguousarray(values).tobytes(), checksum)
+    return checksum
+
+def _as_chromosome(individual, layout):
+    if isinstance(individual, Chromosome):
+        return individual
+    return Chromosome.from_solution(individual, layout)
+
+def _write_rows(path, rows, start):
+    """
+    Grava `rows` a partir da linha `start` de um arquivo binário de linhas de tamanho fixo, descartando o resto.
+    """
+    mode = "r+b" if os.path.exists(path) else "wb"
+    with open(path, mode) as file:
+        file.seek(start * rows.shape[1] * rows.itemsize)
+        file.write(rows.tobytes())
+        file.truncate()
+        file.flush()
+        os.fsync(file.fileno())
+
+def _read_rows(path, dtype, rows, columns):
+    if rows == 0:
+        return np.zeros((0, columns), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(rows, columns))
+
+class Checkpointer:
+    """
+    Checkpoints periódicos do estado completo do motor do algoritmo genético, em um diretório.
+
+    Args:
+        directory (str): Diretório dos checkpoints (criado se não existir).
+        interval (int): Intervalo de gerações entre checkpoints (além do checkpoint da última geração).
+
+    Detalhes:
+    - Usado como callback do motor (`engine.add_callback(checkpointer)`), grava o checkpoint a cada
+      `interval` gerações. `save` pode ser chamado a qualquer momento (ex.: ao interromper a execução).
+    - A população é gravada em arquivos .npy (operador e dia de cada gene) escritos por memória mapeada;
+      ao retomar, os cromossomos usam os vetores mapeados direto do disco e só os copiam quando alterados.
+    - As melhores soluções de cada geração (`best_schedules`) ficam em arquivos binários que só crescem:
+      cada checkpoint acrescenta apenas as gerações novas.
+    - O estado restante (geração, histórico do fitness, taxa de mutação, estados dos geradores aleatórios
+      `random` e `chromosome.rng`) fica em `state.json`, gravado por último e substituído de forma atômica;
+      um checkpoint interrompido no meio deixa válido o checkpoint anterior.
+    - A instância (operadores e ordens) é gravada em Parquet no primeiro checkpoint, para retomar a execução
+      sem depender de gerar ou carregar a mesma instância (ver `load_checkpoint_instance`).
+    - O cache de fitness não é gravado: os genomas são reavaliados quando necessário, sem mudar o resultado.
+      Com gerações paralelas (`workers` > 1) os geradores aleatórios dos processos não são restaurados.
+    """
+
+    def __init__(self, directory, interval=10):
+        self.directory = directory
+        self.interval = interval
+        self.saved_rows = 0    # Melhores soluções já gravadas nos arquivos binários.
+        self.saved_generation = None
+
+    def __call__(self, engine):
+        if (self.interval and engine.generation % self.interval == 0) or engine.finished:
+            self.save(engine)
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def read_state(self):
+        """
+        Retorna o estado do último checkpoint do diretório (None se não houver).
+        """
+        try:
+            with open(self._path(STATE_FILE), encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, engine):
+        """
+        Grava o checkpoint da geração atual do motor.
+
+        Returns:
+            str: Caminho do arquivo de estado do checkpoint.
+        """
+        if engine.generation == self.saved_generation:
+            return self._path(STATE_FILE)  # Geração já gravada (ou acabada de restaurar).
+        os.makedirs(self.directory, exist_ok=True)
+        layout = engine.layout
+        if self.saved_rows == 0:
+            # Nova execução no diretório: o checkpoint anterior deixa de valer antes de ser sobrescrito.
+            if os.path.exists(self._path(STATE_FILE)):
+                os.remove(self._path(STATE_FILE))
+            operators_df, orders_df = op_orders_to_dataframe(engine.operators, engine.orders)
+            operators_df.to_parquet(self._path(OPERATORS_FILE), index=False)
+            orders_df.to_parquet(self._path(ORDERS_FILE), index=False)
+
+        # População em arquivos .npy por memória mapeada (um arquivo por geração, o anterior é removido no fim).
+        population = [_as_chromosome(individual, layout) for individual in engine.population]
+        shape = (len(population), layout.n_orders)
+        population_files = {}
+        for field, dtype in (("operator", OPERATOR_DTYPE), ("day", DAY_DTYPE)):
+            name = f"population-{engine.generation}-{field}.npy"
+            genes = np.lib.format.open_memmap(self._path(name), mode="w+", dtype=dtype, shape=shape)
+            for row, chromosome in enumerate(population):
+                genes[row] = getattr(chromosome, field)
+            genes.flush()
+            del genes
+            population_files[field] = name
+
+        # Melhores soluções: apenas as gerações ainda não gravadas.
+        new_schedules = [_as_chromosome(schedule, layout) for schedule in engine.best_schedules[self.saved_rows:]]
+        for path, field, dtype in ((BEST_OPERATOR_FILE, "operator", OPERATOR_DTYPE), (BEST_DAY_FILE, "day", DAY_DTYPE)):
+            rows = np.array([getattr(schedule, field) for schedule in new_schedules], dtype=dtype).reshape(-1, layout.n_orders)
+            _write_rows(self._path(path), rows, self.saved_rows)
+
+        python_state = random.getstate()
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "instance": _instance_checksum(layout),
+            "n_orders": layout.n_orders,
+            "n_operators": layout.n_operators,
+            "days": engine.days,
+            "compact_genome": engine.genome_layout is not None,
+            "generation": engine.generation,
+            "generations": engine.generations,
+            "mutation_rate": engine.mutation_rate,
+            "mutation_stats": engine.mutation_stats,
+            "best_fitness_values": [float(value) for value in engine.best_fitness_values],
+            "best_rows": len(engine.best_schedules),
+            "best_schedule_fitness": [float(schedule["fitness"]) for schedule in engine.best_schedules],
+            "population_files": population_files,
+            "population_fitness": [float(chromosome.fitness) for chromosome in population],
+            "python_random": [python_state[0], list(python_state[1]), python_state[2]],
+            "numpy_random": rng.bit_generator.state,
+        }
+        temporary = self._path(STATE_FILE + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._path(STATE_FILE))
+        self.saved_rows = len(engine.best_schedules)
+        self.saved_generation = engine.generation
+
+        # Remove as populações de checkpoints anteriores.
+        for path in glob.glob(self._path("population-*.npy")):
+            if os.path.basename(path) not in population_files.values():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass    # Ainda mapeado (ex.: no Windows); removido no próximo checkpoint.
+        return self._path(STATE_FILE)
+
+    def restore(self, engine):
+        """
+        Restaura no motor o estado do último checkpoint do diretório.
+
+        Args:
+            engine (GeneticEngine): Motor criado com a mesma instância e os mesmos parâmetros do checkpoint.
+
+        Returns:
+            bool: Se havia um checkpoint para restaurar.
+        """
+        state = self.read_state()
+        if state is None:
+            return False
+        layout = engine.layout
+        if state["version"] != CHECKPOINT_VERSION:
+            raise ValueError(f"Versão de checkpoint não suportada: {state['version']}.")
+        if state["instance"] != _instance_checksum(layout) or state["days"] != engine.days:
+            raise ValueError("O checkpoint foi gravado com outra instância (operadores, ordens ou dias).")
+
+        def individual(operator, day, fitness):
+            chromosome = Chromosome(layout, np.asarray(operator), np.asarray(day), fitness)
+            return chromosome if engine.genome_layout is not None else chromosome.to_solution()
+
+        # População e melhores soluções usam os vetores mapeados do disco (somente leitura até serem alterados).
+        operator = np.load(self._path(state["population_files"]["operator"]), mmap_mode="r")
+        day = np.load(self._path(state["population_files"]["day"]), mmap_mode="r")
+        engine.population = [individual(operator[row], day[row], fitness)
+                             for row, fitness in enumerate(state["population_fitness"])]
+
+        rows = state["best_rows"]
+        best_operator = _read_rows(self._path(BEST_OPERATOR_FILE), OPERATOR_DTYPE, rows, layout.n_orders)
+        best_day = _read_rows(self._path(BEST_DAY_FILE), DAY_DTYPE, rows, layout.n_orders)
+        engine.best_schedules = [individual(best_operator[row], best_day[row], fitness)
+                                 for row, fitness in enumerate(state["best_schedule_fitness"])]
+        engine.best_fitness_values = list(state["best_fitness_values"])
+        # Melhor solução: primeira geração com o maior fitness (mesma regra de `GeneticEngine.step`).
+        engine.best_solution = (engine.best_schedules[int(np.argmax(state["best_schedule_fitness"]))]
+                                if rows else None)
+
+        engine.generation = state["generation"]
+        engine.generations = state["generations"]
+        engine.mutation_rate = state["mutation_rate"]
+        engine.mutation_stats = dict(state["mutation_stats"])
+        python_state = state["python_random"]
+        random.setstate((python_state[0], tuple(python_state[1]), python_state[2]))
+        rng.bit_generator.state = state["numpy_random"]
+        self.saved_rows = rows
+        self.saved_generation = engine.generation
+        return True
+
+def load_checkpoint_instance(directory):
+    """
+    Carrega os operadores e as ordens gravados no diretório de checkpoint.
+
+    Returns:
+        tuple: (operadores, ordens) em tabelas colunares.
+    """
+    return (load_operators(os.path.join(directory, OPERATORS_FILE)),
+            load_orders(os.path.join(directory, ORDERS_FILE)))
@@ -0,0 +1,269 @@
+import numpy as np
+from .eligibility import EligibilityIndex
+from .instance_table import order_values, operator_values
+
+# Valor usado nos genes de ordens sem operador atribuído.
+UNASSIGNED = -1
+
+# Status das ordens, na ordem dos códigos retornados por `Chromosome.status_codes`.
+STATUS_CODES = ("não atendida", "atendida", "atrasada")
+
+# Tipos compactos dos genes: índice do operador e dia alocado.
+OPERATOR_DTYPE = np.int16
+DAY_DTYPE = np.int16
+
+# Gerador aleatório usado pelas operações vetorizadas dos cromossomos.
+rng = np.random.default_rng()
+
+def set_seed(seed):
+    """
+    Reinicia o gerador aleatório das operações vetorizadas com uma semente fixa.
+
+    Args:
+        seed (int): Semente do gerador.
+    """
+    # Altera o estado no próprio objeto, para valer também nos módulos que importaram `rng`.
+    rng.bit_generator.state = np.random.PCG64(seed).state
+
+class GenomeLayout:
+    """
+    Índice de uma instância (operadores + ordens) compartilhado por todos os cromossomos.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        max_days (int): Número de dias do planejamento.
+        eligibility (EligibilityIndex, opcional): Índice de elegibilidade já construído para a instância.
+
+    Detalhes:
+    - Fixa a ordem das ordens (posição do gene) e dos operadores (valor do gene).
+    - Guarda em vetores os dados das ordens e operadores usados pelo fitness, evitando acessos a dicionários.
+    - A compatibilidade operador x ordem e os operadores candidatos vêm do índice de elegibilidade. Ordens sem
+      nenhum operador elegível aceitam qualquer operador, e o fitness penaliza a incompatibilidade.
+    """
+    __slots__ = ("operators", "orders", "max_days", "eligibility", "order_ids", "operator_ids",
+                 "order_position", "operator_position", "estimated_hours", "priority",
+                 "expected_start_day", "hours_per_day", "exact_scores")
+
+    def __init__(self, operators, orders, max_days, eligibility=None):
+        self.operators = operators
+        self.orders = orders
+        self.max_days = max_days
+        self.eligibility = eligibility if eligibility is not None else EligibilityIndex(operators, orders)
+
+        self.order_ids = self.eligibility.order_ids
+        self.operator_ids = self.eligibility.operator_ids
+        self.order_position = self.eligibility.order_position
+        self.operator_position = self.eligibility.operator_position
+
+        # Vetores com os dados das ordens e dos operadores.
+        self.estimated_hours = order_values(orders, "estimated_hours")
+        self.priority = order_values(orders, "priority_number")
+        self.expected_start_day = order_values(orders, "expected_start_day")
+        self.hours_per_day = operator_values(operators, "hours_per_day")
+
+        # Se todas as pontuações de compatibilidade são múltiplos de 0.5, somas em qualquer ordem são exatas.
+        scores = 20 * self.eligibility.set_match
+        self.exact_scores = bool(np.all(scores == np.round(scores)))
+
+    @property
+    def n_orders(self):
+        return len(self.order_ids)
+
+    @property
+    def n_operators(self):
+        return len(self.operator_ids)
+
+    def match_percentage(self, operator, positions):
+        """
+        Porcentagem de habilidades atendidas para índices de operadores e posições de ordens (vetorizado).
+        """
+        return self.eligibility.match_matrix(operator, positions)
+
+    def gene_scores(self, operator, day, positions):
+        """
+        Parcela de cada gene no fitness: compatibilidade de habilidades menos a penalidade de atraso,
+        ambas ponderadas pela prioridade (zero para genes não atribuídos).
+
+        Args:
+            operator (np.ndarray): Índices dos operadores.
+            day (np.ndarray): Dias alocados.
+            positions (np.ndarray): Posições das ordens.
+
+        Returns:
+            np.ndarray: Parcela de cada gene.
+        """
+        operator = np.asarray(operator, dtype=np.int64)
+        assigned = operator != UNASSIGNED
+        priority = self.priority[positions]
+        match = self.match_percentage(np.where(assigned, operator, 0), positions)
+        skill_score = np.where(match >= 0.5, 10 * match, -10.0) * priority
+        late_penalty = 5 * np.maximum(0, np.asarray(day, dtype=np.int64) - self.expected_start_day[positions]) * priority
+        return np.where(assigned, skill_score - late_penalty, 0.0)
+
+    def is_allowed(self, operator, positions):
+        """
+        Indica se o operador pode ser alocado às ordens das posições informadas.
+
+        Args:
+            operator (int ou np.ndarray): Índice(s) do operador.
+            positions (int ou np.ndarray): Posição(ões) das ordens.
+
+        Returns:
+            bool ou np.ndarray: True se o operador é elegível ou se a ordem não tem nenhum operador elegível.
+        """
+        return self.eligibility.candidate_matrix(operator, positions)
+
+    def random_eligible_operators(self, positions):
+        """
+        Sorteia, para cada posição informada, um operador candidato para a ordem correspondente.
+
+        Args:
+            positions (np.ndarray): Posições (genes) das ordens.
+
+        Returns:
+            np.ndarray: Índices dos operadores sorteados.
+        """
+        eligibility = self.eligibility
+        skill_set = eligibility.order_skill_set[positions]
+        picks = (rng.random(len(positions)) * eligibility.candidate_count[skill_set]).astype(np.int64)
+        return eligibility.candidate_operators_flat[eligibility.candidate_offsets[skill_set] + picks].astype(OPERATOR_DTYPE)
+
+    def random_days(self, size):
+        """
+        Sorteia dias entre 1 e max_days.
+
+        Args:
+            size (int): Quantidade de dias a sortear.
+
+        Returns:
+            np.ndarray: Dias sorteados.
+        """
+        return rng.integers(1, self.max_days + 1, size=size, dtype=DAY_DTYPE)
+
+class Chromosome:
+    """
+    Representação compacta de uma solução do algoritmo genético.
+
+    Args:
+        layout (GenomeLayout): Índice da instância compartilhado entre os cromossomos.
+        operator (np.ndarray, opcional): Índice do operador de cada ordem (UNASSIGNED se não atribuída).
+        day (np.ndarray, opcional): Dia alocado de cada ordem (0 se não atribuída).
+        fitness (float): Aptidão da solução.
+
+    Detalhes:
+    - Cada gene é a posição da ordem em `layout.order_ids`; o valor é o par (operador, dia).
+    - O status da ordem não é armazenado: é derivado do dia alocado e do início esperado,
+      como em `create_initial_solution` e `mutate`.
+    - Aceita `cromossomo["orders"]` e `cromossomo["fitness"]` para continuar compatível com o formato em dicionário.
+    - Cópias compartilham os vetores (copy-on-write): os vetores compartilhados ficam somente leitura e só são
+      duplicados na primeira alteração feita por `set_gene`.
+    """
+    __slots__ = ("layout", "operator", "day", "fitness")
+
+    def __init__(self, layout, operator=None, day=None, fitness=0):
+        self.layout = layout
+        self.operator = np.full(layout.n_orders, UNASSIGNED, dtype=OPERATOR_DTYPE) if operator is None else operator
+        self.day = np.zeros(layout.n_orders, dtype=DAY_DTYPE) if day is None else day
+        self.fitness = fitness
+
+    def copy(self):
+        """
+        Cria uma cópia que compartilha os vetores com o original até que um dos dois seja alterado.
+        """
+        self.operator.flags.writeable = False
+        self.day.flags.writeable = False
+        return Chromosome(self.layout, self.operator, self.day, self.fitness)
+
+    def set_gene(self, position, operator, day):
+        """
+        Altera o operador e o dia de uma ordem, duplicando antes os vetores se eles forem compartilhados.
+        """
+        if not self.operator.flags.writeable:
+            self.operator = self.operator.copy()
+            self.day = self.day.copy()
+        self.operator[position] = operator
+        self.day[position] = day
+
+    def status(self, position):
+        """
+        Retorna o status da ordem na posição informada ("não atendida", "atendida" ou "atrasada").
+        """
+        if self.operator[position] == UNASSIGNED:
+            return "não atendida"
+        return "atrasada" if self.day[position] > self.layout.expected_start_day[position] else "atendida"
+
+    def status_codes(self):
+        """
+        Retorna o status de todas as ordens como códigos (posição em `STATUS_CODES`), de forma vetorizada.
+        """
+        late = self.day > self.layout.expected_start_day
+        return np.where(self.operator == UNASSIGNED, 0, np.where(late, 2, 1)).astype(np.int8)
+
+    @classmethod
+    def from_solution(cls, solution, layout):
+        """
+        Converte uma solução no formato em dicionário para um cromossomo.
+
+        Args:
+            solution (dict): Solução no formato {"orders": {order_id: {"day", "operator", "status"}}, "fitness"}.
+            layout (GenomeLayout): Índice da instância.
+
+        Returns:
+            Chromosome: Cromossomo equivalente à solução.
+        """
+        chromosome = cls(layout, fitness=solution.get("fitness", 0))
+        for order_id, allocation in solution["orders"].items():
+            if allocation["operator"] is None:
+                continue
+            position = layout.order_position[order_id]
+            chromosome.operator[position] = layout.operator_position[allocation["operator"]]
+            chromosome.day[position] = allocation["day"]
+        return chromosome
+
+    def to_solution(self):
+        """
+        Converte o cromossomo para o formato em dicionário usado por `solution_to_dataframe` e pelos relatórios.
+
+        Returns:
+            dict: Solução no formato {"orders": {order_id: {"day", "operator", "status"}}, "fitness"}.
+        """
+        return {"orders": self.orders_dict(), "fitness": self.fitness}
+
+    def orders_dict(self):
+        operator_ids = self.layout.operator_ids
+        orders = {}
+        for position, order_id in enumerate(self.layout.order_ids):
+            operator = int(self.operator[position])
+            if operator == UNASSIGNED:
+                orders[order_id] = {"day": None, "operator": None, "status": "não atendida"}
+            else:
+                orders[order_id] = {"day": int(self.day[position]), "operator": operator_ids[operator],
+                                    "status": self.status(position)}
+        return orders
+
+    def __getitem__(self, key):
+        if key == "fitness":
+            return self.fitness
+        if key == "orders":
+            return self.orders_dict()
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key != "fitness":
+            raise KeyError(key)
+        self.fitness = value
+
+    def evaluate(self):
+        """
+        Calcula a aptidão do cromossomo com os mesmos critérios de `calculate_fitness`.
+
+        Returns:
+            float: A pontuação de aptidão da solução.
+
+        Detalhes:
+        - Usa a avaliação vetorizada de `population_fitness.evaluate_population` com uma população de um indivíduo.
+        """
+        from .population_fitness import evaluate_population
+        evaluate_population([self], self.layout)
+        return self.fitness
@@ -1,6 +1,10 @@
 import os
 import random
+import threading
+import numpy as np
 import pandas as pd
+from .allocation_report import compute_allocation_report, render_allocation_report
+from .instance_table import OrderTable, OperatorTable
 
 # Função para criar os dados de exemplo
 def create_initial_data(n_orders=None, n_operators=None):
@@ -110,17 +114,18 @@ def meets_minimum_skills(operator_skills, required_skills):
     return meets_minimum, match_percentage
 
 # Função para calcular a aptidão de uma solução 
-def calculate_fitness(solution, operators, orders, max_days):
+def calculate_fitness(solution, operators, orders, max_days, index=None):
     """
     Calcula a pontuação de aptidão de uma solução. A função avalia como uma solução de alocação de ordens a operadores
     é eficaz, levando em consideração a compatibilidade das habilidades, o cumprimento de prazo e o excesso de horas
     trabalhadas por cada operador.
 
     Args:
-        solution (dict): Solução atual contendo as alocações de ordens por operador e dia.
+        solution (dict ou Chromosome): Solução atual contendo as alocações de ordens por operador e dia.
                           Estrutura esperada: {day: {operator_id: [order_ids]}}.
         operators (dict): Dicionário com os dados dos operadores, incluindo suas habilidades e carga horária diária.
         orders (dict): Dicionário com as ordens de serviço, incluindo as habilidades necessárias e o tempo estimado para execução.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância, consultado no lugar de `meets_minimum_skills`.
 
     Returns:
         int: A pontuação de aptidão da solução, onde valores mais altos indicam uma solução mais "apt" (ou mais eficiente).
@@ -138,6 +143,10 @@ def calculate_fitness(solution, operators, orders, max_days):
     
     A pontuação de aptidão final é a soma das pontuações de compatibilidade, penalidades de atraso e excesso de horas.
     """
+    # Cromossomos compactos (ver chromosome.py) calculam a aptidão de forma vetorizada.
+    if not isinstance(solution, dict):
+        return solution.evaluate()
+
     fitness = 0  # Inicia a pontuação de aptidão com zero.
 
     # Dicionário para rastrear as horas trabalhadas por operador por dia.
@@ -150,6 +159,10 @@ def calculate_fitness(solution, operators, orders, max_days):
         day = allocation["day"]
         status = allocation["status"]
 
+        # Ordens sem operador atribuído não pontuam.
+        if operator_id is None:
+            continue
+
         # Obtém os dados da ordem e do operador.
         order = orders[order_id]
         operator = operators[operator_id]
@@ -159,7 +172,10 @@ def calculate_fitness(solution, operators, orders, max_days):
 
         # Avaliação de compatibilidade de habilidades.
         skill_match_score = 0
-        meets_mininum, match_percentage = meets_minimum_skills(operator["skills"], order["required_skills"])
+        if index is not None:
+            meets_mininum, match_percentage = index.meets_minimum(operator_id, order_id)
+        else:
+            meets_mininum, match_percentage = meets_minimum_skills(operator["skills"], order["required_skills"])
         
         # Multiplica o skill_match_score de acordo com a porcentagem de skills possuidas pelo operador.
         if meets_mininum:
@@ -189,6 +205,14 @@ def calculate_fitness(solution, operators, orders, max_days):
     return fitness  # Retorna a pontuação de aptidão final da solução.
 
 # Função para tranformar a solução encontrada em Dataframe
+# Níveis de operador compatíveis com cada prioridade de ordem.
+PRIORITY_LEVEL_MAP = {
+    "alta": ["especialista", "sênior"],
+    "urgente": ["especialista", "sênior"],
+    "média": ["especialista", "sênior", "pleno"],
+    "baixa": ["especialista", "sênior", "pleno", "júnior"]
+}
+
 def solution_to_dataframe(solution, operators, orders):
     """
     Converte a solução final de alocação de ordens a operadores em um DataFrame.
@@ -205,85 +229,129 @@ def solution_to_dataframe(solution, operators, orders):
     Detalhes:
     - O DataFrame contém as colunas: dia, id do operador, id da ordem, habilidades da ordem, horas estimadas,
       prioridade e inicio_esperado, além das novas colunas de compatibilidade e habilidades não atendidas.
+    - As colunas são montadas diretamente a partir de vetores (os dados dos operadores são lidos por posição),
+      e a compatibilidade de habilidades é calculada uma vez por par (operador, conjunto de habilidades).
+    - Habilidades, prioridade, nível e status usam o tipo categórico do pandas.
+    - As horas acumuladas do operador no dia (hora extra) vêm de uma soma acumulada agrupada por dia e operador,
+      na ordem da solução.
+    - Ordens sem operador na solução não entram no DataFrame e são contadas como não alocadas.
     """
-    data = []
-    operator_daily_hours = {}
-
-    for order_id, allocation in solution["orders"].items():
-        day = allocation["day"]
-        operator_id = allocation["operator"]
-        current_status = allocation["status"]
-
-        # Verifica se a ordem foi atribuída a algum operador.
-        if not operator_id:
-            operator_id = "N/A"
-        else:
-            operator = operators[operator_id]
+    allocations = [(order_id, allocation) for order_id, allocation in solution["orders"].items()
+                   if allocation["operator"]]
+    order_ids = [order_id for order_id, _ in allocations]
+    operator_ids = [allocation["operator"] for _, allocation in allocations]
+    day = np.array([allocation["day"] for _, allocation in allocations], dtype=np.int64)
+
+    # Dados das ordens de cada linha e posição de cada linha na tabela de operadores.
+    order_table = _orders_columns(orders, order_ids)
+    operator_table = _operators_columns(operators)
+    operator_position = pd.Index(list(operators)).get_indexer(operator_ids)
+
+    estimated_hours = order_table["estimated_hours"]
+    expected_start_day = order_table["expected_start_day"]
+    hours_per_day = operator_table["hours_per_day"][operator_position]
+
+    # Compatibilidade de habilidades e habilidades não atendidas por par (operador, conjunto de habilidades).
+    skill_sets = order_table["skill_sets"]
+    pair = operator_position * len(skill_sets) + order_table["skill_set_code"]
+    unique_pairs, pair_code = np.unique(pair, return_inverse=True)
+    pair_compatibility = np.empty(len(unique_pairs), dtype=np.float64)
+    pair_missing = []
+    for i, value in enumerate(unique_pairs.tolist()):
+        required_skills = skill_sets[value % len(skill_sets)]
+        operator_skills = set(operators[operator_table["ids"][value // len(skill_sets)]]["skills"])
+        matched = sum(skill in operator_skills for skill in required_skills)
+        pair_compatibility[i] = matched / len(required_skills) if required_skills else 1.0
+        pair_missing.append(" | ".join(skill for skill in required_skills if skill not in operator_skills))
+    missing_codes, missing_labels = pd.factorize(pd.Series(pair_missing, dtype=object))
+
+    # Verificar compatibilidade do nível com a prioridade.
+    priority = order_table["priority"]
+    level = operator_table["level"].take(operator_position)
+    level_ok = np.array([[level_name in PRIORITY_LEVEL_MAP.get(priority_name, [])
+                          for priority_name in priority.categories]
+                         for level_name in level.categories], dtype=bool).reshape(len(level.categories), -1)
+    compatibility_level = level_ok[level.codes, priority.codes] if len(day) else np.zeros(0, dtype=bool)
+
+    # Acumular horas do operador no dia, na ordem da solução.
+    total_hours = pd.Series(estimated_hours).groupby([day, operator_position], sort=False).cumsum().to_numpy()
+
+    df = pd.DataFrame({
+        "dia": day,  # Dias começam de 1.
+        "id_ordem": order_ids,
+        "id_operador": operator_ids,
+        "Serviços": order_table["skills"],  # Formatação das habilidades.
+        "habilidades_operador": operator_table["skills"].take(operator_position),
+        "nivel_operador": level,
+        "horas_estimadas": estimated_hours,
+        "horas_disponiveis": hours_per_day,
+        "prioridade": priority,
+        "inicio_esperado": expected_start_day,
+        "atraso": np.maximum(0, day - expected_start_day),
+        "compatibilidade_os_op": np.round(pair_compatibility[pair_code] * 100, 2),
+        "habilidades_nao_atendidas": pd.Categorical.from_codes(missing_codes[pair_code], missing_labels),
+        "compatibilidade_prioridade": np.where(compatibility_level, "OK", "NOK"),
+        "hora_extra": np.where(total_hours > hours_per_day, "Sim", "Não"),
+        "total_hora_extra": total_hours - hours_per_day,
+        "status": pd.Categorical([allocation["status"] for _, allocation in allocations]),
+    })
 
-        # Inicializa horas trabalhadas por operador no dia, se necessário.
-        if day not in operator_daily_hours:
-            operator_daily_hours[day] = {}
-        if operator_id not in operator_daily_hours[day]:
-            operator_daily_hours[day][operator_id] = 0
-
-        # Dados da ordem.
-        order = orders[order_id]
-        required_skills = set(order["required_skills"])
-        operator_skills = set(operator["skills"])
-
-        matched_skills = required_skills & operator_skills
-        missing_skills = required_skills - operator_skills
-
-        skill_compatibility = len(matched_skills) / len(required_skills) if required_skills else 1.0
-
-        # Verificar compatibilidade do nível com a prioridade.
-        priority_level_map = {
-            "alta": ["especialista", "sênior"],
-            "urgente": ["especialista", "sênior"],
-            "média": ["especialista", "sênior", "pleno"],
-            "baixa": ["especialista", "sênior", "pleno", "júnior"]
-        }
-
-        priority = order["priority"]
-        operator_level = operator["level"]
-        compatibility_level = "OK" if operator_level in priority_level_map.get(priority, []) else "NOK"
-
-        # Acumular horas do operador no dia.
-        operator_daily_hours[day][operator_id] += order["estimated_hours"]
-        total_hours = operator_daily_hours[day][operator_id]
-        extra_hours = "Sim" if total_hours > operator["hours_per_day"] else "Não"
-        total_extra_hours = total_hours - operator["hours_per_day"]
-
-        # Montar os dados da linha.
-        row = {
-            "dia": day,  # Dias começam de 1.
-            "id_ordem": order_id,
-            "id_operador": operator_id,
-            "Serviços": " | ".join(order["required_skills"]),  # Formatação das habilidades.
-            "habilidades_operador": " | ".join(operator["skills"]),
-            "nivel_operador": operator["level"],
-            "horas_estimadas": order["estimated_hours"],
-            "horas_disponiveis": operator["hours_per_day"],
-            "prioridade": order["priority"],
-            "inicio_esperado": order["expected_start_day"],
-            "atraso": max(0, day - order["expected_start_day"]),
-            "compatibilidade_os_op": round(skill_compatibility * 100, 2),
-            "habilidades_nao_atendidas": " | ".join(missing_skills),
-            "compatibilidade_prioridade": compatibility_level,
-            "hora_extra": extra_hours,
-            "total_hora_extra": total_extra_hours,
-            "status": current_status,
-        }
+    # Identifica ordens não alocadas.
+    unassigned_orders = list(set(orders.keys()) - set(order_ids))
 
-        data.append(row)
+    return df, unassigned_orders
 
-    # Converte os dados em um DataFrame.
-    df = pd.DataFrame(data)
+def _skills_categorical(skill_lists):
+    """
+    Converte listas de habilidades em uma coluna categórica ("a | b"), juntando o texto uma vez por conjunto distinto.
 
-    # Identifica ordens não alocadas.
-    unassigned_orders = list(set(orders.keys()) - set(df["id_ordem"].unique()))
+    Returns:
+        tuple: (pd.Categorical, códigos do conjunto de cada linha, lista dos conjuntos distintos)
+    """
+    codes = {}
+    row_codes = np.fromiter((codes.setdefault(tuple(skills), len(codes)) for skills in skill_lists),
+                            dtype=np.int64, count=len(skill_lists))
+    skill_sets = list(codes)
+    label_codes, labels = pd.factorize(pd.Series([" | ".join(skills) for skills in skill_sets], dtype=object))
+    return pd.Categorical.from_codes(label_codes[row_codes], labels), row_codes, skill_sets
+
+def _orders_columns(orders, order_ids=None):
+    """
+    Colunas (vetores) com os dados das ordens informadas (todas, se não fornecidas), na ordem do dicionário.
+    Com uma `OrderTable`, as colunas são recortadas dos vetores da tabela.
+    """
+    if isinstance(orders, OrderTable):
+        return orders.columns(order_ids)
+    if order_ids is None:
+        order_ids = list(orders)
+    values = [orders[order_id] for order_id in order_ids]
+    skills, skill_set_code, skill_sets = _skills_categorical([order["required_skills"] for order in values])
+    return {
+        "ids": list(order_ids),
+        "skills": skills,
+        "skill_set_code": skill_set_code,
+        "skill_sets": skill_sets,
+        "estimated_hours": np.fromiter((order["estimated_hours"] for order in values), dtype=np.int64, count=len(values)),
+        "priority": pd.Categorical([order["priority"] for order in values]),
+        "expected_start_day": np.fromiter((order["expected_start_day"] for order in values), dtype=np.int64, count=len(values)),
+        "status": pd.Categorical([order["status"] for order in values]),
+    }
 
-    return df, unassigned_orders
+def _operators_columns(operators):
+    """
+    Colunas (vetores) com os dados dos operadores, na ordem do dicionário.
+    """
+    if isinstance(operators, OperatorTable):
+        return operators.columns()
+    values = list(operators.values())
+    skills, _, _ = _skills_categorical([operator["skills"] for operator in values])
+    return {
+        "ids": list(operators),
+        "skills": skills,
+        "level": pd.Categorical([operator["level"] for operator in values]),
+        "shift": pd.Categorical([operator["shift"] for operator in values]),
+        "hours_per_day": np.fromiter((operator["hours_per_day"] for operator in values), dtype=np.int64, count=len(values)),
+    }
 
 # Converte os dados de exemplo em dataframe para facilitar a visualização
 def orders_to_dataframe(orders):
@@ -299,243 +367,176 @@ def orders_to_dataframe(orders):
     Detalhes:
     - O DataFrame das ordens de serviço inclui as colunas: 'id_ordem', 'Serviços', 'horas_estimadas', 'prioridade', 
         'inicio_esperado', 'status'.
+    - As colunas são montadas diretamente a partir de vetores, com habilidades, prioridade e status categóricos.
     """
+    columns = _orders_columns(orders)
+    return pd.DataFrame({
+        "id_ordem": columns["ids"],
+        "Serviços": columns["skills"],
+        "horas_estimadas": columns["estimated_hours"],
+        "prioridade": columns["priority"],
+        "inicio_esperado": columns["expected_start_day"],
+        "status": columns["status"],
+    })
 
-    # Converte as ordens de serviço em um DataFrame
-    service_orders_data = []
-    for order_id, details in orders.items():
-        service_orders_data.append({
-            "id_ordem": order_id,
-            "Serviços": " | ".join(details["required_skills"]),
-            "horas_estimadas": details["estimated_hours"],
-            "prioridade": details["priority"],
-            "inicio_esperado": details["expected_start_day"],
-            "status": details["status"],
-        })
+# Converte os dados de exemplo em dataframe para facilitar a visualização
+def op_orders_to_dataframe(operators, orders):
+    """
+    Converte os dados simulados de operadores e ordens de serviço em DataFrames.
+
+    Args:
+        operators (dict): Dicionário com dados dos operadores, incluindo suas habilidades, turnos e horas de trabalho.
+        service_orders (dict): Dicionário com ordens de serviço, incluindo habilidades exigidas, horas estimadas, prioridade, inicio_esperado e status.
+
+    Returns:
+        tuple: Um tuple contendo dois DataFrames:
+            - operators_df: DataFrame com os dados dos operadores.
+            - service_orders_df: DataFrame com os dados das ordens de serviço.
+
+    Detalhes:
+    - O DataFrame dos operadores inclui as colunas: 'operator_id', 'skills', 'level', 'shift', 'hours_per_day'.
+    - O DataFrame das ordens de serviço inclui as colunas: 'order_id', 'required_skills', 'estimated_hours', 'priority', 
+        'expected_start_day', 'status'.
+    - As colunas são montadas diretamente a partir de vetores, com habilidades, nível, turno, prioridade e status
+      categóricos (ver `orders_to_dataframe`).
+    """
+
+    # Converte os operadores em um DataFrame
+    columns = _operators_columns(operators)
+    operators_df = pd.DataFrame({
+        "id_operador": columns["ids"],
+        "habilidades_operador": columns["skills"],
+        "nivel_operador": columns["level"],
+        "turno": columns["shift"],
+        "horas_disponiveis": columns["hours_per_day"],
+    })
 
-    service_orders_df = pd.DataFrame(service_orders_data)
+    # Converte as ordens de serviço em um DataFrame
+    service_orders_df = orders_to_dataframe(orders)
 
-    return service_orders_df
+    return operators_df, service_orders_df
 
 # Função para imprimir na tela o resultado do algoritmo
-def imprimir_resultados_alocacao(df, unassigned_orders, orders, name):
+def imprimir_resultados_alocacao(df, unassigned_orders, orders, name, render=True):
     """
     Imprime um relatório detalhado da alocação de ordens de serviço.
 
     Args:
         df (pd.DataFrame): DataFrame com a solução de alocação
         unassigned_orders (list): Lista de ordens não alocadas
-        operators (dict): Dicionário com informações dos operadores
         orders (dict): Dicionário com informações das ordens
+        name (str): Nome do algoritmo, usado no nome do arquivo do relatório
+        render (bool): Se False, apenas calcula e retorna as métricas, sem imprimir nem gravar o relatório
+
+    Returns:
+        dict: Métricas principais da alocação.
+
+    Detalhes:
+    - As seções são calculadas por `allocation_report.compute_allocation_report` e o texto é montado em memória
+      por `render_allocation_report`, sendo impresso e gravado no arquivo uma única vez.
     """
+    report = compute_allocation_report(df, unassigned_orders, orders)
+    if not render:
+        return report["metrics"]
+
     # Configuração do arquivo de saída
     script_dir = os.path.dirname(os.path.abspath(__file__))
     result_dir = os.path.join(script_dir, "./../resultados")
     os.makedirs(result_dir, exist_ok=True)
     report_file_path = os.path.join(result_dir, f"relatorio_alocacao_{name}.txt")
 
-    # Função auxiliar para escrever tanto no console quanto no arquivo
-    def write_output(text):
-        print(text)
-        with open(report_file_path, 'a', encoding='utf-8') as f:
-            f.write(text + '\n')
-
-    # Limpa o arquivo se ja existir
+    text = render_allocation_report(report, orders)
+    print(text, end='')
     with open(report_file_path, 'w', encoding='utf-8') as f:
-        f.write('')
-
-    write_output("\n" + "=" * 80)
-    write_output("RELATÓRIO DETALHADO DE ALOCAÇÃO".center(80))
-    write_output("=" * 80)
-
-    # 1. Estatísticas Gerais
-    total_ordens = len(orders)
-    ordens_alocadas = len(df['id_ordem'].unique())
-    ordens_nao_alocadas = len(unassigned_orders)
-
-    write_output("\n1. ESTATÍSTICAS GERAIS")
-    write_output("-" * 40)
-    write_output(f"Total de Ordens: {total_ordens}")
-    write_output(
-        f"Ordens Alocadas: {ordens_alocadas} ({(ordens_alocadas / total_ordens) * 100:.1f}%)")
-    write_output(f"Ordens Não Alocadas: {ordens_nao_alocadas}")
-
-    # 2. Análise por Prioridade
-    write_output("\n2. ANÁLISE POR PRIORIDADE")
-    write_output("-" * 40)
-    for prioridade in ['urgente', 'alta', 'média', 'baixa']:
-        count = len(df[df['prioridade'] == prioridade])
-        if count > 0:
-            write_output(
-                f"Prioridade {prioridade:8s}: {count:3d} ordens ({(count / ordens_alocadas) * 100:5.1f}%)")
-
-    # 3. Análise por Operador
-    write_output("\n3. ANÁLISE POR OPERADOR")
-    write_output("-" * 40)
-    for operador in df['id_operador'].unique():
-        df_op = df[df['id_operador'] == operador]
-        horas_total = df_op['horas_estimadas'].sum()
-        horas_disp = df_op['horas_disponiveis'].iloc[0]
-        percentual = (horas_total / (horas_disp * 5)) * 100
-        n_ordens = len(df_op)
-        write_output(f"Operador {operador}:")
-        write_output(f"  - Ordens alocadas: {n_ordens}")
-        write_output(
-            f"  - Horas alocadas: {horas_total:.1f}h de {horas_disp * 5:.1f}h ({percentual:.1f}%)")
-    # 4. Análise de Prazos
-    write_output("\n4. ANÁLISE DE PRAZOS")
-    write_output("-" * 40)
-
-    ordens_no_prazo = len(df[df['atraso'] <= 0])
-    write_output(
-        f"Ordens no Prazo: {ordens_no_prazo} ({(ordens_no_prazo / ordens_alocadas) * 100:.1f}%)")
-
-    if len(df[df['atraso'] > 0]) > 0:
-        write_output("\nDetalhamento dos Atrasos:")
-        for _, row in df[df['atraso'] > 0].iterrows():
-            write_output(
-                f"  Ordem {row['id_ordem']}: {row['atraso']} dias de atraso (Prioridade: {row['prioridade']})")
-
-    # 5. Análise de Atendimentos por Fitness
-    write_output("\n5. ANÁLISE DE ATENDIMENTOS POR FITNESS")
-    write_output("-" * 40)
-
-    # Análise de atendimento baseada nos critérios do fitness
-    atendimentos = {
-        'total': [],
-        'parcial': [],
-        'inadequado': []
-    }
+        f.write(text)
 
-    for _, row in df.iterrows():
-        # Converte strings de habilidades em conjuntos para comparação
-        required_skills = set(row['Serviços'].split(" | "))
-        operator_skills = set(row['habilidades_operador'].split(" | "))
+    # Retorna métricas principais para uso no algoritmo genético
+    return report["metrics"]
 
-        # Calcula o percentual de match de habilidades
-        matching_skills = len(required_skills.intersection(operator_skills))
-        skill_match_percent = matching_skills / len(required_skills)
+# Formatos de saída aceitos por `salvar_arquivos` e o nome exibido de cada um.
+OUTPUT_FORMATS = {"csv": "CSV", "parquet": "Parquet", "feather": "Feather", "xlsx": "Excel"}
 
-        # Verifica condições de atendimento
-        dentro_prazo = row['atraso'] <= 0
-        horas_ok = row['horas_estimadas'] <= row['horas_disponiveis']
+# Compressões aceitas por cada formato de saída (o Excel não tem compressão).
+OUTPUT_COMPRESSIONS = {
+    "csv": ("gzip", "bz2", "zip", "xz", "zstd"),
+    "parquet": ("snappy", "gzip", "brotli", "lz4", "zstd"),
+    "feather": ("lz4", "zstd"),
+    "xlsx": (),
+}
 
-        # Classifica o atendimento
-        if skill_match_percent == 1 and dentro_prazo and horas_ok:
-            atendimentos['total'].append(row['id_ordem'])
-        elif skill_match_percent >= 0.5:
-            atendimentos['parcial'].append(row['id_ordem'])
-        else:
-            atendimentos['inadequado'].append(row['id_ordem'])
-
-    # Imprime estatísticas gerais
-    total_atendidos = len(atendimentos['total'])
-    parcial_atendidos = len(atendimentos['parcial'])
-    inadequados = len(atendimentos['inadequado'])
-
-    write_output("Estatísticas Gerais de Atendimento:")
-    write_output(f"  - Atendimento Total:    {total_atendidos:3d} ordens ({(total_atendidos / ordens_alocadas) * 100:5.1f}%)")
-    write_output(f"  - Atendimento Parcial:  {parcial_atendidos:3d} ordens ({(parcial_atendidos / ordens_alocadas) * 100:5.1f}%)")
-    write_output(f"  - Atendimento Inadequado: {inadequados:3d} ordens ({(inadequados / ordens_alocadas) * 100:5.1f}%)")
-
-    # Análise detalhada por tipo de atendimento
-    write_output("\nDetalhamento dos Atendimentos:")
-
-    if atendimentos['total']:
-        write_output("\nOrdens com Atendimento Total:")
-        for ordem_id in atendimentos['total']:
-            ordem = df[df['id_ordem'] == ordem_id].iloc[0]
-            write_output(f"  ✓ Ordem {ordem_id}: "
-                         f"Skills={ordem['Serviços']}, "
-                         f"Operador={ordem['id_operador']}, "
-                         f"Inicio Esperado={ordem['inicio_esperado']}, "
-                         f"Dia Alocado={ordem['dia']}")
-
-    if atendimentos['parcial']:
-        write_output("\nOrdens com Atendimento Parcial:")
-        for ordem_id in atendimentos['parcial']:
-            ordem = df[df['id_ordem'] == ordem_id].iloc[0]
-            write_output(f"  ⚠ Ordem {ordem_id}: "
-                         f"Skills={ordem['Serviços']}, "
-                         f"Operador={ordem['id_operador']} ({ordem['habilidades_operador']}), "
-                         f"Inicio Esperado={ordem['inicio_esperado']}, "
-                         f"Dia Alocado={ordem['dia']}")
-
-    if atendimentos['inadequado']:
-        write_output("\nOrdens com Atendimento Inadequado:")
-        for ordem_id in atendimentos['inadequado']:
-            ordem = df[df['id_ordem'] == ordem_id].iloc[0]
-            write_output(f"  ✗ Ordem {ordem_id}: "
-                         f"Skills={ordem['Serviços']}, "
-                         f"Operador={ordem['id_operador']} ({ordem['habilidades_operador']}), "
-                         f"Inicio Esperado={ordem['inicio_esperado']}, "
-                         f"Dia Alocado={ordem['dia']}")
-
-    # 6. Análise por Dia
-    write_output("\n6. DISTRIBUIÇÃO POR DIA")
-    write_output("-" * 40)
-    for dia in sorted(df['dia'].unique()):
-        df_dia = df[df['dia'] == dia]
-        write_output(f"\nDia {dia}:")
-        write_output(f"  - Total de Ordens: {len(df_dia)}")
-        write_output(
-            f"  - Horas Alocadas: {df_dia['horas_estimadas'].sum():.1f}h")
-        write_output(f"  - Distribuição de Prioridades:")
-        for prioridade in ['urgente', 'alta', 'média', 'baixa']:
-            count = len(df_dia[df_dia['prioridade'] == prioridade])
-            if count > 0:
-                write_output(f"    * {prioridade:8s}: {count:3d}")
-
-    # 7. Ordens Não Alocadas
-    if unassigned_orders:
-        write_output("\n7. ORDENS NÃO ALOCADAS")
-        write_output("-" * 40)
-        write_output(f"Total de ordens não alocadas: {len(unassigned_orders)}")
-
-        # Agrupa por prioridade
-        unassigned_by_priority = {}
-        for order_id in unassigned_orders:
-            priority = orders[order_id]['priority']
-            if priority not in unassigned_by_priority:
-                unassigned_by_priority[priority] = []
-            unassigned_by_priority[priority].append(order_id)
-
-        for priority in ['urgente', 'alta', 'média', 'baixa']:
-            if priority in unassigned_by_priority:
-                orders_list = unassigned_by_priority[priority]
-                write_output(
-                    f"\nPrioridade {priority}: {len(orders_list)} ordens")
-                for order_id in orders_list:
-                    order = orders[order_id]
-                    write_output(f"  - {order_id}: "
-                                 f"Skills={', '.join(order['required_skills'])}, "
-                                 f"Horas={order['estimated_hours']}, "
-                                 f"Prazo={order['expected_start_day']}")
-
-    write_output("\n" + "=" * 80)
-    write_output("FIM DO RELATÓRIO".center(80))
-    write_output("=" * 80)
+# Extensão adicionada ao CSV para cada compressão.
+CSV_COMPRESSION_SUFFIX = {"gzip": ".gz", "bz2": ".bz2", "zip": ".zip", "xz": ".xz", "zstd": ".zst"}
 
-    # Retorna métricas principais para uso no algoritmo genético
-    return {
-        'total_ordens': total_ordens,
-        'ordens_alocadas': ordens_alocadas,
-        'ordens_nao_alocadas': ordens_nao_alocadas,
-        'taxa_alocacao': (ordens_alocadas/total_ordens)*100,
-        'matches_perfeitos': total_atendidos,
-        'taxa_matches_perfeitos': (total_atendidos/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
-        'compatibilidade_media': df['compatibilidade_os_op'].mean()*100 if not df.empty else 0,
-        'ordens_no_prazo': ordens_no_prazo,
-        'taxa_cumprimento_prazo': (ordens_no_prazo/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
-        'atendimento_total': total_atendidos,
-        'atendimento_parcial': parcial_atendidos,
-        'atendimento_inadequado': inadequados,
-        'taxa_atendimento_total': (total_atendidos/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
-        'taxa_atendimento_parcial': (parcial_atendidos/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
-        'taxa_atendimento_inadequado': (inadequados/ordens_alocadas)*100 if ordens_alocadas > 0 else 0
-    }
+def output_compression(compression, formats):
+    """
+    Valida a compressão de cada formato de saída.
+
+    Args:
+        compression (str ou dict, opcional): Uma compressão para todos os formatos (ex.: "zstd"), uma compressão
+                                             por formato (ex.: {"csv": "gzip", "parquet": "snappy"}) ou o texto
+                                             equivalente "csv=gzip,parquet=snappy".
+        formats (iterable): Formatos de saída.
+
+    Returns:
+        dict: A compressão de cada formato ({formato: compressão ou None}).
+
+    Raises:
+        ValueError: Se a compressão não for aceita pelo formato indicado ou por nenhum dos formatos.
+
+    Detalhes:
+    - Uma compressão única vale apenas para os formatos que a aceitam; os demais são gravados sem compressão
+      (ex.: "snappy" comprime o Parquet e mantém o CSV sem compressão).
+    """
+    formats = list(formats)
+    if isinstance(compression, str) and "=" in compression:
+        try:
+            compression = dict(item.split("=", 1) for item in compression.split(","))
+        except ValueError:
+            raise ValueError(f"Compressão por formato inválida: {compression} (use formato=compressão, ...).")
+
+    if isinstance(compression, dict):
+        for output_format, codec in compression.items():
+            if output_format not in OUTPUT_COMPRESSIONS:
+                raise ValueError(f"Formato de saída desconhecido na compressão: {output_format}")
+            if codec is not None and codec not in OUTPUT_COMPRESSIONS[output_format]:
+                raise ValueError(f"Compressão {codec} não suportada pelo formato {OUTPUT_FORMATS[output_format]} "
+                                 f"(aceitas: {', '.join(OUTPUT_COMPRESSIONS[output_format]) or 'nenhuma'}).")
+        return {output_format: compression.get(output_format) for output_format in formats}
+
+    if compression is not None and not any(compression in OUTPUT_COMPRESSIONS.get(output_format, ())
+                                           for output_format in formats):
+        raise ValueError(f"Compressão {compression} não suportada por nenhum dos formatos: {', '.join(formats)}.")
+    return {output_format: compression if compression in OUTPUT_COMPRESSIONS.get(output_format, ()) else None
+            for output_format in formats}
+
+# Gravações em segundo plano ainda em andamento (ver `aguardar_arquivos`).
+_pending_writes = []
+
+def salvar_arquivos(dataframe, algorithm_name = 'genetic_algorithm', formats=("csv",), compression=None,
+                    background=False):
+    """
+    Salva o DataFrame da solução nos formatos escolhidos, no diretório `resultados_<algoritmo>`.
+
+    Args:
+        dataframe (pd.DataFrame): DataFrame a ser salvo (não deve ser alterado enquanto a gravação estiver em andamento).
+        algorithm_name (str): Nome do algoritmo, usado no nome do diretório.
+        formats (iterable): Formatos de saída: "csv", "parquet", "feather" e/ou "xlsx" (o Excel é opcional por ser lento).
+        compression (str ou dict, opcional): Compressão de todos os formatos ou por formato, ex.: {"csv": "gzip",
+                                             "parquet": "zstd"} (ver `output_compression`). O Excel não tem compressão.
+        background (bool): Grava os arquivos em uma thread separada, sem bloquear quem chamou.
+
+    Returns:
+        threading.Thread ou None: A thread da gravação, se `background` for True.
+
+    Detalhes:
+    - Parquet e Feather são colunares e usam o `pyarrow`; preservam os tipos (inclusive os categóricos).
+    - A compressão é validada antes de qualquer gravação (`ValueError` se um formato não a aceitar).
+    - Erros de gravação de um formato são exibidos e não impedem a gravação dos demais.
+    - Gravações em segundo plano usam threads comuns (não daemon), então o programa espera por elas ao terminar;
+      `aguardar_arquivos` espera explicitamente.
+    """
+    compression = output_compression(compression, formats)
 
-def salvar_arquivos(dataframe, algorithm_name = 'genetic_algorithm'):
     # Diretório do script em execução
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -545,17 +546,46 @@ def salvar_arquivos(dataframe, algorithm_name = 'genetic_algorithm'):
     # Cria o diretório se não existir
     os.makedirs(result_dir, exist_ok=True)
 
-    # Caminhos completos para os arquivos
-    csv_file_path = os.path.join(result_dir, "best_solution.csv")
-    xlsx_file_path = os.path.join(result_dir, "best_solution.xlsx")
-
-    try:
-        # Salva os resultados em arquivo CSV.
-        dataframe.to_csv(csv_file_path, index=False)
-        print(f"Arquivo CSV salvo com sucesso em: {csv_file_path}")
-
-        # Salva os resultados em arquivo Excel.
-        dataframe.to_excel(xlsx_file_path, index=False)
-        print(f"Arquivo Excel salvo com sucesso em: {xlsx_file_path}")
-    except Exception as e:
-        print(f"Erro ao salvar os arquivos: {e}")
\ No newline at end of file
+    if not background:
+        _write_files(dataframe, result_dir, formats, compression)
+        return None
+
+    thread = threading.Thread(target=_write_files, args=(dataframe, result_dir, formats, compression),
+                              name=f"salvar_arquivos_{algorithm_name}")
+    # Mantém na lista apenas as gravações ainda em andamento.
+    _pending_writes[:] = [pending for pending in _pending_writes if pending.is_alive()]
+    _pending_writes.append(thread)
+    thread.start()
+    return thread
+
+def _write_files(dataframe, result_dir, formats, compression):
+    for output_format in formats:
+        if output_format not in OUTPUT_FORMATS:
+            print(f"Formato de saída desconhecido: {output_format}")
+            continue
+        codec = compression.get(output_format)
+
+        # Caminho completo do arquivo
+        file_path = os.path.join(result_dir, f"best_solution.{output_format}")
+        if output_format == "csv" and codec:
+            file_path += CSV_COMPRESSION_SUFFIX.get(codec, "")
+
+        try:
+            if output_format == "csv":
+                dataframe.to_csv(file_path, index=False, compression=codec)
+            elif output_format == "parquet":
+                dataframe.to_parquet(file_path, index=False, compression=codec)
+            elif output_format == "feather":
+                dataframe.reset_index(drop=True).to_feather(file_path, compression=codec)
+            else:
+                dataframe.to_excel(file_path, index=False)
+            print(f"Arquivo {OUTPUT_FORMATS[output_format]} salvo com sucesso em: {file_path}")
+        except Exception as e:
+            print(f"Erro ao salvar o arquivo {OUTPUT_FORMATS[output_format]}: {e}")
+
+def aguardar_arquivos():
+    """
+    Espera a conclusão de todas as gravações iniciadas em segundo plano por `salvar_arquivos`.
+    """
+    while _pending_writes:
+        _pending_writes.pop().join()
@@ -0,0 +1,167 @@
+import numpy as np
+from .instance_table import OrderTable
+
+# Tabela com a quantidade de bits ligados de cada byte, usada para contar habilidades em comum.
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.int64)
+
+# Máximo de habilidades distintas representáveis em uma máscara de 64 bits.
+MAX_SKILLS = 64
+
+def _popcount(masks):
+    """
+    Conta os bits ligados de cada máscara (uint64).
+    """
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    return _POPCOUNT_TABLE[masks.view(np.uint8)].reshape(masks.shape + (8,)).sum(axis=-1)
+
+class EligibilityIndex:
+    """
+    Índice de elegibilidade operador x ordem, construído uma única vez por instância.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        min_match (float): Porcentagem mínima de habilidades atendidas para o operador ser elegível (0.5 por padrão).
+
+    Detalhes:
+    - As habilidades são codificadas como máscaras de bits (um bit por habilidade, até 64 habilidades).
+    - Ordens com o mesmo conjunto de habilidades exigidas compartilham uma linha da tabela de compatibilidade,
+      então a memória cresce com operadores x conjuntos de habilidades, e não com operadores x ordens.
+    - A porcentagem de compatibilidade é a mesma de `meets_minimum_skills`.
+    - As consultas por ordem (`eligible_operators`, `meets_minimum`, ...) são O(1).
+    """
+    __slots__ = ("operators", "orders", "min_match", "skill_bit", "operator_ids", "order_ids",
+                 "operator_position", "order_position", "operator_mask", "order_skill_set",
+                 "set_mask", "set_required", "set_match", "set_eligible", "set_has_eligible",
+                 "candidate_offsets", "candidate_count", "candidate_operators_flat", "_eligible_ids",
+                 "_candidate_ids")
+
+    def __init__(self, operators, orders, min_match=0.5):
+        self.operators = operators
+        self.orders = orders
+        self.min_match = min_match
+
+        self.operator_ids = list(operators.keys())
+        self.operator_position = {op_id: i for i, op_id in enumerate(self.operator_ids)}
+
+        # Uma `OrderTable` já traz as posições e os conjuntos distintos de habilidades, sem percorrer as ordens.
+        is_table = isinstance(orders, OrderTable)
+        self.order_ids = orders.ids if is_table else list(orders.keys())
+        self.order_position = orders.position if is_table else \
+            {order_id: i for i, order_id in enumerate(self.order_ids)}
+        order_skills = orders.skill_sets if is_table else [order["required_skills"] for order in orders.values()]
+
+        # Um bit por habilidade conhecida (de operadores ou ordens).
+        self.skill_bit = {}
+        for skills in [operator["skills"] for operator in operators.values()] + order_skills:
+            for skill in skills:
+                if skill not in self.skill_bit:
+                    self.skill_bit[skill] = len(self.skill_bit)
+        if len(self.skill_bit) > MAX_SKILLS:
+            raise ValueError(f"O índice de elegibilidade suporta até {MAX_SKILLS} habilidades distintas "
+                             f"({len(self.skill_bit)} encontradas).")
+
+        self.operator_mask = np.array([self.skills_to_mask(operator["skills"]) for operator in operators.values()],
+                                      dtype=np.uint64)
+
+        # Conjuntos distintos de habilidades exigidas: (máscara, quantidade de habilidades listadas).
+        set_ids = {}
+        order_skill_set = []
+        for skills in order_skills:
+            key = (self.skills_to_mask(skills), len(skills))
+            order_skill_set.append(set_ids.setdefault(key, len(set_ids)))
+        self.order_skill_set = np.array(order_skill_set, dtype=np.int64)
+        if is_table:
+            self.order_skill_set = self.order_skill_set[orders.skill_set_code]
+        self.set_mask = np.array([mask for mask, _ in set_ids], dtype=np.uint64)
+        self.set_required = np.array([required for _, required in set_ids], dtype=np.int64)
+
+        # Tabela operador x conjunto de habilidades com a porcentagem de habilidades atendidas.
+        matching = _popcount(self.operator_mask[:, None] & self.set_mask[None, :])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.set_match = np.where(self.set_required > 0, matching / np.maximum(self.set_required, 1), 1.0)
+        self.set_eligible = self.set_match >= min_match
+        self.set_has_eligible = self.set_eligible.any(axis=0)
+
+        # Operadores elegíveis de cada conjunto (listas de ids compartilhadas entre as ordens).
+        self._eligible_ids = [[self.operator_ids[op] for op in np.flatnonzero(self.set_eligible[:, s])]
+                              for s in range(len(set_ids))]
+        self._candidate_ids = [ids if ids else list(self.operator_ids) for ids in self._eligible_ids]
+
+        # Candidatos de cada conjunto em formato compacto (offsets + vetor único), para sorteios vetorizados.
+        candidates = [np.flatnonzero(self.set_eligible[:, s]) if self.set_has_eligible[s]
+                      else np.arange(len(self.operator_ids)) for s in range(len(set_ids))]
+        self.candidate_count = np.array([len(c) for c in candidates], dtype=np.int64)
+        self.candidate_offsets = np.concatenate(([0], np.cumsum(self.candidate_count)[:-1])).astype(np.int64)
+        self.candidate_operators_flat = (np.concatenate(candidates) if candidates
+                                         else np.empty(0, dtype=np.int64)).astype(np.int64)
+
+    def skills_to_mask(self, skills):
+        """
+        Converte uma lista de habilidades em máscara de bits (habilidades desconhecidas são ignoradas).
+        """
+        mask = 0
+        for skill in skills:
+            bit = self.skill_bit.get(skill)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def match_percentage(self, operator_id, order_id):
+        """
+        Retorna a porcentagem de habilidades da ordem atendidas pelo operador.
+        """
+        return float(self.set_match[self.operator_position[operator_id],
+                                    self.order_skill_set[self.order_position[order_id]]])
+
+    def meets_minimum(self, operator_id, order_id):
+        """
+        Equivalente a `meets_minimum_skills`, consultando o índice.
+
+        Returns:
+            meets_minimum (bool): True se o operador atender a porcentagem mínima de habilidades.
+            match_percentage (float): A porcentagem de habilidades atendidas.
+        """
+        match = self.match_percentage(operator_id, order_id)
+        return match >= self.min_match, match
+
+    def is_eligible(self, operator_id, order_id):
+        """
+        Indica se o operador atende a porcentagem mínima de habilidades da ordem.
+        """
+        return bool(self.set_eligible[self.operator_position[operator_id],
+                                      self.order_skill_set[self.order_position[order_id]]])
+
+    def eligible_operators(self, order_id):
+        """
+        Retorna os ids dos operadores elegíveis para a ordem, na ordem do dicionário de operadores.
+        """
+        return self._eligible_ids[self.order_skill_set[self.order_position[order_id]]]
+
+    def candidate_operators(self, order_id):
+        """
+        Retorna os operadores que podem receber a ordem no algoritmo genético: os elegíveis ou, se não houver
+        nenhum, todos os operadores (o fitness penaliza a incompatibilidade).
+        """
+        return self._candidate_ids[self.order_skill_set[self.order_position[order_id]]]
+
+    def is_candidate(self, operator_id, order_id):
+        """
+        Indica se o operador está entre os candidatos da ordem (ver `candidate_operators`).
+        """
+        skill_set = self.order_skill_set[self.order_position[order_id]]
+        return bool(self.set_eligible[self.operator_position[operator_id], skill_set]
+                    or not self.set_has_eligible[skill_set])
+
+    def match_matrix(self, operator, positions):
+        """
+        Versão vetorizada de `match_percentage` sobre índices de operadores e posições de ordens.
+        """
+        return self.set_match[operator, self.order_skill_set[positions]]
+
+    def candidate_matrix(self, operator, positions):
+        """
+        Versão vetorizada de `is_candidate` sobre índices de operadores e posições de ordens.
+        """
+        skill_set = self.order_skill_set[positions]
+        return self.set_eligible[operator, skill_set] | ~self.set_has_eligible[skill_set]
@@ -0,0 +1,120 @@
+import hashlib
+from collections import OrderedDict
+from .chromosome import Chromosome
+from .population_fitness import evaluate_population
+
+def genome_key(individual):
+    """
+    Calcula uma chave curta (hash de 16 bytes) que identifica o genoma de um indivíduo.
+
+    Args:
+        individual (Chromosome ou dict): Indivíduo da população.
+
+    Returns:
+        bytes: Hash do par (operador, dia) de todas as ordens (e do status, nas soluções em dicionário).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(individual, Chromosome):
+        digest.update(individual.operator.tobytes())
+        digest.update(individual.day.tobytes())
+    else:
+        digest.update(repr([(allocation["operator"], allocation["day"], allocation["status"])
+                            for allocation in individual["orders"].values()]).encode())
+    return digest.digest()
+
+class FitnessCache:
+    """
+    Cache de fitness por genoma, com descarte LRU (menos usado recentemente) e contadores de acertos.
+
+    Args:
+        maxsize (int): Quantidade máxima de genomas guardados.
+
+    Detalhes:
+    - A chave é um hash do genoma (`genome_key`), então indivíduos iguais (a elite repassada entre gerações,
+      filhos idênticos aos pais) compartilham a mesma entrada.
+    - `evaluate` só calcula o fitness dos indivíduos que não estão no cache, em uma única avaliação vetorizada.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evaluations = 0    # Genomas avaliados por `evaluate` (ausentes do cache).
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Retorna o fitness guardado para a chave (ou None), atualizando os contadores.
+        """
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return fitness
+
+    def put(self, key, fitness):
+        self._entries[key] = fitness
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def store(self, individual):
+        """
+        Registra o fitness já calculado de um indivíduo (por exemplo, logo após crossover e mutação).
+        """
+        self.put(genome_key(individual), individual["fitness"])
+
+    def evaluate(self, population, layout):
+        """
+        Garante o fitness de toda a população, calculando apenas os genomas ausentes do cache.
+
+        Args:
+            population (list): Indivíduos da população.
+            layout (GenomeLayout): Índice da instância usado na avaliação vetorizada.
+
+        Returns:
+            list: O fitness de cada indivíduo, na ordem da população.
+        """
+        pending = {}
+        for individual in population:
+            key = genome_key(individual)
+            fitness = self.get(key)
+            if fitness is not None:
+                individual["fitness"] = fitness
+            else:
+                # Genomas repetidos dentro da população são avaliados uma única vez.
+                pending.setdefault(key, []).append(individual)
+
+        if pending:
+            representatives = [individuals[0] for individuals in pending.values()]
+            self.evaluations += len(representatives)
+            scores = evaluate_population(representatives, layout)
+            for (key, individuals), fitness in zip(pending.items(), scores):
+                self.put(key, float(fitness))
+                for individual in individuals:
+                    individual["fitness"] = float(fitness)
+
+        return [individual["fitness"] for individual in population]
+
+    def stats(self):
+        """
+        Retorna os contadores do cache (acertos, falhas, taxa de acerto e tamanho).
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._entries),
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evaluations = 0
@@ -0,0 +1,145 @@
+import cProfile
+import contextlib
+import io
+import json
+import os
+import pstats
+import time
+import pandas as pd
+
+# Fases medidas em cada geração, na ordem em que aparecem no resumo.
+# As fases de desenho só aparecem quando a tela é desenhada dentro da geração (por um callback do motor);
+# com o visualizador em outro processo, a geração mede apenas o envio do quadro ("snapshot").
+PHASES = ("evaluate", "sort", "selection", "crossover", "mutate", "parallel_offspring", "reinitialize",
+          "draw_plot", "draw_squares", "display_flip", "snapshot")
+
+_NO_PHASE = contextlib.nullcontext()
+
+def no_phase(name):
+    """
+    Substituto de `GenerationProfiler.phase` quando não há medição (não mede nada).
+    """
+    return _NO_PHASE
+
+class GenerationProfiler:
+    """
+    Medição do tempo de cada fase das gerações do algoritmo genético, com rastro em JSON/CSV e cProfile opcional.
+
+    Args:
+        profile_generations (tuple, opcional): Intervalo (primeira, última) de gerações cobertas pelo cProfile.
+        profile_path (str, opcional): Arquivo onde as estatísticas do cProfile são salvas (formato do `pstats`).
+
+    Detalhes:
+    - O motor chama `start_generation` no início da geração e `end_generation` ao final (depois dos callbacks),
+      e envolve cada fase com `phase(nome)`; o tempo da geração fora das fases medidas fica em "other".
+    - Fases podem ser medidas também pelos observadores (ex.: o envio dos quadros ao visualizador), pois os
+      callbacks rodam dentro da geração.
+    - Cada geração vira um registro com os tempos das fases e as métricas informadas pelo motor
+      (avaliações de fitness, acertos do cache, mutações tentadas e aceitas, melhor fitness).
+    - `close` encerra o cProfile ainda ativo (execução interrompida ou terminada antes da última geração do
+      intervalo) e salva o perfil das gerações cobertas; o motor o chama ao terminar ou ser interrompido.
+    """
+
+    def __init__(self, profile_generations=None, profile_path=None):
+        self.records = []
+        self.current = None
+        self.profile_generations = profile_generations
+        self.profile_path = profile_path
+        self.profiler = None
+        self._start = None
+
+    def start_generation(self, generation):
+        self.current = {"generation": generation}
+        self._start = time.perf_counter()
+        if self.profile_generations is not None and generation == self.profile_generations[0]:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Soma ao registro da geração atual o tempo do bloco `with`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.current is not None:
+                self.current[name] = self.current.get(name, 0.0) + time.perf_counter() - start
+
+    def end_generation(self, **metrics):
+        """
+        Fecha o registro da geração atual com o tempo total e as métricas informadas.
+        """
+        record = self.current
+        record["total"] = time.perf_counter() - self._start
+        record["other"] = record["total"] - sum(record.get(name, 0.0) for name in PHASES)
+        record.update(metrics)
+        if record.get("mutations_attempted") is not None:
+            attempted = record["mutations_attempted"]
+            record["mutation_acceptance"] = record["mutations_accepted"] / attempted if attempted else None
+        self.records.append(record)
+        self.current = None
+
+        if self.profiler is not None and record["generation"] >= self.profile_generations[1]:
+            self.close()
+
+    def close(self):
+        """
+        Encerra o cProfile, se estiver ativo, e salva o perfil das gerações cobertas até aqui.
+        """
+        if self.profiler is None:
+            return
+        self.profiler.disable()
+        # Última geração coberta: a interrompida, se houver, ou a última registrada.
+        last = self.current["generation"] if self.current is not None else self.records[-1]["generation"]
+        self.current = None
+        self._report_profile(last)
+        self.profiler = None
+
+    def _report_profile(self, last, limit=20):
+        first = self.profile_generations[0]
+        if self.profile_path:
+            self.profiler.dump_stats(self.profile_path)
+            print(f"Perfil (cProfile) das gerações {first} a {last} salvo em: {self.profile_path}")
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+        print(f"\nPerfil (cProfile) das gerações {first} a {last}:\n{stream.getvalue()}")
+
+    def summary(self):
+        """
+        Resumo das gerações registradas: tempo total e participação de cada fase, avaliações e mutações.
+        """
+        total = sum(record["total"] for record in self.records)
+        phases = {}
+        for name in PHASES + ("other",):
+            phase_total = sum(record.get(name, 0.0) for record in self.records)
+            if phase_total:
+                phases[name] = {"time": phase_total, "share": phase_total / total if total else 0.0}
+        attempted = sum(record.get("mutations_attempted") or 0 for record in self.records)
+        accepted = sum(record.get("mutations_accepted") or 0 for record in self.records)
+        return {
+            "generations": len(self.records),
+            "total_time": total,
+            "mean_generation_time": total / len(self.records) if self.records else 0.0,
+            "phases": phases,
+            "fitness_evaluations": sum(record.get("fitness_evaluations", 0) for record in self.records),
+            "mutation_acceptance": accepted / attempted if attempted else None,
+        }
+
+    def write(self, path):
+        """
+        Salva o rastro das gerações em JSON (resumo + registros) ou CSV (um registro por linha), pela extensão.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        if path.lower().endswith(".csv"):
+            trace = pd.DataFrame(self.records)
+            phases = [name for name in PHASES if name in trace.columns]
+            trace[phases] = trace[phases].fillna(0.0)
+            first = ["generation", "total"] + phases + ["other"]
+            trace[first + [column for column in trace.columns if column not in first]].to_csv(path, index=False)
+        else:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"summary": self.summary(), "generations": self.records}, file, indent=2)
+        print(f"Rastro das gerações salvo em: {path}")
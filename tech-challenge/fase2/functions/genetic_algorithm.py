@@ -1,7 +1,10 @@
 import random
 import pandas as pd
-import copy
+import numpy as np
 from .common_functions import *
+from .chromosome import Chromosome, UNASSIGNED, OPERATOR_DTYPE, rng
+from .eligibility import EligibilityIndex
+from .capacity_ledger import CapacityLedger
 
 # Função para converter nível de habilidade em valor numérico
 def skill_level_to_number(level):
@@ -18,7 +21,7 @@ def skill_level_to_number(level):
     return levels.get(level, 0)
 
 # Função para criação de uma solução inicial
-def create_initial_solution(operators, orders, max_days):
+def create_initial_solution(operators, orders, max_days, layout=None, index=None):
     """
     Cria uma solução inicial aleatória, garantindo que apenas operadores com as habilidades necessárias
     sejam atribuídos às ordens.
@@ -26,13 +29,21 @@ def create_initial_solution(operators, orders, max_days):
         operators (dict): Operadores disponíveis.
         orders (dict): Ordens de serviço a serem alocadas.
         days (int): Número de dias do planejamento.
+        layout (GenomeLayout, opcional): Se fornecido, a solução é criada como um cromossomo compacto.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
     Returns:
-        dict: Solução inicial com as OSs organizadas por prioridade.
+        dict ou Chromosome: Solução inicial com as OSs organizadas por prioridade.
     Detalhes:
     - Distribui ordens aleatoriamente para operadores e dias.
     - Garante que o operador alocado tenha as habilidades necessárias para atender a ordem.
     - A solução gerada será ajustada pelo algoritmo genético.
     """
+    if layout is not None:
+        return _create_initial_chromosome(layout)
+
+    if index is None:
+        index = EligibilityIndex(operators, orders)
+
     # Inicializa a solução.
     solution = {
         "orders": {
@@ -44,10 +55,7 @@ def create_initial_solution(operators, orders, max_days):
     
     for order_id, order_data in orders.items():
         # Identifica operadores válidos para a ordem com base nas habilidades.
-        valid_operators = [
-            op_id for op_id, operator in operators.items()
-            if meets_minimum_skills(operator["skills"], order_data["required_skills"])
-        ]
+        valid_operators = index.candidate_operators(order_id)
 
         if valid_operators:  # Apenas atribui se houver operadores válidos.
             # Atribui a ordem a um dia e operador aleatórios.
@@ -65,7 +73,7 @@ def create_initial_solution(operators, orders, max_days):
     return solution
 
 # Função para realizar o crossover entre dois pais, garantindo que cada ordem seja atribuída apenas uma vez
-def crossover(parent1, parent2, operators, orders, max_days):
+def crossover(parent1, parent2, operators, orders, max_days, index=None):
     """
     Realiza o crossover entre dois pais, garantindo que cada ordem seja atribuída apenas uma vez e que operadores atendam a pelo menos 50% das habilidades necessárias.
 
@@ -74,6 +82,7 @@ def crossover(parent1, parent2, operators, orders, max_days):
         parent2 (dict): A solução do segundo pai, contendo a alocação de ordens a operadores por dia.
         operators (dict): Dicionário de operadores com habilidades e capacidade.
         orders (dict): Dicionário de ordens com habilidades necessárias e detalhes.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
 
     Returns:
         dict: A solução do filho gerada pelo crossover, com a alocação de ordens a operadores por dia.
@@ -83,8 +92,16 @@ def crossover(parent1, parent2, operators, orders, max_days):
       1. O primeiro segmento é copiado do pai 1 até o ponto de crossover.
       2. O segundo segmento é copiado do pai 2 após o ponto de crossover.
     - Durante o crossover, garante-se que uma ordem não seja atribuída mais de uma vez.
+    - As alocações herdadas são compartilhadas com os pais, sem cópia (nenhuma função as altera no lugar).
     - Se alguma ordem não for atribuída após o crossover, ela é atribuída aleatoriamente a um operador em um dia aleatório.
+    - Se os pais forem cromossomos compactos, o crossover é feito diretamente sobre os vetores.
     """
+    if isinstance(parent1, Chromosome):
+        return _crossover_chromosomes(parent1, parent2)
+
+    if index is None:
+        index = EligibilityIndex(operators, orders)
+
     # Inicializa o filho com uma estrutura vazia.
     child = {"orders": {}, "fitness": 0}
     assigned_orders = set()  # Rastreia as ordens já atribuídas.
@@ -92,21 +109,19 @@ def crossover(parent1, parent2, operators, orders, max_days):
     # Obtém a lista de ordens para o ponto de crossover.
     orders_parent1 = list(parent1["orders"].keys())
     orders_parent2 = list(parent2["orders"].keys())
-    crossover_point = random.randint(1, len(orders_parent1) - 1)
+    crossover_point = random.randint(1, max(1, len(orders_parent1) - 1))
 
     # Primeiro segmento: Copia as ordens do pai 1 até o ponto de crossover.
     for order_id in orders_parent1[:crossover_point]:
         if order_id in parent1["orders"]:
             order_data = parent1["orders"][order_id]
             operator = order_data["operator"]
-            day = order_data["day"]
-            status = order_data["status"]
 
             # Verifica se o operador é compatível e a ordem não foi atribuída.
             if (order_id not in assigned_orders
-                and meets_minimum_skills(operators[operator]["skills"], orders[order_id]["required_skills"])
+                and operator is not None and index.is_candidate(operator, order_id)
                 ):
-                child["orders"][order_id] = {"operator": operator, "day": day, "status": status}
+                child["orders"][order_id] = order_data    # Alocação compartilhada com o pai.
                 assigned_orders.add(order_id)
 
     # Segundo segmento: Copia as ordens do pai 2 após o ponto de crossover.
@@ -114,40 +129,35 @@ def crossover(parent1, parent2, operators, orders, max_days):
         if order_id in parent2["orders"]:
             order_data = parent2["orders"][order_id]
             operator = order_data["operator"]
-            day = order_data["day"]
-            status = order_data["status"]
 
             # Verifica se o operador é compatível e a ordem não foi atribuída.
             if (order_id not in assigned_orders
-                and meets_minimum_skills(operators[operator]["skills"], orders[order_id]["required_skills"])
+                and operator is not None and index.is_candidate(operator, order_id)
             ):
-                child["orders"][order_id] = {"operator": operator, "day": day, "status": status}
+                child["orders"][order_id] = order_data    # Alocação compartilhada com o pai.
                 assigned_orders.add(order_id)
 
     # Atribui ordens "não atribuídas", aleatoriamente.
     for order_id in orders.keys():
         if order_id not in assigned_orders:
-            random_operator = random.choice(list(operators.keys()))
+            # Sorteia apenas entre os operadores compatíveis.
+            random_operator = random.choice(index.candidate_operators(order_id))
             random_day = random.randint(1, max_days)
             
             # Calcula a quantidade de dias em atraso, se late_order > 0 = atraso.. 
-            late_order = random_day - order_data["expected_start_day"]
+            late_order = random_day - orders[order_id]["expected_start_day"]
             new_status = "atrasada" if late_order > 0 else "atendida"
 
-            # Garante que o operador é compatível.
-            while not meets_minimum_skills(operators[random_operator]["skills"], orders[order_id]["required_skills"]):
-                random_operator = random.choice(list(operators.keys()))
-
             child["orders"][order_id] = {"operator": random_operator, "day": random_day, "status": new_status}
             assigned_orders.add(order_id)
 
     # Recalcula o fitness para o novo individuo sendo criado.
-    child["fitness"] = calculate_fitness(child, operators, orders, max_days)
+    child["fitness"] = calculate_fitness(child, operators, orders, max_days, index)
 
     return child
 
 # Função para realizar a mutação em um novo indivíduo
-def mutate(solution, operators, orders, mutation_rate, max_days):
+def mutate(solution, operators, orders, mutation_rate, max_days, index=None, stats=None):
     """
     Realiza a mutação em uma solução, aceitando apenas mutações benéficas.
 
@@ -156,6 +166,8 @@ def mutate(solution, operators, orders, mutation_rate, max_days):
         operators (dict): Dicionário de operadores, contendo suas habilidades e horários.
         orders (dict): Dicionário de ordens de serviço, contendo as habilidades necessárias, horas estimadas, etc.
         mutation_rate (float): Taxa de mutação, indicando a probabilidade de ocorrer uma mutação (entre 0 e 1).
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
+        stats (dict, opcional): Contadores {"attempted", "accepted"} somados com as mutações sorteadas e aceitas.
 
     Returns:
         mutated: A solução mutada, se a mutação for benéfica, caso contrário, retorna a solução original.
@@ -164,19 +176,36 @@ def mutate(solution, operators, orders, mutation_rate, max_days):
     - A mutação é realizada trocando ordens aleatórias entre dois operadores no mesmo dia.
     - Verifica se na mutação realizada, as habilidades do operador atendem os requisitos da ordem.
     - A solução é validada antes e depois da mutação, e se a mutação não melhorar a aptidão, ela é desfeita.
+    - Se a solução for um cromossomo compacto, a mutação é feita diretamente sobre os vetores.
     """
-    # Faz uma cópia profunda da solução para evitar alterações na original.
-    mutated = copy.deepcopy(solution)
+    if isinstance(solution, Chromosome):
+        return _mutate_chromosome(solution, mutation_rate, stats)
+
+    if index is None:
+        index = EligibilityIndex(operators, orders)
+
+    # Copia apenas o dicionário externo: as alocações das ordens não alteradas são compartilhadas com a
+    # solução original, e as alteradas recebem um dicionário novo (nunca são modificadas no lugar).
+    mutated = {"orders": dict(solution["orders"]), "fitness": solution["fitness"]}
 
     # Garantir que o fitness original esteja definido.
     original_fitness = solution["fitness"]
     if original_fitness is None:
         raise ValueError("O fitness original não pode ser None. Verifique a função de cálculo de aptidão.")
 
+    # Horas por operador e dia da solução atual, atualizadas a cada mutação aceita.
+    ledger = CapacityLedger([operators[op_id]["hours_per_day"] for op_id in index.operator_ids], max_days)
+    for order_id, allocation in solution["orders"].items():
+        if allocation["operator"] is not None:
+            ledger.add(index.operator_position[allocation["operator"]], allocation["day"],
+                       orders[order_id]["estimated_hours"])
 
     # Aplica mutações em ordens individuais com base na taxa de mutação.
+    mutated_fitness = original_fitness
+    attempted = accepted = 0
     for order_id, allocation in solution["orders"].items():
         if random.random() < mutation_rate:
+            attempted += 1
             current_day = allocation["day"]
             current_operator = allocation["operator"]
             current_status = allocation["status"]
@@ -184,88 +213,147 @@ def mutate(solution, operators, orders, mutation_rate, max_days):
 
             # Seleciona um novo operador e um novo dia aleatoriamente.
             new_day = random.randint(1, max_days)
-            new_operator = random.choice(list(operators.keys()))
+            new_operator = random.choice(index.operator_ids)
 
             # Verifica se o novo operador atende às habilidades necessárias para a ordem.
-            if meets_minimum_skills(operators[new_operator]["skills"], orders[order_id]["required_skills"]):
-                # Atualiza temporariamente a alocação para o novo operador e dia.
-                mutated["orders"][order_id] = {"day": new_day, "operator": new_operator, "status": None}
-
-                # Atualiza o status da ordem.
-                mutated["orders"][order_id]["status"] = "atendida" if new_day <= expected_start_day else "atrasada"
-                
-                # Calcula a aptidão antes e depois da mutação.
-                new_fitness = calculate_fitness(mutated, operators, orders, max_days)
-
-                # Garantir que `new_fitness` seja válido.
-                if new_fitness is None:
-                    raise ValueError("O cálculo de aptidão retornou None. Verifique a função de cálculo de aptidão.")
-
-                # Se a mutação não melhorar a aptidão, desfaz a alteração.
-                if new_fitness < original_fitness:
-                    mutated["orders"][order_id] = {
-                        "day": current_day, 
-                        "operator": current_operator, 
-                        "status": current_status
-                        }
-                else:
-                    # Atualiza o fitness da solução mutada.
-                    mutated["fitness"] = new_fitness    
-                    
+            if index.is_candidate(new_operator, order_id):
+                new_status = "atendida" if new_day <= expected_start_day else "atrasada"
+
+                # Variação do fitness em O(1): pontuação da ordem antes e depois, e horas extras das duas células.
+                from_operator = index.operator_position[current_operator] if current_operator is not None else UNASSIGNED
+                to_operator = index.operator_position[new_operator]
+                hours = orders[order_id]["estimated_hours"]
+                delta = (_order_score(order_id, new_operator, new_day, new_status, orders, index)
+                         - _order_score(order_id, current_operator, current_day, current_status, orders, index)
+                         - 5 * ledger.move_excess_delta(from_operator, current_day, to_operator, new_day, hours))
+
+                # Se a mutação não melhorar a aptidão, ela é descartada.
+                if mutated_fitness + delta < original_fitness:
+                    continue
+
+                # Aplica a mutação e atualiza o fitness e o registro de horas.
+                mutated["orders"][order_id] = {"day": new_day, "operator": new_operator, "status": new_status}
+                ledger.move(from_operator, current_day, to_operator, new_day, hours)
+                mutated_fitness += delta
+                accepted += 1
+
+    mutated["fitness"] = mutated_fitness
+    if stats is not None:
+        stats["attempted"] += attempted
+        stats["accepted"] += accepted
     return mutated
 
-# Converte os dados de exemplo em dataframe para facilitar a visualização
-def op_orders_to_dataframe(operators, orders):
+def _order_score(order_id, operator_id, day, status, orders, index):
     """
-    Converte os dados simulados de operadores e ordens de serviço em DataFrames.
-
-    Args:
-        operators (dict): Dicionário com dados dos operadores, incluindo suas habilidades, turnos e horas de trabalho.
-        service_orders (dict): Dicionário com ordens de serviço, incluindo habilidades exigidas, horas estimadas, prioridade, inicio_esperado e status.
+    Parcela de uma ordem no fitness (compatibilidade e atraso ponderados pela prioridade), como em `calculate_fitness`.
+    """
+    if operator_id is None:
+        return 0
+
+    meets_minimum, match_percentage = index.meets_minimum(operator_id, order_id)
+    priority_multiplier = priority_to_number(orders[order_id]["priority"])
+    score = (10 * match_percentage if meets_minimum else -10) * priority_multiplier
+    if status == "atrasada":
+        score -= 5 * max(0, day - orders[order_id]["expected_start_day"]) * priority_multiplier
+    return score
+
+# Versões das operações genéticas sobre cromossomos compactos
+def _create_initial_chromosome(layout):
+    """
+    Cria um cromossomo aleatório, sorteando para cada ordem um dia e um operador elegível.
+    """
+    positions = np.arange(layout.n_orders)
+    operator = layout.random_eligible_operators(positions)
+    day = layout.random_days(layout.n_orders)
+    return Chromosome(layout, operator, day)
 
-    Returns:
-        tuple: Um tuple contendo dois DataFrames:
-            - operators_df: DataFrame com os dados dos operadores.
-            - service_orders_df: DataFrame com os dados das ordens de serviço.
+def _crossover_chromosomes(parent1, parent2):
+    """
+    Crossover de um ponto entre dois cromossomos, realocando genes sem operador compatível.
+    """
+    layout = parent1.layout
+    crossover_point = random.randint(1, max(1, layout.n_orders - 1))
+
+    # Primeiro segmento do pai 1 e segundo segmento do pai 2.
+    operator = np.concatenate((parent1.operator[:crossover_point], parent2.operator[crossover_point:]))
+    day = np.concatenate((parent1.day[:crossover_point], parent2.day[crossover_point:]))
+
+    # Genes não atribuídos ou com operador incompatível são sorteados novamente.
+    positions = np.arange(layout.n_orders)
+    invalid = positions[(operator == UNASSIGNED) | ~layout.is_allowed(operator, positions)]
+    if invalid.size:
+        operator[invalid] = layout.random_eligible_operators(invalid)
+        day[invalid] = layout.random_days(invalid.size)
+
+    child = Chromosome(layout, operator, day)
+    child.evaluate()
+    return child
 
-    Detalhes:
-    - O DataFrame dos operadores inclui as colunas: 'operator_id', 'skills', 'level', 'shift', 'hours_per_day'.
-    - O DataFrame das ordens de serviço inclui as colunas: 'order_id', 'required_skills', 'estimated_hours', 'priority', 
-        'expected_start_day', 'status'.
+def _mutate_chromosome(solution, mutation_rate, stats=None):
     """
+    Mutação de um cromossomo, aceitando apenas mutações que não pioram a aptidão original.
+    A variação do fitness de cada mutação é calculada em O(1) a partir das parcelas das ordens
+    e do registro de horas por operador e dia.
+    """
+    original_fitness = solution.fitness
+    if original_fitness is None:
+        raise ValueError("O fitness original não pode ser None. Verifique a função de cálculo de aptidão.")
 
-    # Converte os operadores em um DataFrame
-    operators_data = []
-    for operator_id, details in operators.items():
-        operators_data.append({
-            "id_operador": operator_id,
-            "habilidades_operador": " | ".join(details["skills"]),
-            "nivel_operador": details["level"],
-            "turno": details["shift"],
-            "horas_disponiveis": details["hours_per_day"]
-        })
-
-    operators_df = pd.DataFrame(operators_data)
-
-    # Converte as ordens de serviço em um DataFrame
-    service_orders_data = []
-    for order_id, details in orders.items():
-        service_orders_data.append({
-            "id_ordem": order_id,
-            "Serviços": " | ".join(details["required_skills"]),
-            "horas_estimadas": details["estimated_hours"],
-            "prioridade": details["priority"],
-            "inicio_esperado": details["expected_start_day"],
-            "status": details["status"],
-        })
-
-    service_orders_df = pd.DataFrame(service_orders_data)
-
-    return operators_df, service_orders_df
+    mutated = solution.copy()
+    layout = mutated.layout
+
+    # Sorteia de uma vez os genes que sofrem mutação e seus novos valores.
+    positions = np.flatnonzero(rng.random(layout.n_orders) < mutation_rate)
+    if stats is not None:
+        stats["attempted"] += positions.size
+    new_days = layout.random_days(positions.size)
+    new_operators = rng.integers(0, layout.n_operators, size=positions.size).astype(OPERATOR_DTYPE)
+
+    # Descarta os sorteios com operador incompatível e pontua os novos genes de uma vez.
+    allowed = layout.is_allowed(new_operators, positions)
+    positions, new_days, new_operators = positions[allowed], new_days[allowed], new_operators[allowed]
+    if positions.size == 0:
+        return mutated
+    new_scores = layout.gene_scores(new_operators, new_days, positions)
+
+    # Parcelas atuais das ordens e horas por operador e dia.
+    current_scores = layout.gene_scores(mutated.operator, mutated.day, np.arange(layout.n_orders))
+    ledger = CapacityLedger.from_assignment(layout.hours_per_day, layout.max_days,
+                                            mutated.operator, mutated.day, layout.estimated_hours)
+
+    mutated_fitness = original_fitness
+    accepted = 0
+    for position, new_day, new_operator, new_score in zip(positions.tolist(), new_days.tolist(),
+                                                          new_operators.tolist(), new_scores.tolist()):
+        current_operator, current_day = int(mutated.operator[position]), int(mutated.day[position])
+        hours = int(layout.estimated_hours[position])
+
+        delta = (new_score - current_scores[position]
+                 - 5 * ledger.move_excess_delta(current_operator, current_day, new_operator, new_day, hours))
+
+        # Se a mutação piorar a aptidão, ela é descartada.
+        if mutated_fitness + delta < original_fitness:
+            continue
+
+        # Os vetores do pai só são duplicados na primeira mutação aceita.
+        mutated.set_gene(position, new_operator, new_day)
+        ledger.move(current_operator, current_day, new_operator, new_day, hours)
+        mutated_fitness += delta
+        accepted += 1
+
+    mutated.fitness = mutated_fitness
+    if stats is not None:
+        stats["accepted"] += accepted
+
+    # Com pontuações não múltiplas de 0.5 a soma incremental pode diferir nos últimos bits; recalcula uma vez.
+    if not layout.exact_scores:
+        mutated.evaluate()
+    return mutated
 
 # Função para executar o algoritmo genético no proprio arquivo
 def run_genetic_algorithm(operators, orders, population_size=50, generations=100, 
-                          mutation_rate=0.4, elitism_size=5, reinitalize_interval=10, days=5):
+                          mutation_rate=0.4, elitism_size=5, reinitalize_interval=10, days=5,
+                          trace_path=None, profile_generations=None, profile_path=None):
     """
     Executa o algoritmo genético, evoluindo uma população de soluções ao longo de várias gerações.
 
@@ -277,6 +365,9 @@ def run_genetic_algorithm(operators, orders, population_size=50, generations=100
         mutation_rate (float): Taxa de mutação.
         elitism_size (int): Tamanho da elite, ou seja, o número de melhores soluções que são mantidas.
         reinitalize_interval (int): Intervalo de gerações para reinicializar parte da população.
+        trace_path (str, opcional): Arquivo .json ou .csv com o tempo das fases e as métricas de cada geração.
+        profile_generations (tuple, opcional): Intervalo (primeira, última) de gerações analisadas com o cProfile.
+        profile_path (str, opcional): Arquivo onde as estatísticas do cProfile são salvas.
 
     Returns:
         pd.DataFrame: DataFrame contendo a melhor solução após as gerações.
@@ -286,57 +377,27 @@ def run_genetic_algorithm(operators, orders, population_size=50, generations=100
     - Em cada geração, os melhores pais são selecionados para realizar o crossover e gerar novos filhos.
     - O algoritmo utiliza a mutação, elitismo e re-inicialização periódica da população.
     """
+    # Importado aqui para evitar importação circular (o motor usa as funções deste módulo).
+    from .genetic_engine import GeneticEngine
+
     # Inicializa operadores e ordens iniciais.
     operators, orders = create_initial_data(orders, operators)
     
-    # Gera populaçao inicial com base nos operadores e ordens iniciais.
-    population = [create_initial_solution(operators, orders, days) 
-                  for _ in range(population_size)]
-
-    # Salva os melhores fitness e geraçoes para plottar.
-    best_fitness_values = []
-    best_schedules = []
-
-    for generation in range(generations):
-                
-        # Ajuste na taxa de mutação conforme o número da geração
-        mutation_rate = mutation_rate - (generation / generations) * 0.05  # Reduz a taxa de mutação
-        if mutation_rate < 0.05:
-            mutation_rate = 0.05  # Taxa mínima de mutação
-
-        # population = sorted(population, key=calculate_fitness).
-        population = sorted(population, reverse=True, key=lambda individual: 
-                            calculate_fitness(individual, operators, orders))
-
-        # Exibição da aptidão da melhor solução da geração.
-        best_fitness = calculate_fitness(population[0], operators, orders)
-        best_schedule = population[0]
-        best_fitness_values.append(best_fitness)
-        best_schedules.append(best_schedule)
-        
-        # Geração da nova população.
-        new_population = [population[0]]    # Preserva o melhor indivíduo (elitismo)
-        while len(new_population) < population_size:
-            parent1, parent2 = random.choices(population[:elitism_size], k=2)
-            child = crossover(parent1, parent2, operators, orders, days)
-            child = mutate(child, operators, orders, mutation_rate, days)
-            new_population.append(child)
-
-        # Reinicialização da população a cada 'reinitalize_interval' gerações.
-        # Esta função aumenta a variabilidade na população, trocando a metade da populaçao com menor fit.
-        if generation % reinitalize_interval == 0:
-            num_to_reinitialize = population_size // 2
-            new_population[-num_to_reinitialize:] = [
-                create_initial_solution(operators, orders, days) 
-                for _ in range(num_to_reinitialize)]
-
-        population = new_population
-
-    # Após as gerações, mostra a melhor solução.
-    best_solution = max(best_schedules, key=lambda solution: 
-                            calculate_fitness(solution, operators, orders))
+    # Medição das fases das gerações, apenas quando pedida.
+    profiler = None
+    if trace_path or profile_generations:
+        from .generation_profiler import GenerationProfiler
+        profiler = GenerationProfiler(profile_generations, profile_path)
+
+    # Executa as gerações no motor do algoritmo genético, com taxa de mutação decrescente.
+    engine = GeneticEngine(operators, orders, days, population_size, generations, mutation_rate,
+                           elitism_size, reinitalize_interval, mutation_decay=True, profiler=profiler)
+    best_solution = engine.run()
+    if trace_path:
+        profiler.write(trace_path)
     
-    print(f"\nBest solution fitness: {calculate_fitness(best_solution, operators, orders):.2f}")
+    print(f"\nBest solution fitness: {best_solution['fitness']:.2f}")
+    print("Fitness cache:", engine.fitness_cache.stats())
 
     # Conversão dos dados da melhor solução encontrada em Dataframe.
     final_df, unassigned_orders = solution_to_dataframe(best_solution, operators, orders)
@@ -0,0 +1,227 @@
+import random
+from .common_functions import solution_to_dataframe
+from .eligibility import EligibilityIndex
+from .chromosome import GenomeLayout
+from .fitness_cache import FitnessCache
+from .generation_profiler import no_phase
+from .genetic_algorithm import create_initial_solution, crossover, mutate
+
+class GeneticEngine:
+    """
+    Motor do algoritmo genético, independente de interface gráfica.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        days (int): Número de dias do planejamento.
+        population_size (int): Tamanho da população de soluções.
+        generations (int): Número de gerações de uma execução completa (`run`).
+        mutation_rate (float): Taxa de mutação.
+        elitism_size (int): Número de melhores soluções usadas como pais.
+        reinitialize_interval (int): Intervalo de gerações para reinicializar metade da população.
+        compact_genome (bool): Usa cromossomos compactos (True) ou soluções em dicionário (False).
+        mutation_decay (bool): Reduz a taxa de mutação ao longo das gerações (mínimo de 0.05).
+        fitness_cache_size (int): Quantidade máxima de genomas no cache de fitness.
+        index (EligibilityIndex, opcional): Índice de elegibilidade já construído para a instância.
+        workers (int): Número de processos para gerar os filhos em paralelo (1 = no próprio processo).
+        profiler (GenerationProfiler, opcional): Mede o tempo de cada fase das gerações e registra as métricas.
+
+    Detalhes:
+    - `step` executa uma geração: ordena a população pelo fitness, guarda o melhor indivíduo, gera os filhos
+      a partir da elite (crossover + mutação) e reinicializa metade da população a cada `reinitialize_interval`.
+    - `run` executa gerações até completar `generations`, sem nenhum limite de quadros por segundo.
+    - Funções registradas com `add_callback` são chamadas ao fim de cada geração com o próprio motor,
+      o que permite acoplar observadores (pygame, logs, métricas) sem alterar o loop.
+    - Com `workers` > 1, os pais continuam sorteados no processo principal e os filhos são gerados e avaliados
+      em um pool de processos (`OffspringPool`), criado na primeira geração. Use `close` (ou `with`) ao final.
+    - `mutation_stats` conta as mutações sorteadas e aceitas (apenas as feitas no próprio processo).
+    """
+
+    def __init__(self, operators, orders, days=5, population_size=50, generations=50, mutation_rate=0.3,
+                 elitism_size=5, reinitialize_interval=10, compact_genome=True, mutation_decay=False,
+                 fitness_cache_size=4096, index=None, workers=1, profiler=None):
+        self.operators = operators
+        self.orders = orders
+        self.days = days
+        self.population_size = population_size
+        self.generations = generations
+        self.mutation_rate = mutation_rate
+        self.elitism_size = elitism_size
+        self.reinitialize_interval = reinitialize_interval
+        self.mutation_decay = mutation_decay
+        self.workers = workers
+        self.offspring_pool = None
+        self.profiler = profiler
+        self.mutation_stats = {"attempted": 0, "accepted": 0}
+
+        self.index = index if index is not None else EligibilityIndex(operators, orders)
+        self.layout = GenomeLayout(operators, orders, days, self.index)
+        self.genome_layout = self.layout if compact_genome else None
+        self.fitness_cache = FitnessCache(maxsize=fitness_cache_size)
+
+        # Histórico dos melhores fitness e soluções de cada geração.
+        self.generation = 0
+        self.best_fitness_values = []
+        self.best_schedules = []
+        self.best_solution = None
+        self.callbacks = []
+
+        # Gera a população inicial.
+        self.population = [self.new_individual() for _ in range(population_size)]
+
+    @property
+    def finished(self):
+        return self.generation >= self.generations
+
+    @property
+    def best_fitness(self):
+        return self.best_solution["fitness"] if self.best_solution is not None else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Encerra o pool de processos da geração paralela de filhos, se existir, e o cProfile ainda ativo.
+        """
+        if self.offspring_pool is not None:
+            self.offspring_pool.close()
+            self.offspring_pool = None
+        if self.profiler is not None:
+            self.profiler.close()
+
+    def add_callback(self, callback):
+        """
+        Registra uma função chamada ao fim de cada geração, com a assinatura `callback(engine)`.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def new_individual(self):
+        return create_initial_solution(self.operators, self.orders, self.days, self.genome_layout, self.index)
+
+    def step(self):
+        """
+        Executa uma geração do algoritmo genético.
+
+        Returns:
+            float: O fitness do melhor indivíduo da geração.
+        """
+        self.generation += 1
+        profiler = self.profiler
+        phase = profiler.phase if profiler is not None else no_phase
+        if profiler is not None:
+            profiler.start_generation(self.generation)
+            evaluations, hits = self.fitness_cache.evaluations, self.fitness_cache.hits
+            attempted, accepted = self.mutation_stats["attempted"], self.mutation_stats["accepted"]
+
+        # Ajuste na taxa de mutação conforme o número da geração.
+        if self.mutation_decay:
+            self.mutation_rate = max(0.05, self.mutation_rate - ((self.generation - 1) / self.generations) * 0.05)
+
+        # Avalia apenas os indivíduos ainda não pontuados e ordena pelo fitness.
+        with phase("evaluate"):
+            self.fitness_cache.evaluate(self.population, self.layout)
+        with phase("sort"):
+            population = sorted(self.population, reverse=True, key=lambda individual: individual["fitness"])
+
+        # Guarda a melhor solução da geração.
+        best_schedule = population[0]
+        self.best_fitness_values.append(best_schedule["fitness"])
+        self.best_schedules.append(best_schedule)
+        if self.best_solution is None or best_schedule["fitness"] > self.best_solution["fitness"]:
+            self.best_solution = best_schedule
+
+        # Geração da nova população.
+        new_population = [population[0]]    # Preserva o melhor indivíduo (elitismo)
+        if self.workers > 1:
+            with phase("parallel_offspring"):
+                new_population.extend(self._parallel_offspring(population[:self.elitism_size]))
+        while len(new_population) < self.population_size:
+            with phase("selection"):
+                parent1, parent2 = random.choices(population[:self.elitism_size], k=2)
+            with phase("crossover"):
+                child = crossover(parent1, parent2, self.operators, self.orders, self.days, self.index)
+            with phase("mutate"):
+                child = mutate(child, self.operators, self.orders, self.mutation_rate, self.days, self.index,
+                               self.mutation_stats)
+            self.fitness_cache.store(child)
+            new_population.append(child)
+        children = len(new_population) - 1
+
+        # Reinicialização da metade da população com menor fitness, para aumentar a variabilidade.
+        with phase("sort"):
+            new_population = sorted(new_population, reverse=True, key=lambda individual: individual["fitness"])
+        if self.generation % self.reinitialize_interval == 0:
+            with phase("reinitialize"):
+                num_to_reinitialize = self.population_size // 2
+                new_population[-num_to_reinitialize:] = [self.new_individual() for _ in range(num_to_reinitialize)]
+                self.fitness_cache.evaluate(new_population[-num_to_reinitialize:], self.layout)
+
+        self.population = new_population
+
+        for callback in self.callbacks:
+            callback(self)
+
+        if profiler is not None:
+            # Avaliações completas: os genomas avaliados pelo cache e os filhos (avaliados no crossover).
+            parallel = self.workers > 1
+            profiler.end_generation(
+                best_fitness=best_schedule["fitness"],
+                fitness_evaluations=self.fitness_cache.evaluations - evaluations + children,
+                cache_hits=self.fitness_cache.hits - hits,
+                mutations_attempted=None if parallel else self.mutation_stats["attempted"] - attempted,
+                mutations_accepted=None if parallel else self.mutation_stats["accepted"] - accepted,
+            )
+
+        return best_schedule["fitness"]
+
+    def _parallel_offspring(self, elite):
+        """
+        Sorteia os pais de todos os filhos da geração e gera os filhos no pool de processos.
+        """
+        if self.offspring_pool is None:
+            # Importado aqui: o módulo só é necessário no modo paralelo.
+            from .parallel_offspring import OffspringPool
+            self.offspring_pool = OffspringPool(self.operators, self.orders, self.days,
+                                                self.genome_layout, self.workers)
+
+        # Mesmo sorteio de `random.choices(elite, k=2)`, feito sobre os índices dos pais.
+        positions = range(len(elite))
+        pairs = [tuple(random.choices(positions, k=2)) for _ in range(self.population_size - 1)]
+
+        children = self.offspring_pool.generate(elite, pairs, self.mutation_rate)
+        for child in children:
+            self.fitness_cache.store(child)
+        return children
+
+    def run(self, generations=None):
+        """
+        Executa gerações até completar o total configurado (ou `generations` gerações a mais, se informado).
+
+        Returns:
+            dict ou Chromosome: A melhor solução encontrada.
+        """
+        target = self.generations if generations is None else self.generation + generations
+        completed = False
+        try:
+            while self.generation < target:
+                self.step()
+            completed = True
+        finally:
+            # Execução terminada ou interrompida: o perfil das gerações já cobertas é salvo.
+            if self.profiler is not None and (self.finished or not completed):
+                self.profiler.close()
+        return self.best_solution
+
+    def cache_stats(self):
+        return self.fitness_cache.stats()
+
+    def best_solution_dataframe(self):
+        """
+        Converte a melhor solução encontrada em DataFrame (ver `solution_to_dataframe`).
+        """
+        return solution_to_dataframe(self.best_solution, self.operators, self.orders)
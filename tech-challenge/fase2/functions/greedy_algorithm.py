@@ -1,6 +1,9 @@
+import numpy as np
 from .common_functions import *
+from .candidate_queues import first_fit_allocation
+from .instance_table import order_values
 
-def greedy_allocation(operators, orders, days=5):
+def greedy_allocation(operators, orders, days=5, index=None):
     """
     Realiza a alocação de ordens de serviço usando o algoritmo guloso.
 
@@ -8,38 +11,20 @@ def greedy_allocation(operators, orders, days=5):
         operators (dict): Dicionário de operadores, contendo suas habilidades e horários.
         orders (dict): Dicionário de ordens de serviço, contendo as habilidades necessárias, horas estimadas, etc.
         days (int): Número de dias do planejamento.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
 
     Returns:
         dict: Solução de alocação de ordens a operadores por dia.
-    """
-    # Ordena as ordens de serviço por prioridade (decrescente) e prazo (crescente)
-    sorted_orders = sorted(orders.items(), key=lambda x: (-priority_to_number(x[1]['priority']), x[1]['expected_start_day']))
-
-    # Inicializa a solução
-    solution = {
-        "orders": {},
-        "fitness": 0
-    }
 
-    # Atribui cada ordem ao operador mais adequado disponível
-    for order_id, order in sorted_orders:
-        assigned = False
-        for day in range(1, days+1):
-            for operator_id, operator in operators.items():
-                if meets_minimum_skills(operator["skills"], order["required_skills"]):
-                    # Verifica se o operador tem horas disponíveis no dia
-                    total_hours = sum(
-                        order["estimated_hours"]
-                        for assigned_order_id, order in orders.items()
-                        if assigned_order_id in solution["orders"] and
-                           solution["orders"][assigned_order_id]["operator"] == operator_id and
-                           solution["orders"][assigned_order_id]["day"] == day
-                    )
-                    if total_hours + order["estimated_hours"] <= operator["hours_per_day"]:
-                        solution["orders"][order_id] = {"day": day, "operator": operator_id, "status": "atendida"}
-                        assigned = True
-                        break
-            if assigned:
-                break
+    Detalhes:
+    - Cada ordem vai para o primeiro dia e, nele, para o primeiro operador elegível com horas livres
+      (ver `first_fit_allocation`).
+    """
+    # Ordena as ordens de serviço por prioridade (decrescente) e prazo (crescente), com ordenação estável
+    # sobre os vetores das ordens.
+    order_ids = list(orders)
+    sorted_positions = np.lexsort((order_values(orders, "expected_start_day"), -order_values(orders, "priority_number")))
 
-    return solution
+    # Atribui cada ordem ao primeiro operador elegível com horas livres, dia a dia, com as horas
+    # controladas incrementalmente por operador e dia.
+    return first_fit_allocation(operators, orders, [order_ids[i] for i in sorted_positions.tolist()], days, index)
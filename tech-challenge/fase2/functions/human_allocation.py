@@ -1,6 +1,9 @@
+import numpy as np
 from .common_functions import *
+from .candidate_queues import first_fit_allocation
+from .instance_table import order_values
 
-def human_allocation(operators, orders, days=5):
+def human_allocation(operators, orders, days=5, index=None):
     """
     Realiza a alocação de ordens de serviço separando-as em grupos de prioridade e atribuindo-as aos operadores.
 
@@ -8,48 +11,16 @@ def human_allocation(operators, orders, days=5):
         operators (dict): Dicionário de operadores, contendo suas habilidades e horários.
         orders (dict): Dicionário de ordens de serviço, contendo as habilidades necessárias, horas estimadas, etc.
         days (int): Número de dias do planejamento.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
 
     Returns:
         dict: Solução de alocação de ordens a operadores por dia.
     """
-    # Inicializa a solução
-    # solution = {day: {op: [] for op in operators.keys()} for day in range(days)}
-    solution = {
-        "orders": {},
-        "fitness": 0
-    }
-
-    # Separa as ordens em grupos de prioridade
-    priority_groups = {}
-    for order_id, order in orders.items():
-        priority = order['priority']
-        if priority not in priority_groups:
-            priority_groups[priority] = []
-        priority_groups[priority].append((order_id, order))
-
-    # Ordena as prioridades (do mais alto para o mais baixo)
-    sorted_priorities = sorted(priority_groups.keys(), key=priority_to_number, reverse=True)
+    # Separa as ordens em grupos de prioridade, do mais alto para o mais baixo: a ordenação estável pela
+    # prioridade mantém, dentro de cada grupo, a ordem original das ordens.
+    order_ids = list(orders)
+    sorted_positions = np.argsort(-order_values(orders, "priority_number"), kind="stable")
 
     # Atribui cada ordem ao operador mais adequado disponível, por grupo de prioridade
-    for priority in sorted_priorities:
-        for order_id, order in priority_groups[priority]:
-            assigned = False
-            for day in range(1, days+1):
-                for operator_id, operator in operators.items():
-                    if meets_minimum_skills(operator["skills"], order["required_skills"]):
-                        # Verifica se o operador tem horas disponíveis no dia
-                        total_hours = sum(
-                            order["estimated_hours"]
-                            for assigned_order_id, order in orders.items()
-                            if assigned_order_id in solution["orders"] and
-                            solution["orders"][assigned_order_id]["operator"] == operator_id and
-                            solution["orders"][assigned_order_id]["day"] == day
-                        )
-                        if total_hours + order["estimated_hours"] <= operator["hours_per_day"]:
-                            solution["orders"][order_id] = {"day": day, "operator": operator_id, "status": "atendida"}
-                            assigned = True
-                            break
-                if assigned:
-                    break
-
-    return solution
+    sorted_order_ids = [order_ids[i] for i in sorted_positions.tolist()]
+    return first_fit_allocation(operators, orders, sorted_order_ids, days, index)
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from .instance_table import OrderTable, OperatorTable, PRIORITIES, LEVELS
+
+# Valores padrão, os mesmos de `create_initial_data`.
+DEFAULT_SKILLS = ("pintura", "elétrica", "alvenaria", "hidráulica", "solda")
+DEFAULT_SHIFTS = ("manhã", "tarde", "noite")
+
+# Linhas sorteadas por vez ao montar os conjuntos de habilidades (limita a memória das chaves aleatórias).
+_BLOCK_SIZE = 1_000_000
+
+def _draw(rng, spec, size):
+    """
+    Sorteia `size` valores inteiros a partir de uma distribuição.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        spec (tuple ou dict): (mínimo, máximo) para valores uniformes no intervalo fechado,
+                              ou {valor: peso} para uma distribuição discreta.
+        size (int): Quantidade de valores.
+    """
+    if isinstance(spec, dict):
+        values = np.array(list(spec), dtype=np.int64)
+        weights = np.array(list(spec.values()), dtype=np.float64)
+        return values[rng.choice(len(values), size=size, p=weights / weights.sum())]
+    low, high = spec
+    return rng.integers(low, high + 1, size=size, dtype=np.int64)
+
+def _draw_codes(rng, categories, weights, size):
+    """
+    Sorteia as posições (códigos) de `size` valores em `categories`, uniformes ou com os pesos {categoria: peso}.
+    """
+    if weights is None:
+        return rng.integers(0, len(categories), size=size, dtype=np.int64)
+    p = np.array([weights.get(category, 0) for category in categories], dtype=np.float64)
+    return rng.choice(len(categories), size=size, p=p / p.sum())
+
+def _draw_skill_sets(rng, skills, skill_weights, counts, size):
+    """
+    Sorteia, sem repetição dentro de cada linha, as habilidades de `size` ordens ou operadores.
+
+    Returns:
+        tuple: (conjuntos distintos de habilidades, na ordem da primeira ocorrência; código do conjunto de cada linha)
+
+    Detalhes:
+    - A amostragem ponderada sem reposição usa chaves exponenciais divididas pelos pesos (as menores chaves
+      de cada linha são as habilidades sorteadas), então a linha inteira é sorteada de uma vez.
+    - Cada conjunto é codificado como um inteiro (habilidades em base len(skills) + 1) para agrupar os conjuntos
+      repetidos sem criar tuplas por linha.
+    """
+    weights = (np.ones(len(skills)) if skill_weights is None
+               else np.array([skill_weights.get(skill, 0) for skill in skills], dtype=np.float64))
+    count = _draw(rng, counts, size)
+    max_count = int(count.max()) if size else 0
+    if max_count > np.count_nonzero(weights):
+        raise ValueError(f"Não há habilidades suficientes para sortear {max_count} habilidades distintas.")
+
+    base = len(skills) + 1
+    key = np.zeros(size, dtype=np.int64)
+    for start in range(0, size, _BLOCK_SIZE):
+        stop = min(start + _BLOCK_SIZE, size)
+        with np.errstate(divide="ignore"):
+            ranks = rng.exponential(size=(stop - start, len(skills))) / weights
+        chosen = np.argsort(ranks, axis=1)[:, :max_count]
+        for position in range(max_count):
+            used = position < count[start:stop]
+            key[start:stop] += np.where(used, (chosen[:, position] + 1) * base ** position, 0)
+
+    codes, distinct = pd.factorize(key)
+    skill_sets = []
+    for value in distinct.tolist():
+        skill_set = []
+        while value:
+            value, digit = divmod(value, base)
+            skill_set.append(skills[digit - 1])
+        skill_sets.append(tuple(skill_set))
+    return skill_sets, codes.astype(np.int64)
+
+def generate_instance(n_orders, n_operators, seed=None, skills=DEFAULT_SKILLS, skill_weights=None,
+                      order_skill_counts=(1, 2), operator_skill_counts=(2, 3), estimated_hours=(2, 8),
+                      priority_weights=None, start_days=(1, 5), level_weights=None, shifts=DEFAULT_SHIFTS,
+                      hours_per_day=(7, 9), as_table=True):
+    """
+    Gera operadores e ordens de serviço aleatórios com NumPy, de forma vetorizada e reproduzível.
+
+    Args:
+        n_orders (int): Número de ordens de serviço.
+        n_operators (int): Número de operadores.
+        seed (int, opcional): Semente do gerador (a mesma semente gera sempre a mesma instância).
+        skills (tuple): Habilidades possíveis.
+        skill_weights (dict, opcional): Popularidade de cada habilidade {habilidade: peso} (padrão: uniforme).
+        order_skill_counts (tuple ou dict): Quantidade de habilidades de cada ordem.
+        operator_skill_counts (tuple ou dict): Quantidade de habilidades de cada operador.
+        estimated_hours (tuple ou dict): Horas estimadas das ordens.
+        priority_weights (dict, opcional): Peso de cada prioridade {prioridade: peso} (padrão: uniforme).
+        start_days (tuple ou dict): Dia esperado de início das ordens.
+        level_weights (dict, opcional): Peso de cada nível dos operadores (padrão: uniforme).
+        shifts (tuple): Turnos possíveis, sorteados de forma uniforme.
+        hours_per_day (tuple ou dict): Horas disponíveis por dia dos operadores.
+        as_table (bool): Retorna `OperatorTable` e `OrderTable` (True) ou dicionários, como `create_initial_data`.
+
+    Returns:
+        tuple: (operadores, ordens).
+
+    Detalhes:
+    - As distribuições numéricas são (mínimo, máximo), uniformes no intervalo fechado, ou {valor: peso}.
+      Os padrões reproduzem as distribuições de `create_initial_data`.
+    - Operadores e ordens usam fluxos aleatórios independentes derivados da semente, então mudar o número
+      de ordens não altera os operadores gerados.
+    - Cada campo é sorteado de uma vez para todas as linhas, direto nos vetores das tabelas colunares.
+    """
+    operator_rng, order_rng = (np.random.default_rng(stream) for stream in np.random.SeedSequence(seed).spawn(2))
+    skills = tuple(skills)
+
+    operator_skill_sets, operator_skill_code = _draw_skill_sets(operator_rng, skills, skill_weights,
+                                                                operator_skill_counts, n_operators)
+    operators = OperatorTable(
+        [f"op{i}" for i in range(1, n_operators + 1)], operator_skill_sets, operator_skill_code,
+        pd.Categorical.from_codes(_draw_codes(operator_rng, LEVELS, level_weights, n_operators), LEVELS),
+        pd.Categorical.from_codes(_draw_codes(operator_rng, shifts, None, n_operators), list(shifts)),
+        _draw(operator_rng, hours_per_day, n_operators))
+
+    order_skill_sets, order_skill_code = _draw_skill_sets(order_rng, skills, skill_weights,
+                                                          order_skill_counts, n_orders)
+    orders = OrderTable(
+        [f"os{i}" for i in range(1, n_orders + 1)], order_skill_sets, order_skill_code,
+        _draw(order_rng, estimated_hours, n_orders),
+        pd.Categorical.from_codes(_draw_codes(order_rng, PRIORITIES, priority_weights, n_orders), PRIORITIES),
+        _draw(order_rng, start_days, n_orders),
+        pd.Categorical.from_codes(np.zeros(n_orders, dtype=np.int64), ["não_atendida"]))
+
+    if not as_table:
+        return dict(operators), dict(orders)
+    return operators, orders
@@ -0,0 +1,250 @@
+import os
+import numpy as np
+import pandas as pd
+from .instance_table import OrderTable, OperatorTable, PRIORITIES, LEVELS
+
+# Colunas obrigatórias dos arquivos (os mesmos nomes de `orders_to_dataframe` e `op_orders_to_dataframe`).
+ORDER_COLUMNS = ("id_ordem", "Serviços", "horas_estimadas", "prioridade", "inicio_esperado")
+OPERATOR_COLUMNS = ("id_operador", "habilidades_operador", "nivel_operador", "turno", "horas_disponiveis")
+
+# Nomes alternativos aceitos (as chaves dos dicionários de `create_initial_data`).
+COLUMN_ALIASES = {
+    "order_id": "id_ordem",
+    "required_skills": "Serviços",
+    "estimated_hours": "horas_estimadas",
+    "priority": "prioridade",
+    "expected_start_day": "inicio_esperado",
+    "operator_id": "id_operador",
+    "skills": "habilidades_operador",
+    "level": "nivel_operador",
+    "shift": "turno",
+    "hours_per_day": "horas_disponiveis",
+}
+
+# Extensões reconhecidas de cada formato (arquivos CSV e JSON Lines podem estar comprimidos).
+FILE_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet", ".pq": "parquet"}
+COMPRESSION_EXTENSIONS = (".gz", ".bz2", ".zip", ".xz", ".zst")
+
+DEFAULT_STATUS = "não_atendida"
+SKILL_SEPARATOR = "|"
+
+def _detect_format(path):
+    name = os.path.basename(path).lower()
+    for extension in COMPRESSION_EXTENSIONS:
+        if name.endswith(extension):
+            name = name[:-len(extension)]
+    file_format = FILE_FORMATS.get(os.path.splitext(name)[1])
+    if file_format is None:
+        raise ValueError(f"{path}: formato de arquivo não reconhecido. Use uma das extensões {list(FILE_FORMATS)}.")
+    return file_format
+
+def read_chunks(path, chunksize=100_000, file_format=None):
+    """
+    Lê um arquivo CSV, JSON Lines ou Parquet em blocos de até `chunksize` linhas.
+
+    Args:
+        path (str): Caminho do arquivo.
+        chunksize (int): Número máximo de linhas de cada bloco.
+        file_format (str, opcional): "csv", "jsonl" ou "parquet" (padrão: deduzido da extensão).
+
+    Returns:
+        iterator: DataFrames com os blocos do arquivo, na ordem do arquivo.
+
+    Detalhes:
+    - No CSV, todos os campos são lidos como texto e convertidos na validação, então identificadores como
+      "007" são preservados.
+    - O Parquet é lido por lotes (`iter_batches` do `pyarrow`), sem carregar o arquivo inteiro na memória.
+    """
+    file_format = file_format or _detect_format(path)
+    if file_format == "csv":
+        with pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False) as reader:
+            yield from reader
+    elif file_format == "jsonl":
+        with pd.read_json(path, lines=True, chunksize=chunksize, dtype=False) as reader:
+            yield from reader
+    elif file_format == "parquet":
+        # Importado aqui: o pyarrow só é necessário para ler Parquet.
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        raise ValueError(f"{path}: formato de arquivo inválido: {file_format}.")
+
+def _invalid(path, column, invalid, offset, values):
+    """
+    Gera o erro de validação de uma coluna, com até 5 registros de exemplo (numerados a partir de 1).
+    """
+    rows = np.flatnonzero(invalid)
+    examples = ", ".join(f"{offset + row + 1} ({values.iloc[row]!r})" for row in rows[:5])
+    return ValueError(f"{path}: {len(rows)} registro(s) com '{column}' inválido. Exemplos (registro e valor): {examples}.")
+
+class _CategoryEncoder:
+    """
+    Códigos inteiros de valores categóricos, estáveis entre os blocos (na ordem da primeira ocorrência).
+    """
+
+    def __init__(self, categories=()):
+        self.codes = {category: i for i, category in enumerate(categories)}
+
+    @property
+    def categories(self):
+        return list(self.codes)
+
+    def encode(self, uniques, row_codes):
+        mapping = np.array([self.codes.setdefault(value, len(self.codes)) for value in uniques], dtype=np.int64)
+        return mapping[row_codes] if len(mapping) else np.zeros(len(row_codes), dtype=np.int64)
+
+def _parse_skills(value):
+    if isinstance(value, str):
+        value = value.split(SKILL_SEPARATOR)
+    elif value is None or (np.ndim(value) == 0 and pd.isna(value)):
+        value = []
+    return tuple(skill for skill in (str(skill).strip() for skill in value) if skill)
+
+def _encode_skills(values, encoder, path, column, offset, allowed_skills):
+    """
+    Códigos dos conjuntos de habilidades de um bloco; cada texto distinto é interpretado uma única vez.
+    """
+    # Listas (JSON Lines, Parquet) são convertidas em texto para que os valores distintos possam ser agrupados.
+    texts = values if values.map(type).eq(str).all() else \
+        values.map(lambda value: SKILL_SEPARATOR.join(_parse_skills(value)))
+    row_codes, uniques = pd.factorize(texts, use_na_sentinel=False)
+
+    skill_sets = [_parse_skills(text) for text in uniques]
+    invalid_unique = np.array([not skills or (allowed_skills is not None and not set(skills) <= allowed_skills)
+                               for skills in skill_sets], dtype=bool)
+    if invalid_unique.any():
+        raise _invalid(path, column, invalid_unique[row_codes], offset, values)
+    return encoder.encode(skill_sets, row_codes)
+
+def _encode_categories(values, encoder, path, column, offset, valid=None):
+    row_codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    uniques = [str(value).strip() for value in uniques]
+    if valid is not None:
+        invalid_unique = np.array([value not in valid for value in uniques], dtype=bool)
+        if invalid_unique.any():
+            raise _invalid(path, column, invalid_unique[row_codes], offset, values)
+    return encoder.encode(uniques, row_codes)
+
+def _integers(values, path, column, offset, minimum):
+    numbers = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    invalid = np.isnan(numbers) | (numbers != np.round(numbers)) | (numbers < minimum)
+    if invalid.any():
+        raise _invalid(path, column, invalid, offset, values)
+    return numbers.astype(np.int64)
+
+def _ids(values, seen, path, column, offset):
+    ids = [str(value).strip() for value in values.tolist()]
+    distinct = set(ids)
+    if len(distinct) != len(ids) or "" in distinct or not seen.isdisjoint(distinct):
+        invalid = np.array([item_id == "" or item_id in seen for item_id in ids], dtype=bool) | \
+            pd.Series(ids).duplicated().to_numpy()
+        raise _invalid(path, column, invalid, offset, values)
+    seen.update(distinct)
+    return ids
+
+def _chunks(path, columns, chunksize, file_format, optional=()):
+    """
+    Blocos do arquivo com as colunas renomeadas para os nomes padrão, junto com o número de registros anteriores.
+    """
+    offset = 0
+    for chunk in read_chunks(path, chunksize, file_format):
+        chunk = chunk.rename(columns=COLUMN_ALIASES)
+        missing = [column for column in columns if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"{path}: colunas obrigatórias ausentes: {missing}. Colunas esperadas: {list(columns)}.")
+        yield offset, chunk[[column for column in columns + optional if column in chunk.columns]]
+        offset += len(chunk)
+
+def _concatenate(arrays):
+    return np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int64)
+
+def load_orders(path, chunksize=100_000, file_format=None, allowed_skills=None):
+    """
+    Carrega ordens de serviço de um arquivo CSV, JSON Lines ou Parquet direto para uma `OrderTable`.
+
+    Args:
+        path (str): Caminho do arquivo, com as colunas de `ORDER_COLUMNS` (ou os nomes de `COLUMN_ALIASES`)
+                    e, opcionalmente, "status".
+        chunksize (int): Número de linhas lidas e validadas por vez.
+        file_format (str, opcional): "csv", "jsonl" ou "parquet" (padrão: deduzido da extensão).
+        allowed_skills (iterable, opcional): Habilidades aceitas (padrão: qualquer habilidade).
+
+    Returns:
+        OrderTable: As ordens, na ordem do arquivo.
+
+    Detalhes:
+    - As habilidades vêm em texto separado por "|" (como em `orders_to_dataframe`) ou em lista.
+    - Cada bloco é validado e convertido em vetores: identificadores não vazios e únicos, ao menos uma habilidade,
+      horas estimadas inteiras e positivas, prioridade em `PRIORITIES` e dia esperado inteiro a partir de 1.
+      Registros inválidos geram um `ValueError` com a coluna e exemplos dos registros.
+    - Nenhum dicionário por ordem é criado: os textos repetidos (habilidades, prioridade, status) são
+      interpretados uma vez por valor distinto em cada bloco.
+    """
+    allowed_skills = set(allowed_skills) if allowed_skills is not None else None
+    seen = set()
+    skills = _CategoryEncoder()
+    priorities = _CategoryEncoder(PRIORITIES)
+    statuses = _CategoryEncoder()
+    ids, skill_set_code, estimated_hours, priority, expected_start_day, status = [], [], [], [], [], []
+
+    for offset, chunk in _chunks(path, ORDER_COLUMNS, chunksize, file_format, optional=("status",)):
+        ids.extend(_ids(chunk["id_ordem"], seen, path, "id_ordem", offset))
+        skill_set_code.append(_encode_skills(chunk["Serviços"], skills, path, "Serviços", offset, allowed_skills))
+        estimated_hours.append(_integers(chunk["horas_estimadas"], path, "horas_estimadas", offset, 1))
+        priority.append(_encode_categories(chunk["prioridade"], priorities, path, "prioridade", offset, PRIORITIES))
+        expected_start_day.append(_integers(chunk["inicio_esperado"], path, "inicio_esperado", offset, 1))
+        status_values = chunk["status"] if "status" in chunk.columns else pd.Series(DEFAULT_STATUS, index=chunk.index)
+        status.append(_encode_categories(status_values, statuses, path, "status", offset))
+
+    return OrderTable(ids, skills.categories, _concatenate(skill_set_code), _concatenate(estimated_hours),
+                      pd.Categorical.from_codes(_concatenate(priority), PRIORITIES),
+                      _concatenate(expected_start_day),
+                      pd.Categorical.from_codes(_concatenate(status), statuses.categories))
+
+def load_operators(path, chunksize=100_000, file_format=None, allowed_skills=None):
+    """
+    Carrega operadores de um arquivo CSV, JSON Lines ou Parquet direto para uma `OperatorTable`.
+
+    Args:
+        path (str): Caminho do arquivo, com as colunas de `OPERATOR_COLUMNS` (ou os nomes de `COLUMN_ALIASES`).
+        chunksize (int): Número de linhas lidas e validadas por vez.
+        file_format (str, opcional): "csv", "jsonl" ou "parquet" (padrão: deduzido da extensão).
+        allowed_skills (iterable, opcional): Habilidades aceitas (padrão: qualquer habilidade).
+
+    Returns:
+        OperatorTable: Os operadores, na ordem do arquivo.
+
+    Detalhes:
+    - Mesmas regras de `load_orders`, com o nível em `LEVELS` e as horas por dia inteiras e positivas.
+    """
+    allowed_skills = set(allowed_skills) if allowed_skills is not None else None
+    seen = set()
+    skills = _CategoryEncoder()
+    levels = _CategoryEncoder(LEVELS)
+    shifts = _CategoryEncoder()
+    ids, skill_set_code, level, shift, hours_per_day = [], [], [], [], []
+
+    for offset, chunk in _chunks(path, OPERATOR_COLUMNS, chunksize, file_format):
+        ids.extend(_ids(chunk["id_operador"], seen, path, "id_operador", offset))
+        skill_set_code.append(_encode_skills(chunk["habilidades_operador"], skills, path, "habilidades_operador",
+                                             offset, allowed_skills))
+        level.append(_encode_categories(chunk["nivel_operador"], levels, path, "nivel_operador", offset, LEVELS))
+        shift.append(_encode_categories(chunk["turno"], shifts, path, "turno", offset))
+        hours_per_day.append(_integers(chunk["horas_disponiveis"], path, "horas_disponiveis", offset, 1))
+
+    return OperatorTable(ids, skills.categories, _concatenate(skill_set_code),
+                         pd.Categorical.from_codes(_concatenate(level), LEVELS),
+                         pd.Categorical.from_codes(_concatenate(shift), shifts.categories),
+                         _concatenate(hours_per_day))
+
+def load_instance(operators_path, orders_path, chunksize=100_000, allowed_skills=None):
+    """
+    Carrega operadores e ordens de arquivos (ver `load_operators` e `load_orders`).
+
+    Returns:
+        tuple: (OperatorTable, OrderTable), no lugar dos dicionários de `create_initial_data`.
+    """
+    operators = load_operators(operators_path, chunksize, allowed_skills=allowed_skills)
+    orders = load_orders(orders_path, chunksize, allowed_skills=allowed_skills)
+    return operators, orders
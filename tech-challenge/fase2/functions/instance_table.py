@@ -0,0 +1,203 @@
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+
+# Prioridades válidas, da menor para a maior (o valor numérico é a posição + 1, como em `priority_to_number`).
+PRIORITIES = ("baixa", "média", "alta", "urgente")
+
+# Níveis válidos dos operadores.
+LEVELS = ("júnior", "pleno", "sênior", "especialista")
+
+def _skill_labels(skill_sets, skill_set_code):
+    """
+    Coluna categórica com as habilidades ("a | b") de cada linha, juntando o texto uma vez por conjunto distinto.
+    """
+    label_codes, labels = pd.factorize(pd.Series([" | ".join(skills) for skills in skill_sets], dtype=object))
+    return pd.Categorical.from_codes(label_codes[skill_set_code], labels)
+
+def _categorical_names(categorical):
+    return [str(name) for name in categorical.categories]
+
+class OrderTable(Mapping):
+    """
+    Ordens de serviço em formato colunar (um vetor por campo), com a interface de leitura de um dicionário.
+
+    Args:
+        ids (list): Identificadores das ordens, na ordem da tabela.
+        skill_sets (list): Conjuntos distintos de habilidades exigidas (tuplas), na ordem em que aparecem.
+        skill_set_code (np.ndarray): Posição em `skill_sets` do conjunto de habilidades de cada ordem.
+        estimated_hours (np.ndarray): Horas estimadas de cada ordem.
+        priority (pd.Categorical): Prioridade de cada ordem (categorias em `PRIORITIES`).
+        expected_start_day (np.ndarray): Dia esperado de início de cada ordem.
+        status (pd.Categorical): Status de cada ordem.
+
+    Detalhes:
+    - `orders[order_id]` monta o dicionário da ordem apenas no momento da consulta, então os algoritmos que
+      leem ordens em dicionário funcionam sem alteração. A tabela é somente leitura.
+    - Os índices, o fitness vetorizado e os DataFrames leem os vetores diretamente (ver `order_values`),
+      sem criar um dicionário por ordem.
+    """
+
+    def __init__(self, ids, skill_sets, skill_set_code, estimated_hours, priority, expected_start_day, status):
+        self.ids = list(ids)
+        self.position = {order_id: i for i, order_id in enumerate(self.ids)}
+        if len(self.position) != len(self.ids):
+            raise ValueError("Identificadores de ordens duplicados.")
+        self.skill_sets = [tuple(skills) for skills in skill_sets]
+        self.skill_set_code = np.asarray(skill_set_code, dtype=np.int64)
+        self.estimated_hours = np.asarray(estimated_hours, dtype=np.int64)
+        self.priority = pd.Categorical(priority, categories=PRIORITIES)
+        if (self.priority.codes < 0).any():
+            raise ValueError(f"Prioridades inválidas nas ordens. Use uma de {PRIORITIES}.")
+        self.expected_start_day = np.asarray(expected_start_day, dtype=np.int64)
+        self.status = pd.Categorical(status)
+        self._priority_names = _categorical_names(self.priority)
+        self._status_names = _categorical_names(self.status)
+
+    @classmethod
+    def from_dict(cls, orders):
+        """
+        Converte ordens em dicionário (ver `create_initial_data`) para a tabela.
+        """
+        codes = {}
+        skill_set_code = [codes.setdefault(tuple(order["required_skills"]), len(codes)) for order in orders.values()]
+        return cls(list(orders), list(codes), skill_set_code,
+                   [order["estimated_hours"] for order in orders.values()],
+                   [order["priority"] for order in orders.values()],
+                   [order["expected_start_day"] for order in orders.values()],
+                   [order["status"] for order in orders.values()])
+
+    def __getitem__(self, order_id):
+        i = self.position[order_id]
+        return {
+            "required_skills": list(self.skill_sets[self.skill_set_code[i]]),
+            "estimated_hours": int(self.estimated_hours[i]),
+            "priority": self._priority_names[self.priority.codes[i]],
+            "expected_start_day": int(self.expected_start_day[i]),
+            "status": self._status_names[self.status.codes[i]],
+        }
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, order_id):
+        return order_id in self.position
+
+    @property
+    def priority_number(self):
+        return (self.priority.codes + 1).astype(np.int64)
+
+    def columns(self, order_ids=None):
+        """
+        Colunas das ordens informadas (todas, se não fornecidas), no formato de `_orders_columns`.
+        """
+        positions = (np.arange(len(self.ids)) if order_ids is None
+                     else np.fromiter((self.position[order_id] for order_id in order_ids), dtype=np.int64))
+        skill_set_code = self.skill_set_code[positions]
+        return {
+            "ids": self.ids if order_ids is None else list(order_ids),
+            "skills": _skill_labels(self.skill_sets, skill_set_code),
+            "skill_set_code": skill_set_code,
+            "skill_sets": self.skill_sets,
+            "estimated_hours": self.estimated_hours[positions],
+            "priority": self.priority.take(positions),
+            "expected_start_day": self.expected_start_day[positions],
+            "status": self.status.take(positions),
+        }
+
+class OperatorTable(Mapping):
+    """
+    Operadores em formato colunar, com a interface de leitura de um dicionário (ver `OrderTable`).
+
+    Args:
+        ids (list): Identificadores dos operadores.
+        skill_sets (list): Conjuntos distintos de habilidades (tuplas), na ordem em que aparecem.
+        skill_set_code (np.ndarray): Posição em `skill_sets` das habilidades de cada operador.
+        level (pd.Categorical): Nível de cada operador (categorias em `LEVELS`).
+        shift (pd.Categorical): Turno de cada operador.
+        hours_per_day (np.ndarray): Horas disponíveis por dia de cada operador.
+    """
+
+    def __init__(self, ids, skill_sets, skill_set_code, level, shift, hours_per_day):
+        self.ids = list(ids)
+        self.position = {operator_id: i for i, operator_id in enumerate(self.ids)}
+        if len(self.position) != len(self.ids):
+            raise ValueError("Identificadores de operadores duplicados.")
+        self.skill_sets = [tuple(skills) for skills in skill_sets]
+        self.skill_set_code = np.asarray(skill_set_code, dtype=np.int64)
+        self.level = pd.Categorical(level, categories=LEVELS)
+        if (self.level.codes < 0).any():
+            raise ValueError(f"Níveis inválidos nos operadores. Use um de {LEVELS}.")
+        self.shift = pd.Categorical(shift)
+        self.hours_per_day = np.asarray(hours_per_day, dtype=np.int64)
+        self._level_names = _categorical_names(self.level)
+        self._shift_names = _categorical_names(self.shift)
+
+    @classmethod
+    def from_dict(cls, operators):
+        """
+        Converte operadores em dicionário (ver `create_initial_data`) para a tabela.
+        """
+        codes = {}
+        skill_set_code = [codes.setdefault(tuple(operator["skills"]), len(codes)) for operator in operators.values()]
+        return cls(list(operators), list(codes), skill_set_code,
+                   [operator["level"] for operator in operators.values()],
+                   [operator["shift"] for operator in operators.values()],
+                   [operator["hours_per_day"] for operator in operators.values()])
+
+    def __getitem__(self, operator_id):
+        i = self.position[operator_id]
+        return {
+            "skills": list(self.skill_sets[self.skill_set_code[i]]),
+            "level": self._level_names[self.level.codes[i]],
+            "shift": self._shift_names[self.shift.codes[i]],
+            "hours_per_day": int(self.hours_per_day[i]),
+        }
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, operator_id):
+        return operator_id in self.position
+
+    def columns(self):
+        """
+        Colunas dos operadores, no formato de `_operators_columns`.
+        """
+        return {
+            "ids": self.ids,
+            "skills": _skill_labels(self.skill_sets, self.skill_set_code),
+            "level": self.level,
+            "shift": self.shift,
+            "hours_per_day": self.hours_per_day,
+        }
+
+def order_values(orders, field):
+    """
+    Vetor (int64) com um campo numérico de todas as ordens, lido da tabela ou dos dicionários.
+
+    Args:
+        orders (dict ou OrderTable): Ordens de serviço.
+        field (str): "estimated_hours", "expected_start_day" ou "priority_number" (valor de `priority_to_number`).
+    """
+    if isinstance(orders, OrderTable):
+        return getattr(orders, field)
+    if field == "priority_number":
+        numbers = {priority: i + 1 for i, priority in enumerate(PRIORITIES)}
+        return np.fromiter((numbers.get(order["priority"], 0) for order in orders.values()),
+                           dtype=np.int64, count=len(orders))
+    return np.fromiter((order[field] for order in orders.values()), dtype=np.int64, count=len(orders))
+
+def operator_values(operators, field):
+    """
+    Vetor (int64) com um campo numérico de todos os operadores, lido da tabela ou dos dicionários.
+    """
+    if isinstance(operators, OperatorTable):
+        return getattr(operators, field)
+    return np.fromiter((operator[field] for operator in operators.values()), dtype=np.int64, count=len(operators))
@@ -0,0 +1,245 @@
+import random
+import multiprocessing
+import numpy as np
+from .chromosome import GenomeLayout, set_seed
+from .common_functions import solution_to_dataframe
+from .eligibility import EligibilityIndex
+from .genetic_engine import GeneticEngine
+from .parallel_offspring import pack_individual, unpack_individual
+
+TOPOLOGIES = ("ring", "full")
+
+def _island_worker(connection, operators, orders, settings, seed):
+    """
+    Processo de uma ilha: mantém um `GeneticEngine` próprio e executa as épocas pedidas pelo processo principal.
+
+    Detalhes:
+    - Cada mensagem recebida é (gerações, imigrantes); `None` encerra a ilha.
+    - A resposta traz os emigrantes (melhores indivíduos), o histórico de melhores fitness da época
+      e a melhor solução da ilha até o momento.
+    """
+    random.seed(seed)
+    set_seed(seed)
+    engine = GeneticEngine(operators, orders, **settings)
+
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        generations, immigrants, migration_size = message
+
+        receive_migrants(engine, [unpack_individual(individual, engine.genome_layout) for individual in immigrants])
+        start = engine.generation
+        engine.run(generations)
+
+        emigrants = sorted(engine.population, reverse=True, key=lambda individual: individual["fitness"])[:migration_size]
+        connection.send(([pack_individual(individual) for individual in emigrants],
+                         engine.best_fitness_values[start:],
+                         pack_individual(engine.best_solution),
+                         engine.cache_stats()))
+    connection.close()
+
+def receive_migrants(engine, immigrants):
+    """
+    Substitui os piores indivíduos da população da ilha pelos imigrantes (o melhor indivíduo é sempre mantido).
+
+    Args:
+        engine (GeneticEngine): Motor da ilha que recebe os imigrantes.
+        immigrants (list): Indivíduos vindos de outras ilhas, já avaliados.
+    """
+    immigrants = immigrants[:max(0, len(engine.population) - 1)]
+    if not immigrants:
+        return
+    population = sorted(engine.population, reverse=True, key=lambda individual: individual["fitness"])
+    population[-len(immigrants):] = immigrants
+    for individual in immigrants:
+        engine.fitness_cache.store(individual)
+    engine.population = population
+
+class IslandModel:
+    """
+    Algoritmo genético em modelo de ilhas: sub-populações independentes, cada uma em um processo,
+    com migração periódica dos melhores indivíduos.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        islands (int): Número de ilhas (processos).
+        days (int): Número de dias do planejamento.
+        population_size (int): Tamanho da população de cada ilha.
+        generations (int): Número de gerações de cada ilha.
+        mutation_rates (list, opcional): Taxa de mutação de cada ilha (padrão: valores entre 0.1 e 0.5).
+        reinitialize_intervals (list, opcional): Intervalo de reinicialização de cada ilha (padrão: 10, 15, 20, 25...).
+        elitism_size (int): Número de melhores soluções usadas como pais em cada ilha.
+        migration_interval (int): Número de gerações entre migrações.
+        migration_size (int): Número de indivíduos da elite enviados por ilha em cada migração.
+        topology (str): "ring" (cada ilha envia para a seguinte) ou "full" (cada ilha envia para todas as outras).
+        compact_genome (bool): Usa cromossomos compactos (True) ou soluções em dicionário (False).
+        seed (int, opcional): Semente usada para sortear as sementes das ilhas.
+
+    Detalhes:
+    - Operadores e ordens são enviados uma única vez para cada ilha, na criação do processo.
+    - A coordenação acontece apenas a cada `migration_interval` gerações: as ilhas devolvem seus emigrantes,
+      que substituem os piores indivíduos das ilhas de destino no início da época seguinte.
+    - `best_fitness_values` guarda, por geração, o melhor fitness entre todas as ilhas, e `best_solution`
+      a melhor solução encontrada, no mesmo formato de `GeneticEngine` para o relatório final.
+    """
+
+    def __init__(self, operators, orders, islands=4, days=5, population_size=50, generations=50,
+                 mutation_rates=None, reinitialize_intervals=None, elitism_size=5, migration_interval=10,
+                 migration_size=2, topology="ring", compact_genome=True, seed=None):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topologia inválida: {topology}. Use uma de {TOPOLOGIES}.")
+
+        self.operators = operators
+        self.orders = orders
+        self.islands = islands
+        self.generations = generations
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.mutation_rates = (list(mutation_rates) if mutation_rates is not None
+                               else np.linspace(0.1, 0.5, islands).round(3).tolist())
+        self.reinitialize_intervals = (list(reinitialize_intervals) if reinitialize_intervals is not None
+                                       else [10 + 5 * (island % 4) for island in range(islands)])
+
+        self.index = EligibilityIndex(operators, orders)
+        self.layout = GenomeLayout(operators, orders, days, self.index)
+        self.genome_layout = self.layout if compact_genome else None
+
+        self.generation = 0
+        self.best_fitness_values = []
+        self.best_solution = None
+        self.island_best_fitness = [None] * islands
+        self.island_cache_stats = [None] * islands
+        self.callbacks = []
+
+        seeds = random.Random(seed).sample(range(2 ** 31), islands) if seed is not None \
+            else [random.randrange(2 ** 31) for _ in range(islands)]
+        self.connections = []
+        self.processes = []
+        for island in range(islands):
+            settings = dict(days=days, population_size=population_size, generations=generations,
+                            mutation_rate=self.mutation_rates[island], elitism_size=elitism_size,
+                            reinitialize_interval=self.reinitialize_intervals[island],
+                            compact_genome=compact_genome)
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_island_worker, daemon=True,
+                                              args=(child_connection, operators, orders, settings, seeds[island]))
+            process.start()
+            child_connection.close()
+            self.connections.append(parent_connection)
+            self.processes.append(process)
+
+        self.immigrants = [[] for _ in range(islands)]
+
+    @property
+    def finished(self):
+        return self.generation >= self.generations
+
+    @property
+    def best_fitness(self):
+        return self.best_solution["fitness"] if self.best_solution is not None else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_callback(self, callback):
+        """
+        Registra uma função chamada ao fim de cada época (entre migrações), com a assinatura `callback(model)`.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def destinations(self, island):
+        """
+        Ilhas que recebem os emigrantes da ilha informada, conforme a topologia.
+        """
+        if self.topology == "ring":
+            return [(island + 1) % self.islands] if self.islands > 1 else []
+        return [other for other in range(self.islands) if other != island]
+
+    def step(self):
+        """
+        Executa uma época: `migration_interval` gerações em todas as ilhas, em paralelo, seguidas da migração.
+
+        Returns:
+            float: O melhor fitness entre todas as ilhas.
+        """
+        generations = min(self.migration_interval, self.generations - self.generation)
+        for connection, immigrants in zip(self.connections, self.immigrants):
+            connection.send((generations, immigrants, self.migration_size))
+
+        self.immigrants = [[] for _ in range(self.islands)]
+        histories = []
+        for island, connection in enumerate(self.connections):
+            emigrants, history, best, cache_stats = connection.recv()
+            histories.append(history)
+            self.island_cache_stats[island] = cache_stats
+
+            best = unpack_individual(best, self.genome_layout)
+            self.island_best_fitness[island] = best["fitness"]
+            if self.best_solution is None or best["fitness"] > self.best_solution["fitness"]:
+                self.best_solution = best
+
+            for destination in self.destinations(island):
+                self.immigrants[destination].extend(emigrants)
+
+        # Histórico mesclado: melhor fitness entre as ilhas em cada geração da época.
+        self.best_fitness_values.extend(max(values) for values in zip(*histories))
+        self.generation += generations
+
+        for callback in self.callbacks:
+            callback(self)
+
+        return self.best_fitness
+
+    def run(self):
+        """
+        Executa todas as épocas até completar `generations` gerações e encerra os processos das ilhas.
+
+        Returns:
+            dict ou Chromosome: A melhor solução entre todas as ilhas.
+        """
+        while not self.finished:
+            self.step()
+        self.close()
+        return self.best_solution
+
+    def close(self):
+        """
+        Encerra os processos das ilhas.
+        """
+        for connection in self.connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+    def cache_stats(self):
+        """
+        Soma os contadores dos caches de fitness de todas as ilhas.
+        """
+        stats = [island for island in self.island_cache_stats if island is not None]
+        hits = sum(island["hits"] for island in stats)
+        misses = sum(island["misses"] for island in stats)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "size": sum(island["size"] for island in stats),
+        }
+
+    def best_solution_dataframe(self):
+        """
+        Converte a melhor solução entre as ilhas em DataFrame (ver `solution_to_dataframe`).
+        """
+        return solution_to_dataframe(self.best_solution, self.operators, self.orders)
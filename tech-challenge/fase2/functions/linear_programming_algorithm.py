@@ -1,7 +1,15 @@
+import os
+import re
+import time
+import tempfile
 import pulp
 from .common_functions import *
+from .eligibility import EligibilityIndex
+from .rolling_horizon import rolling_horizon_allocation
 
-def linear_programming_allocation(operators, orders, days=5):
+def linear_programming_allocation(operators, orders, days=5, index=None, time_limit=None, gap=None,
+                                  initial_solution=None, allow_unassigned=False, prefer_early=False,
+                                  horizon_window=None, horizon_step=1):
     """
     Realiza a alocação de ordens de serviço usando Programação Linear.
 
@@ -9,57 +17,361 @@ def linear_programming_allocation(operators, orders, days=5):
         operators (dict): Dicionário de operadores, contendo suas habilidades e horários.
         orders (dict): Dicionário de ordens de serviço, contendo as habilidades necessárias, horas estimadas, etc.
         days (int): Número de dias do planejamento.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
+        time_limit (float, opcional): Tempo máximo de resolução, em segundos.
+        gap (float, opcional): Gap relativo aceito entre a solução e o limitante (ex.: 0.01 = 1%).
+        initial_solution (dict, opcional): Solução inicial para o warm start (ex.: saída de `greedy_allocation`).
+        allow_unassigned (bool): Permite deixar ordens sem alocação (restrição `<= 1` no lugar de `== 1`).
+        prefer_early (bool): Desempata soluções de mesma prioridade total em favor dos dias mais cedo.
+        horizon_window (int, opcional): Dias de cada janela do horizonte rolante; se menor que `days`,
+                                        resolve o horizonte por janelas (ver `rolling_horizon_allocation`).
+        horizon_step (int): Dias fixados a cada janela do horizonte rolante.
 
     Returns:
-        dict: Solução de alocação de ordens a operadores por dia.
+        dict: Solução de alocação de ordens a operadores por dia (a melhor solução incumbente encontrada),
+              com os tempos de montagem, resolução e extração, o status do solver, o valor da função objetivo
+              e o limitante em `solution["stats"]`.
+
+    Detalhes:
+    - O modelo é montado e resolvido por `LinearProgrammingAllocator` (ver os detalhes do modelo esparso lá).
+    - Com `time_limit` ou `gap`, o CBC para antes da prova de otimalidade e devolve a melhor solução incumbente;
+      `stats["solution_status"]` indica se ela é ótima ("Optimal Solution Found") ou apenas viável ("Solution Found").
+    - O limitante (`stats["bound"]`) é lido do log do CBC; quando a solução é ótima, é o próprio valor da objetivo.
+    - Sem solução inteira (CBC parado pelo tempo antes de encontrá-la, `status` "Not Solved", ou modelo
+      inviável, "Infeasible"), a solução devolvida é a solução inicial (ou nenhuma ordem alocada, sem solução
+      inicial), indicada em `stats["fallback"]`. A objetivo, o limitante e o gap só são informados quando há
+      solução inteira.
+    - Ordens sem nenhum operador elegível ficam sem alocação e são listadas em `stats["unservable_orders"]`.
+    - No horizonte rolante, cada janela é um modelo com `allow_unassigned` e `prefer_early` (as ordens que não cabem
+      seguem para a janela seguinte), `time_limit` e `gap` valem por janela e a solução inicial não é usada.
+    """
+    if index is None:
+        index = EligibilityIndex(operators, orders)
+
+    if horizon_window is not None and horizon_window < days:
+        def solve_window(operators, orders, days, index):
+            return linear_programming_allocation(operators, orders, days, index, time_limit, gap,
+                                                 allow_unassigned=True, prefer_early=True)
+        return rolling_horizon_allocation(operators, orders, days, solve_window, horizon_window, horizon_step, index)
+
+    allocator = LinearProgrammingAllocator(operators, orders, days, index, allow_unassigned, prefer_early)
+    if initial_solution is not None:
+        allocator.set_initial_solution(initial_solution)
+    return allocator.solve(time_limit, gap)
+
+class LinearProgrammingAllocator:
+    """
+    Modelo de Programação Linear persistente, atualizado no lugar entre resoluções.
+
+    Args:
+        operators (dict): Dicionário de operadores, contendo suas habilidades e horários.
+        orders (dict): Dicionário de ordens de serviço, contendo as habilidades necessárias, horas estimadas, etc.
+        days (int): Número de dias do planejamento.
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
+        allow_unassigned (bool): Permite deixar ordens sem alocação (restrição `<= 1` no lugar de `== 1`).
+        prefer_early (bool): Desempata soluções de mesma prioridade total em favor dos dias mais cedo.
+
+    Detalhes:
+    - O modelo é esparso: só existem variáveis para os trios (dia, operador, ordem) em que o operador é elegível
+      para a ordem, então não há restrições para zerar as combinações inelegíveis.
+    - As expressões são montadas diretamente como `LpAffineExpression` a partir das listas de variáveis.
+    - `add_order`, `remove_order`, `set_capacity` e `set_priority` alteram apenas as variáveis, coeficientes e
+      lados direitos envolvidos, sem reconstruir o problema.
+    - Cada `solve` usa os valores da resolução anterior como warm start (variáveis novas começam sem valor).
+    - Na extração, cada ordem percorre apenas as próprias variáveis e para na variável com valor 1.
+    - O bônus de `prefer_early` soma menos de 1 no total, então nunca troca uma unidade de prioridade por dias mais cedo.
+      A escala do bônus dobra (e os coeficientes são recalculados) quando as ordens adicionadas ultrapassam o limite.
+    - A elegibilidade de ordens fora do índice (ou com outras habilidades exigidas) usa `meets_minimum_skills`.
+    - Ordens sem nenhum operador elegível não têm restrição de atribuição, mesmo sem `allow_unassigned`: ficam
+      sem alocação e são listadas em `stats["unservable_orders"]`, sem tornar o modelo inviável.
+    """
+
+    def __init__(self, operators, orders, days=5, index=None, allow_unassigned=False, prefer_early=False):
+        start_time = time.perf_counter()
+
+        self.operators = operators
+        self.orders = dict(orders)
+        self.days = days
+        self.index = index if index is not None else EligibilityIndex(operators, orders)
+        self.allow_unassigned = allow_unassigned
+        self.prefer_early = prefer_early
+        self.bonus_scale = len(orders) + 1
+        self.warm_start = False
+        self.initial_solution = None
+        self.removed_variables = False
+
+        # Cria o problema de otimização
+        self.prob = pulp.LpProblem("Order_Allocation", pulp.LpMaximize)
+
+        # Variáveis de cada ordem e restrições de atribuição (por ordem) e de capacidade (por dia e operador).
+        self.order_variables = {}
+        self.assignment_constraints = {}
+        self.capacity_constraints = {}
+
+        # Cria as variáveis de decisão apenas para os trios elegíveis, agrupadas por ordem e por (dia, operador).
+        capacity_terms = {(day, op): [] for day in range(days) for op in operators}
+        objective_terms = []
+        for order_id, order in self.orders.items():
+            variables = self._create_variables(order_id, order)
+            self.order_variables[order_id] = variables
+            for day, operator_id, variable in variables:
+                capacity_terms[day, operator_id].append((variable, order["estimated_hours"]))
+                objective_terms.append((variable, self._weight(order, day)))
+
+        # Função objetivo: maximizar a aptidão total
+        self.prob.setObjective(pulp.LpAffineExpression(objective_terms))
+
+        # Restrição: cada ordem deve ser atribuída a exatamente um operador (elegível) em um dia
+        # (no máximo um, se ordens podem ficar sem alocação)
+        for order_id in self.orders:
+            self._add_assignment_constraint(order_id)
+
+        # Restrição: as horas de trabalho do operador não devem exceder as horas disponíveis
+        for (day, operator_id), terms in capacity_terms.items():
+            constraint = pulp.LpAffineExpression(terms) <= operators[operator_id]["hours_per_day"]
+            self.prob += constraint, f"capacity_{day}_{operator_id}"
+            self.capacity_constraints[day, operator_id] = constraint
+
+        self.build_time = time.perf_counter() - start_time
+
+    @property
+    def n_variables(self):
+        return sum(len(variables) for variables in self.order_variables.values())
+
+    @property
+    def unservable_orders(self):
+        """
+        Ordens sem nenhum operador elegível (sem variáveis), que ficam sempre sem alocação.
+        """
+        return [order_id for order_id, variables in self.order_variables.items() if not variables]
+
+    def _eligible_operators(self, order_id, order):
+        indexed = self.index.orders.get(order_id)
+        if indexed is not None and indexed["required_skills"] == order["required_skills"]:
+            return self.index.eligible_operators(order_id)
+        return [operator_id for operator_id, operator in self.operators.items()
+                if meets_minimum_skills(operator["skills"], order["required_skills"])[0]]
+
+    def _weight(self, order, day):
+        """
+        Coeficiente da variável na função objetivo: prioridade da ordem (mais o bônus de dia cedo, se ativo).
+        """
+        weight = priority_to_number(order["priority"])
+        if self.prefer_early:
+            weight += (self.days - day) / (self.days * self.bonus_scale)
+        return weight
+
+    def _create_variables(self, order_id, order):
+        return [(day, operator_id, pulp.LpVariable(f"x_({day},_{operator_id},_{order_id})", cat='Binary'))
+                for operator_id in self._eligible_operators(order_id, order) for day in range(self.days)]
+
+    def _add_assignment_constraint(self, order_id):
+        # Ordens sem operador elegível não têm variáveis: ficam sem alocação (ver `unservable_orders`), pois a
+        # restrição `== 1` vazia tornaria o modelo inteiro inviável.
+        if not self.order_variables[order_id]:
+            return
+        assignment = pulp.LpAffineExpression([(variable, 1) for _, _, variable in self.order_variables[order_id]])
+        constraint = assignment <= 1 if self.allow_unassigned else assignment == 1
+        self.prob += constraint, f"assignment_{order_id}"
+        self.assignment_constraints[order_id] = constraint
+
+    def add_order(self, order_id, order):
+        """
+        Adiciona uma ordem ao modelo (variáveis, restrição de atribuição e termos de capacidade).
+        """
+        if order_id in self.orders:
+            self.remove_order(order_id)
+        start_time = time.perf_counter()
+
+        self.orders[order_id] = order
+        if self.prefer_early and len(self.orders) >= self.bonus_scale:
+            self._rescale_bonus()
+
+        variables = self._create_variables(order_id, order)
+        self.order_variables[order_id] = variables
+        for day, operator_id, variable in variables:
+            self.prob.objective[variable] = self._weight(order, day)
+            self.capacity_constraints[day, operator_id].expr[variable] = order["estimated_hours"]
+        self._add_assignment_constraint(order_id)
+
+        self.build_time += time.perf_counter() - start_time
+
+    def remove_order(self, order_id):
+        """
+        Remove uma ordem do modelo, retirando suas variáveis da objetivo e das restrições de capacidade.
+        """
+        start_time = time.perf_counter()
+
+        del self.orders[order_id]
+        for day, operator_id, variable in self.order_variables.pop(order_id):
+            del self.prob.objective[variable]
+            del self.capacity_constraints[day, operator_id].expr[variable]
+        # A restrição de atribuição sai do problema quando ele é refeito, na próxima resolução.
+        self.assignment_constraints.pop(order_id, None)
+        self.removed_variables = True
+
+        self.build_time += time.perf_counter() - start_time
+
+    def set_capacity(self, operator_id, hours_per_day, day=None):
+        """
+        Altera o lado direito das restrições de capacidade do operador (em todos os dias ou em um dia, de 1 a `days`).
+        """
+        for constraint_day in (range(self.days) if day is None else [day - 1]):
+            self.capacity_constraints[constraint_day, operator_id].changeRHS(hours_per_day)
+
+    def set_priority(self, order_id, priority):
+        """
+        Altera a prioridade de uma ordem, atualizando os coeficientes das suas variáveis na função objetivo.
+        """
+        self.orders[order_id] = {**self.orders[order_id], "priority": priority}
+        for day, _, variable in self.order_variables[order_id]:
+            self.prob.objective[variable] = self._weight(self.orders[order_id], day)
+
+    def _rescale_bonus(self):
+        while self.bonus_scale <= len(self.orders):
+            self.bonus_scale *= 2
+        for order_id, variables in self.order_variables.items():
+            for day, _, variable in variables:
+                self.prob.objective[variable] = self._weight(self.orders[order_id], day)
+
+    def set_initial_solution(self, initial_solution):
+        """
+        Define os valores iniciais das variáveis (warm start) a partir de uma solução em dicionário.
+        Alocações fora das variáveis do modelo (operador inelegível) são ignoradas.
+        """
+        for order_id, variables in self.order_variables.items():
+            allocation = initial_solution["orders"].get(order_id)
+            start = (allocation["day"] - 1, allocation["operator"]) if allocation and allocation["operator"] is not None else None
+            for day, operator_id, variable in variables:
+                variable.setInitialValue(1 if (day, operator_id) == start else 0)
+        self.initial_solution = initial_solution
+        self.warm_start = True
+
+    def _rebuild_problem(self):
+        """
+        Recria o `LpProblem` com a objetivo e as restrições atuais (os mesmos objetos, que seguem editáveis no lugar).
+        """
+        prob = pulp.LpProblem(self.prob.name, self.prob.sense)
+        prob.setObjective(self.prob.objective)
+        for constraint in self.assignment_constraints.values():
+            prob.addConstraint(constraint)
+        for constraint in self.capacity_constraints.values():
+            prob.addConstraint(constraint)
+        self.prob = prob
+
+    def _allocation(self, order_id, day, operator_id):
+        """
+        Alocação da ordem no dia (0 a `days` - 1) e operador informados, com o status pelo início esperado.
+        """
+        # Calcula a quantidade de dias em atraso, se late_order > 0 = atraso.. 
+        late_order = day - self.orders[order_id]["expected_start_day"]
+        order_status = "atrasada" if late_order > 0 else "atendida"
+        return {"day": day + 1, "operator": operator_id, "status": order_status}
+
+    def solve(self, time_limit=None, gap=None):
+        """
+        Resolve o modelo atual e extrai a solução.
+
+        Args:
+            time_limit (float, opcional): Tempo máximo de resolução, em segundos.
+            gap (float, opcional): Gap relativo aceito entre a solução e o limitante.
+
+        Returns:
+            dict: Solução de alocação de ordens a operadores por dia, com as estatísticas em `solution["stats"]`
+                  (ver `linear_programming_allocation`).
+        """
+        start_time = time.perf_counter()
+
+        # O PuLP guarda todas as variáveis já vistas pelo problema; após remoções, o problema é refeito
+        # a partir da objetivo e das restrições atuais (uma vez por resolução).
+        if self.removed_variables:
+            self._rebuild_problem()
+            self.removed_variables = False
+
+        # Resolve o problema sem exibir mensagens no terminal (o log do CBC é usado para ler o limitante)
+        log_file, log_path = tempfile.mkstemp(suffix=".log")
+        os.close(log_file)
+        try:
+            self.prob.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit, gapRel=gap,
+                                              warmStart=self.warm_start, logPath=log_path))
+            # Só há solução inteira quando o CBC a encontrou (ótima ou viável); ao parar pelo tempo antes disso,
+            # os valores das variáveis podem ser fracionários e não formam uma alocação válida.
+            integer_solution = self.prob.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible)
+            objective = pulp.value(self.prob.objective) if integer_solution else None
+            bound = _read_cbc_bound(log_path, objective, self.prob.sol_status) if integer_solution else None
+        finally:
+            os.remove(log_path)
+
+        solve_time = time.perf_counter()
+
+        # Inicializa a solução
+        solution = {
+            "orders": {},
+            "fitness": 0
+        }
+
+        if integer_solution:
+            # Cria a solução a partir das variáveis de decisão com valor 1 (no máximo uma por ordem)
+            for order_id, variables in self.order_variables.items():
+                for day, operator_id, variable in variables:
+                    if variable.varValue is not None and variable.varValue > 0.5:
+                        solution["orders"][order_id] = self._allocation(order_id, day, operator_id)
+                        break
+            fallback = None
+
+            # As próximas resoluções partem desta solução.
+            self.warm_start = True
+        elif self.initial_solution is not None:
+            # Sem solução inteira: devolve a solução inicial (warm start), que também é o ponto de partida
+            # da próxima resolução.
+            for order_id in self.order_variables:
+                allocation = self.initial_solution["orders"].get(order_id)
+                if allocation and allocation["operator"] is not None:
+                    solution["orders"][order_id] = self._allocation(order_id, allocation["day"] - 1, allocation["operator"])
+            fallback = "initial_solution"
+            self.set_initial_solution(self.initial_solution)
+        else:
+            # Sem solução inteira nem solução inicial: nenhuma ordem alocada.
+            fallback = "empty"
+            self.warm_start = False
+
+        end_time = time.perf_counter()
+
+        solution["stats"] = {
+            # O PuLP já informa "Not Solved" quando o CBC para pelo tempo; "Infeasible" é prova de inviabilidade.
+            "status": pulp.LpStatus[self.prob.status],
+            "solution_status": pulp.LpSolution[self.prob.sol_status],
+            "fallback": fallback,
+            "objective": objective,
+            "bound": bound,
+            "gap": abs(bound - objective) / max(abs(objective), 1e-9) if bound is not None and objective is not None else None,
+            "unservable_orders": self.unservable_orders,
+            "variables": self.n_variables,
+            "constraints": self.prob.numConstraints(),
+            "build_time": self.build_time,
+            "solve_time": solve_time - start_time,
+            "extract_time": end_time - solve_time,
+        }
+        self.build_time = 0.0
+
+        return solution
+
+def _read_cbc_bound(log_path, objective, solution_status):
     """
-    # Cria o problema de otimização
-    prob = pulp.LpProblem("Order_Allocation", pulp.LpMaximize)
-
-    # Cria as variáveis de decisão
-    x = pulp.LpVariable.dicts("x", ((day, op, order) for day in range(days) for op in operators for order in orders), cat='Binary')
-
-    # Função objetivo: maximizar a aptidão total
-    prob += pulp.lpSum(priority_to_number(orders[order]["priority"]) * x[day, op, order] for day in range(days) for op in operators for order in orders)
-
-    # Restrição: cada ordem deve ser atribuída a exatamente um operador em um dia
-    for order_id in orders:
-        prob += pulp.lpSum(x[day, op, order_id] for day in range(days) for op in operators) == 1
-
-    # Restrição: as habilidades do operador devem atender às habilidades necessárias para a ordem
-    for day in range(days):
-        for operator_id in operators:
-            for order_id in orders:
-                if not meets_minimum_skills(operators[operator_id]["skills"], orders[order_id]["required_skills"]):
-                    prob += x[day, operator_id, order_id] == 0
-
-    # Restrição: as horas de trabalho do operador não devem exceder as horas disponíveis
-    for day in range(days):
-        for operator_id in operators:
-            prob += pulp.lpSum(orders[order]["estimated_hours"] * x[day, operator_id, order] for order in orders) <= operators[operator_id]["hours_per_day"]
-
-    # Resolve o problema sem exibir mensagens no terminal
-    prob.solve(pulp.PULP_CBC_CMD(msg=False))
-
-    # Inicializa a solução
-    solution = {
-        "orders": {},
-        "fitness": 0
-    }
-
-    # Cria a solução a partir das variáveis de decisão
-    for day in range(days):
-        for operator_id in operators:
-            for order_id in orders:
-                if pulp.value(x[day, operator_id, order_id]) == 1:
-                    # Calcula a quantidade de dias em atraso, se late_order > 0 = atraso.. 
-                    late_order = day - orders[order_id]["expected_start_day"]
-
-                    order_status = "atendida"
-                    if late_order > 0:
-                        order_status = "atrasada"
-
-                    # Atualiza a solução para a OS atual
-                    solution["orders"][order_id] = {"day": day+1, "operator": operator_id, "status": order_status}
-
-    return solution
\ No newline at end of file
+    Lê o limitante da função objetivo no log do CBC.
+
+    Args:
+        log_path (str): Caminho do log gerado pelo CBC.
+        objective (float): Valor da função objetivo da solução encontrada.
+        solution_status (int): Status da solução retornado pelo PuLP (`prob.sol_status`).
+
+    Returns:
+        float: O limitante ("Upper bound"/"Lower bound" do log), o valor da objetivo se a solução é ótima,
+               ou None se não houver essa informação.
+    """
+    if solution_status == pulp.LpSolutionOptimal:
+        return objective
+
+    with open(log_path, encoding="utf-8", errors="ignore") as file:
+        match = re.search(r"^(?:Upper|Lower) bound:\s*(-?[\d.eE+-]+)", file.read(), re.MULTILINE)
+    return float(match.group(1)) if match else None
@@ -0,0 +1,133 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .chromosome import Chromosome, GenomeLayout, rng, set_seed
+from .eligibility import EligibilityIndex
+from .genetic_algorithm import crossover, mutate
+
+# Estado de cada processo trabalhador, criado uma única vez por `_init_worker`.
+_worker_state = {}
+
+def _seed_generators(seed_sequence):
+    """
+    Reinicia os geradores `random` e `chromosome.rng` do processo a partir de uma `np.random.SeedSequence`.
+    """
+    random.seed(seed_sequence.generate_state(4).tobytes())
+    set_seed(seed_sequence)
+
+def _init_worker(operators, orders, days, compact_genome, seed_sequence):
+    """
+    Inicializa um processo trabalhador: recebe operadores e ordens uma única vez e monta os índices da instância.
+
+    Detalhes:
+    - Os geradores aleatórios são reiniciados pela semente do pool, derivada do estado dos geradores do processo
+      principal, pois processos criados por `fork` herdariam o mesmo estado e gerariam filhos idênticos.
+      Cada tarefa depois reinicia os geradores com a própria semente (ver `_generate_offspring`).
+    """
+    index = EligibilityIndex(operators, orders)
+    _worker_state["operators"] = operators
+    _worker_state["orders"] = orders
+    _worker_state["days"] = days
+    _worker_state["index"] = index
+    _worker_state["layout"] = GenomeLayout(operators, orders, days, index) if compact_genome else None
+
+    _seed_generators(seed_sequence)
+
+def pack_individual(individual):
+    """
+    Reduz um indivíduo ao necessário para o envio entre processos (o cromossomo não leva o índice da instância).
+    """
+    if isinstance(individual, Chromosome):
+        return (individual.operator, individual.day, individual.fitness)
+    return individual
+
+def unpack_individual(packed, layout):
+    if layout is not None and isinstance(packed, tuple):
+        operator, day, fitness = packed
+        return Chromosome(layout, operator, day, fitness)
+    return packed
+
+def _generate_offspring(elite, pairs, mutation_rate, seed_sequence):
+    """
+    Gera e avalia, no processo trabalhador, os filhos dos pares de pais informados.
+
+    Args:
+        elite (list): Indivíduos da elite, já reduzidos por `pack_individual`.
+        pairs (list): Pares (i, j) de índices dos pais na elite.
+        mutation_rate (float): Taxa de mutação da geração.
+        seed_sequence (np.random.SeedSequence): Semente da tarefa.
+
+    Returns:
+        list: Filhos reduzidos por `pack_individual`, na ordem dos pares.
+    """
+    _seed_generators(seed_sequence)
+    state = _worker_state
+    elite = [unpack_individual(individual, state["layout"]) for individual in elite]
+    children = []
+    for i, j in pairs:
+        child = crossover(elite[i], elite[j], state["operators"], state["orders"], state["days"], state["index"])
+        child = mutate(child, state["operators"], state["orders"], mutation_rate, state["days"], state["index"])
+        children.append(pack_individual(child))
+    return children
+
+class OffspringPool:
+    """
+    Geração paralela de filhos (crossover + mutação + fitness) em um `ProcessPoolExecutor`.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        days (int): Número de dias do planejamento.
+        layout (GenomeLayout, opcional): Índice da instância no processo principal (None para soluções em dicionário).
+        workers (int, opcional): Número de processos (padrão: número de núcleos da máquina).
+
+    Detalhes:
+    - Operadores e ordens são enviados uma única vez para cada processo, pelo inicializador do pool.
+      Cada tarefa leva apenas os genomas da elite e os pares de pais sorteados.
+    - A seleção dos pais continua no processo principal (ver `GeneticEngine.step`), então o elitismo e a
+      seleção não mudam; apenas a geração dos filhos é distribuída, em um lote por processo.
+    - As sementes vêm de uma `np.random.SeedSequence` derivada do estado de `random` e `chromosome.rng` do
+      processo principal: ela é enviada pelo inicializador e cada lote recebe uma semente própria, gerada em
+      sequência por `spawn`. Como a semente acompanha o lote (e não o processo que o executa), execuções com
+      as mesmas sementes e o mesmo número de processos geram os mesmos filhos.
+    """
+
+    def __init__(self, operators, orders, days, layout=None, workers=None):
+        self.layout = layout
+        self.workers = workers or os.cpu_count() or 1
+        self.seed_sequence = np.random.SeedSequence([random.getrandbits(64), int(rng.integers(2 ** 63))])
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(operators, orders, days, layout is not None,
+                                                      self.seed_sequence))
+
+    def generate(self, elite, pairs, mutation_rate):
+        """
+        Gera os filhos de todos os pares de pais, distribuindo os pares entre os processos.
+
+        Args:
+            elite (list): Indivíduos da elite.
+            pairs (list): Pares (i, j) de índices dos pais na elite.
+            mutation_rate (float): Taxa de mutação da geração.
+
+        Returns:
+            list: Filhos já avaliados, na ordem dos pares.
+        """
+        if not pairs:
+            return []
+
+        packed_elite = [pack_individual(individual) for individual in elite]
+        batch = -(-len(pairs) // self.workers)
+        starts = range(0, len(pairs), batch)
+        seeds = self.seed_sequence.spawn(len(starts))
+        futures = [self.executor.submit(_generate_offspring, packed_elite, pairs[start:start + batch], mutation_rate,
+                                        seed)
+                   for start, seed in zip(starts, seeds)]
+
+        children = []
+        for future in futures:
+            children.extend(unpack_individual(child, self.layout) for child in future.result())
+        return children
+
+    def close(self):
+        self.executor.shutdown()
@@ -0,0 +1,113 @@
+import numpy as np
+from .chromosome import Chromosome, UNASSIGNED
+from .common_functions import calculate_fitness
+
+# Limite de genes avaliados por bloco de indivíduos (controla o uso de memória em populações grandes).
+_MAX_BLOCK_ELEMENTS = 4_000_000
+
+def evaluate_population(population, layout):
+    """
+    Calcula a aptidão de toda a população de uma só vez, com operações vetorizadas do NumPy.
+
+    Args:
+        population (list): Indivíduos da população (Chromosome ou solução no formato em dicionário).
+        layout (GenomeLayout): Índice da instância (vetores de prioridade, horas, início esperado e
+                               compatibilidade operador x ordem do índice de elegibilidade).
+
+    Returns:
+        np.ndarray: A aptidão de cada indivíduo, na ordem da população.
+
+    Detalhes:
+    - Os critérios são os mesmos de `calculate_fitness`: compatibilidade de habilidades e atraso ponderados
+      pela prioridade, e penalidade pelo excesso de horas por operador e dia.
+    - As horas por operador e dia de todos os indivíduos são acumuladas em um único `np.bincount`.
+    - Quando todas as pontuações de compatibilidade são múltiplos de 0.5 (habilidades exigidas em 1 ou 2),
+      a soma é exata em qualquer ordem. Caso contrário, as parcelas são acumuladas em sequência, na mesma
+      ordem de `calculate_fitness`, para que o resultado seja idêntico.
+    - Em soluções no formato em dicionário, o atraso só é penalizado nas ordens com status "atrasada",
+      como em `calculate_fitness`; nos cromossomos o status é derivado do dia (ver `Chromosome.status`).
+    - Se a soma não é exata e as ordens de uma solução em dicionário não seguem a ordem do índice, a
+      solução é avaliada por `calculate_fitness`, que soma as parcelas na ordem do dicionário.
+    - Populações grandes são avaliadas em blocos de indivíduos para limitar a memória.
+    - O fitness calculado também é gravado em cada indivíduo.
+    """
+    chromosomes = [individual if isinstance(individual, Chromosome) else Chromosome.from_solution(individual, layout)
+                   for individual in population]
+    late = [None if isinstance(individual, Chromosome) else _late_mask(individual, layout)
+            for individual in population]
+    fitness = np.empty(len(chromosomes), dtype=np.float64)
+
+    block = max(1, _MAX_BLOCK_ELEMENTS // max(1, layout.n_orders))
+    for start in range(0, len(chromosomes), block):
+        fitness[start:start + block] = _evaluate_block(chromosomes[start:start + block], layout,
+                                                       late[start:start + block])
+
+    if not layout.exact_scores:
+        for i, individual in enumerate(population):
+            if late[i] is not None and not _in_layout_order(individual, layout):
+                fitness[i] = calculate_fitness(individual, layout.operators, layout.orders, layout.max_days,
+                                               layout.eligibility)
+
+    for chromosome, individual, value in zip(chromosomes, population, fitness):
+        chromosome.fitness = float(value)
+        if individual is not chromosome:
+            individual["fitness"] = float(value)
+
+    return fitness
+
+def _late_mask(solution, layout):
+    """
+    Ordens com status "atrasada" em uma solução no formato em dicionário, na ordem do índice.
+    """
+    solution_orders = solution["orders"]
+    return np.fromiter((order_id in solution_orders and solution_orders[order_id]["status"] == "atrasada"
+                        for order_id in layout.order_ids), dtype=bool, count=layout.n_orders)
+
+def _in_layout_order(solution, layout):
+    """
+    Verifica se as ordens de uma solução no formato em dicionário seguem a ordem do índice.
+    """
+    positions = np.fromiter((layout.order_position[order_id] for order_id in solution["orders"]), dtype=np.int64)
+    return bool(np.all(np.diff(positions) > 0))
+
+def _evaluate_block(chromosomes, layout, late=None):
+    """
+    Avalia um bloco de cromossomos com uma única passada vetorizada.
+
+    `late` traz, para cada indivíduo, as ordens cujo atraso é penalizado (None: todas as ordens).
+    """
+    operator = np.stack([chromosome.operator for chromosome in chromosomes]).astype(np.int64)
+    day = np.stack([chromosome.day for chromosome in chromosomes]).astype(np.int64)
+    assigned = operator != UNASSIGNED
+
+    n_individuals, n_orders = operator.shape
+    n_slots = layout.n_operators * layout.max_days
+
+    # Genes não atribuídos apontam para o operador 0 / dia 1, mas têm peso zero.
+    operator[~assigned] = 0
+    day[~assigned] = 1
+
+    # Compatibilidade de habilidades ponderada pela prioridade.
+    match = layout.match_percentage(operator, np.arange(n_orders))
+    skill_score = np.where(match >= 0.5, 10 * match, -10.0) * (layout.priority * assigned)
+
+    # Penalidade de atraso (dias além do início esperado).
+    late_penalty = 5 * np.maximum(0, day - layout.expected_start_day) * (layout.priority * assigned)
+    if late is not None and any(mask is not None for mask in late):
+        late_penalty *= np.stack([mask if mask is not None else np.ones(n_orders, dtype=bool) for mask in late])
+
+    # Horas por indivíduo, operador e dia em uma única contagem ponderada.
+    slot = np.arange(n_individuals)[:, None] * n_slots + operator * layout.max_days + (day - 1)
+    daily_hours = np.bincount(slot.ravel(), weights=(layout.estimated_hours * assigned).ravel(),
+                              minlength=n_individuals * n_slots).reshape(n_individuals, n_slots)
+    excess_penalty = 5 * np.maximum(0, daily_hours - np.repeat(layout.hours_per_day, layout.max_days))
+
+    if layout.exact_scores:
+        return skill_score.sum(axis=1) - late_penalty.sum(axis=1) - excess_penalty.sum(axis=1)
+
+    # Soma sequencial: atraso e compatibilidade de cada ordem, depois o excesso por operador e dia.
+    terms = np.empty((n_individuals, 2 * n_orders + n_slots), dtype=np.float64)
+    terms[:, 0:2 * n_orders:2] = -late_penalty
+    terms[:, 1:2 * n_orders:2] = skill_score
+    terms[:, 2 * n_orders:] = -excess_penalty
+    return np.add.accumulate(terms, axis=1)[:, -1]
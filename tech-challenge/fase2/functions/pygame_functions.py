@@ -1,144 +1,298 @@
 #Imports para o funcionamento do PyGame
 import pygame
-import pylab
-import matplotlib.backends.backend_agg as agg
+import functools
 import math
+import numpy as np
+from .chromosome import Chromosome, UNASSIGNED, STATUS_CODES
 
-# Função para desenhar o plot do matplotlib na tela.
-def draw_plot(screen, x, y, x_label = 'Generation', y_label = 'Fitness', window_size=(1000, 600)):
+# Fonte carregada uma única vez por (nome, tamanho).
+@functools.lru_cache(maxsize=None)
+def get_font(name=None, size=16):
     """
-    Desenha um gráfico em um buffer e exibe na tela do Pygame.
+    Retorna a fonte do pygame com o nome (fonte do sistema) e o tamanho informados, criada apenas na primeira chamada.
 
     Args:
-        screen: A superfície do Pygame onde o gráfico será desenhado.
-        x: Lista de valores para o eixo x.
-        y: Lista de valores para o eixo y.
+        name: Nome da fonte do sistema (None para a fonte padrão do pygame).
+        size: Tamanho da fonte.
+    """
+    pygame.font.init()
+    return pygame.font.SysFont(name, size) if name else pygame.font.Font(None, size)
+
+def _round_limits(low, high, ticks):
+    """
+    Limites de um eixo que contêm [low, high] e são divididos em `ticks` passos "redondos" (1, 2 ou 5 x 10^n).
+    """
+    magnitude = 10 ** math.floor(math.log10((high - low) / ticks))
+    for factor in (1, 2, 5, 10, 20):
+        step = factor * magnitude
+        start = math.floor(low / step) * step
+        if start + ticks * step >= high:
+            return start, start + ticks * step
+
+# Gráfico de linha do fitness desenhado direto no pygame.
+class FitnessChart:
+    """
+    Gráfico de linha do fitness por geração, desenhado em uma superfície própria e atualizado incrementalmente.
+
+    Args:
+        size: Tamanho do gráfico (largura, altura) em pixels.
         x_label: Rótulo do eixo x.
         y_label: Rótulo do eixo y.
-        window_size: Tamanho da janela (largura, altura)
+        capacity: Número inicial de gerações do eixo x.
+
+    Detalhes:
+    - A superfície é criada uma única vez; a cada geração apenas o segmento até o novo ponto é desenhado.
+    - Os eixos só mudam de escala quando o novo ponto sai da área do gráfico: o eixo x dobra de tamanho e o
+      eixo y ganha uma folga, então o redesenho completo do histórico é raro e o custo por quadro é constante.
     """
-    # Cria a figura com tamanho e resolução especificados.
-    fig = pylab.figure(figsize=[4, 4], # Inches
-                       dpi=100,        # 100 dots por inch, resultado do buffer = 400x400 pixels
-                       )
-    ax = fig.gca()
-    ax.plot(x, y)
-    ax.set_xlabel(x_label)
-    ax.set_ylabel(y_label)
-
-    # Renderiza a figura no buffer.
-    canvas = agg.FigureCanvasAgg(fig)
-    canvas.draw()
-    renderer = canvas.get_renderer()
-    raw_data = renderer.tostring_rgb()
-
-    # Converte o buffer em uma superfície do Pygame.
-    size = canvas.get_width_height()
-    surf = pygame.image.fromstring(raw_data, size, "RGB")
-
-    # Calcula o deslocamento para centralizar o gráfico na metade esquerda da tela.
-    x_offset = 50  # Fica na metade esquerda da tela.
-    y_offset = (window_size[1] - size[1]) // 2  # Centraliza verticalmente.
-
-    screen.blit(surf, (x_offset,y_offset))
-
-    # Fecha a figura para liberar memória
-    pylab.close(fig)
+
+    margins = (55, 15, 15, 40)  # Esquerda, topo, direita e base (espaço para os rótulos).
+    background = (255, 255, 255)
+    axis_color = (0, 0, 0)
+    grid_color = (225, 225, 225)
+    line_color = (31, 119, 180)
+    ticks = 5
+
+    def __init__(self, size=(400, 400), x_label='Generation', y_label='Fitness', capacity=50):
+        self.surface = pygame.Surface(size)
+        left, top, right, bottom = self.margins
+        self.plot_area = pygame.Rect(left, top, size[0] - left - right, size[1] - top - bottom)
+        self.x_label = x_label
+        self.y_label = y_label
+        self.capacity = max(int(capacity), 2)
+        self.x_max = self.capacity
+        self.y_min = self.y_max = None
+        self.values = []
+        self.font = get_font(None, 16)
+        self._rescale()
+
+    def update(self, values):
+        """
+        Acrescenta ao gráfico os valores de `values` ainda não desenhados (o histórico completo do fitness).
+
+        Returns:
+            bool: Se o gráfico mudou.
+        """
+        previous = len(self.values)
+        if len(values) < len(self.values):
+            # Histórico reiniciado: recomeça o gráfico.
+            self.values = []
+            previous = -1
+            self.x_max = self.capacity
+            self.y_min = self.y_max = None
+            self._rescale()
+        for value in values[len(self.values):]:
+            self.append(value)
+        return len(self.values) != previous
+
+    def append(self, value):
+        """
+        Acrescenta um ponto ao gráfico, desenhando só o novo segmento (ou redesenhando tudo se a escala mudar).
+        """
+        value = float(value)
+        self.values.append(value)
+        if len(self.values) > self.x_max or self.y_min is None or not self.y_min <= value <= self.y_max:
+            self._rescale()
+        elif len(self.values) > 1:
+            pygame.draw.line(self.surface, self.line_color, self._point(len(self.values) - 2, self.values[-2]),
+                             self._point(len(self.values) - 1, value), 2)
+
+    def draw(self, screen, window_size=(1000, 600)):
+        """
+        Exibe o gráfico na metade esquerda da tela, centralizado verticalmente, e retorna o retângulo ocupado.
+        """
+        return screen.blit(self.surface, (50, (window_size[1] - self.surface.get_height()) // 2))
+
+    def _point(self, x, y):
+        area = self.plot_area
+        return (area.left + x * (area.width - 1) / self.x_max,
+                area.bottom - 1 - (y - self.y_min) * (area.height - 1) / (self.y_max - self.y_min))
+
+    def _rescale(self):
+        # Novos limites dos eixos, com folga para os próximos pontos.
+        while len(self.values) - 1 > self.x_max:
+            self.x_max *= 2
+        if self.values:
+            low, high = min(self.values), max(self.values)
+            margin = max((high - low) * 0.25, abs(high) * 0.05, 1.0)
+            low = low - margin if self.y_min is None or low < self.y_min else self.y_min
+            high = high + margin if self.y_max is None or high > self.y_max else self.y_max
+            self.y_min, self.y_max = _round_limits(low, high, self.ticks)
+        self._draw_axes()
+        if len(self.values) > 1:
+            pygame.draw.lines(self.surface, self.line_color, False,
+                              [self._point(x, y) for x, y in enumerate(self.values)], 2)
+
+    def _draw_axes(self):
+        area = self.plot_area
+        self.surface.fill(self.background)
+        y_min, y_max = (self.y_min, self.y_max) if self.y_min is not None else (0.0, 1.0)
+        decimals = max(0, -math.floor(math.log10((y_max - y_min) / self.ticks)))
+        for i in range(self.ticks + 1):
+            # Linhas de grade e valores dos eixos.
+            x = area.left + i * (area.width - 1) / self.ticks
+            y = area.bottom - 1 - i * (area.height - 1) / self.ticks
+            pygame.draw.line(self.surface, self.grid_color, (x, area.top), (x, area.bottom - 1))
+            pygame.draw.line(self.surface, self.grid_color, (area.left, y), (area.right - 1, y))
+            x_text = self.font.render(f"{i * self.x_max / self.ticks:.0f}", True, self.axis_color)
+            self.surface.blit(x_text, x_text.get_rect(midtop=(x, area.bottom + 4)))
+            y_text = self.font.render(f"{y_min + i * (y_max - y_min) / self.ticks:.{decimals}f}", True, self.axis_color)
+            self.surface.blit(y_text, y_text.get_rect(midright=(area.left - 4, y)))
+        pygame.draw.rect(self.surface, self.axis_color, area, 1)
+
+        x_label = self.font.render(self.x_label, True, self.axis_color)
+        self.surface.blit(x_label, x_label.get_rect(midbottom=(area.centerx, self.surface.get_height() - 2)))
+        y_label = pygame.transform.rotate(self.font.render(self.y_label, True, self.axis_color), 90)
+        self.surface.blit(y_label, y_label.get_rect(midleft=(2, area.centery)))
     
     
-# Função para desenhar os quadrados com base no status das ordens
-def draw_squares(screen, population, orders, n_orders, window_size=(1000, 600)):
+# Cores dos quadrados por status da ordem.
+STATUS_COLORS = {
+    "atendida": (0, 255, 0),        # Verde para atendida.
+    "atrasada": (255, 255, 102),    # Amarelo para atrasada.
+    "não atendida": (255, 51, 0),   # Vermelha para não atendida.
+}
+EMPTY_COLOR = (0, 0, 26)  # Azul Petróleo para posições da matriz sem ordem.
+
+# Matriz de quadrados com o status das ordens, redesenhando só o que mudou.
+class OrderGrid:
     """
-    Desenha uma matriz de quadrados na tela, representando o status das ordens.
+    Matriz de quadrados na metade direita da tela, um por ordem, com a cor do status e o operador alocado.
 
     Args:
-        screen: A superfície do Pygame onde os quadrados serão desenhados.
-        population: A solução atual (alocação de ordens por operadores e dias).
-        operators: Operadores disponíveis.
-        orders: Ordens disponíveis.
-        n_orders: Número total de ordens.
-        window_size: Tamanho da janela (largura, altura)
+        orders: Ordens disponíveis ou lista dos seus identificadores (define a posição de cada quadrado).
+        window_size: Tamanho da janela (largura, altura).
+        max_square_size: Tamanho máximo de cada quadrado (reduzido para a matriz caber na tela).
+
+    Detalhes:
+    - Cada combinação (status, operador) é renderizada uma única vez em um "tile" guardado em cache;
+      desenhar um quadrado é só copiar o tile para a tela.
+    - `draw` redesenha apenas os quadrados cujo status ou operador mudou desde o quadro anterior e retorna os
+      retângulos alterados, para a atualização parcial com `pygame.display.update`.
+    - Com um cromossomo (ou os vetores de `draw_codes`), as mudanças são detectadas direto nos vetores, sem montar
+      o dicionário das ordens.
     """
-    
-    # Define o tamanho de cada quadrado e a distância entre os quadrados.
-    square_size = 40
-    distance_between_squares = 5
 
-    # Ajusta o tamanho da fonte para caber no quadrado
-    font_size = square_size // 2  # Tamanho da fonte é metade do tamanho do quadrado
-    font = pygame.font.Font(None, font_size)  # Cria a fonte com o tamanho ajustado
-    
-    # Calcula o tamanho da matriz.
-    
-    n_columns = math.floor(n_orders ** 0.5)
-    n_rows = math.ceil(n_orders / n_columns)
-    matrix_width = n_columns * (square_size + distance_between_squares) - distance_between_squares
-    matrix_height = n_columns * (square_size + distance_between_squares) - distance_between_squares
-
-    # Calcula os deslocamentos para centralizar a matriz na metade direita da tela.
-    x_offset = window_size[0] // 2  # Começa no meio da tela, à direita.
-    y_offset = (window_size[1] - matrix_height) // 2  # Centraliza verticalmente.
-
-    # Índice para acessar as ordens.
-    order_ids = list(orders.keys())  # Lista de IDs das ordens.
-    total_orders = n_orders
-
-
-    # Criar uma lista de superfícies para os quadrados.
-    square_surfaces = []
-
-    # Desenha a matriz de quadrados.
-    for row in range(n_rows):
-        for col in range(n_columns):
-            x = col * (square_size + distance_between_squares) + x_offset
-            y = row * (square_size + distance_between_squares) + y_offset
-            
-            # Calcula o índice da ordem correspondente.
-            order_index = row * n_columns + col
-            if order_index < total_orders:
-                order_id = order_ids[order_index]
-                order = population["orders"][order_id]
-                
-                # Determina o operador.
-                operator_id = order["operator"]
-                operator = operator_id if operator_id is not None else "N/A"
-               
-                # Define a cor com base no status da ordem.
-                if order["status"] == "atendida":
-                    color = (0, 255, 0)  # Verde para atendida.
-                elif order["status"] == "atrasada":
-                    color = (255, 255, 102)  # Amarelo para atrasada.
-                else:
-                    color = (255, 51, 0)  # Vermelha para não atendida.
-            else:
-                # Caso não haja ordem correspondente .
-                color = (0, 0, 26)  # Azul Petroleto para erro de referência.
-
-            # Cria a superfície para o quadrado.
-            square_surface = pygame.Surface((square_size, square_size))
-            square_surface.fill(color) 
-            
-            # Renderiza o texto do operador.
-            operator_text = font.render(str(operator), True, (0, 0, 0))  # Texto em preto.
-            
-            # Verifica o texto gerado
-            text_rect = operator_text.get_rect(center=(square_size // 2, square_size // 2))  # Centraliza o texto
-            square_surface.blit(operator_text, text_rect)  
-
-            # Adiciona a superfície à lista.
-            square_surfaces.append((square_surface, x, y))
-
-    # Agora desenha todos os quadrados de uma vez.
-    for surface, x, y in square_surfaces:
-        screen.blit(surface, (x, y))
-           
+    def __init__(self, orders, window_size=(1000, 600), max_square_size=40):
+        self.order_ids = list(orders)
+        n_orders = len(self.order_ids)
+        self.n_columns = max(math.floor(n_orders ** 0.5), 1)
+        self.n_rows = max(math.ceil(n_orders / self.n_columns), 1)
+
+        # Tamanho dos quadrados ajustado para a matriz caber na metade direita da tela.
+        max_cell = max_square_size + max_square_size // 8
+        cell = max(min(max_cell, (window_size[0] // 2 - 20) // self.n_columns, (window_size[1] - 40) // self.n_rows), 2)
+        distance_between_squares = max(cell * max_square_size // max_cell // 8, 1)
+        self.square_size = cell - distance_between_squares
+
+        # Posição de cada quadrado, centralizando a matriz verticalmente.
+        matrix_height = self.n_rows * cell - distance_between_squares
+        x_offset = window_size[0] // 2  # Começa no meio da tela, à direita.
+        y_offset = (window_size[1] - matrix_height) // 2
+        self.rects = [pygame.Rect(col * cell + x_offset, row * cell + y_offset, self.square_size, self.square_size)
+                      for row in range(self.n_rows) for col in range(self.n_columns)]
+        self.area = self.rects[0].unionall(self.rects)
+
+        # Texto só quando cabe no quadrado (fonte com metade do tamanho do quadrado).
+        self.font = get_font(None, self.square_size // 2) if self.square_size >= 12 else None
+        self.tiles = {}
+        self.cells = None
+
+    def invalidate(self):
+        """
+        Força o redesenho de todos os quadrados no próximo `draw` (ex.: depois de limpar a tela).
+        """
+        self.cells = None
+
+    def tile(self, status, label):
+        """
+        Superfície do quadrado para o status e o rótulo (operador) informados, criada só no primeiro uso.
+        """
+        key = (status, label)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = pygame.Surface((self.square_size, self.square_size))
+            tile.fill(STATUS_COLORS.get(status, STATUS_COLORS["não atendida"]) if status is not None else EMPTY_COLOR)
+            if self.font is not None and label is not None:
+                text = self.font.render(str(label), True, (0, 0, 0))  # Texto em preto.
+                tile.blit(text, text.get_rect(center=(self.square_size // 2, self.square_size // 2)))
+            if pygame.display.get_surface() is not None:
+                tile = tile.convert()  # Mesmo formato da tela: cópias mais rápidas.
+            self.tiles[key] = tile
+        return tile
+
+    def draw(self, screen, solution):
+        """
+        Desenha os quadrados que mudaram desde a última chamada.
+
+        Args:
+            screen: A superfície do Pygame onde os quadrados serão desenhados.
+            solution: A solução atual (cromossomo ou dicionário com a alocação das ordens).
+
+        Returns:
+            list: Retângulos da tela que foram alterados.
+        """
+        if isinstance(solution, Chromosome):
+            return self.draw_codes(screen, solution.operator, solution.status_codes(), solution.layout.operator_ids)
+        changed, cells = self._changed_orders(solution)
+        return self._blit(screen, changed, cells)
+
+    def draw_codes(self, screen, operator, status, operator_ids):
+        """
+        Desenha os quadrados que mudaram a partir dos vetores de operadores e de status das ordens.
+
+        Args:
+            screen: A superfície do Pygame onde os quadrados serão desenhados.
+            operator: Índice em `operator_ids` do operador de cada ordem (UNASSIGNED se não atribuída).
+            status: Código do status de cada ordem (posição em `STATUS_CODES`).
+            operator_ids: Identificadores dos operadores.
+
+        Returns:
+            list: Retângulos da tela que foram alterados.
+        """
+        operator = np.asarray(operator, dtype=np.int64)
+        cells = (operator + 1) * len(STATUS_CODES) + status
+        if not isinstance(self.cells, np.ndarray):
+            positions = range(len(cells))
+        else:
+            positions = np.flatnonzero(cells != self.cells).tolist()
+        changed = [(position, STATUS_CODES[status[position]],
+                    operator_ids[operator[position]] if operator[position] != UNASSIGNED else "N/A")
+                   for position in positions]
+        return self._blit(screen, changed, cells)
+
+    def _blit(self, screen, changed, cells):
+        if self.cells is None:
+            # Primeiro quadro (ou depois de `invalidate`): posições sem ordem também são desenhadas.
+            empty = self.tile(None, None)
+            for rect in self.rects[len(self.order_ids):]:
+                screen.blit(empty, rect)
+
+        for position, status, label in changed:
+            screen.blit(self.tile(status, label), self.rects[position])
+
+        full_redraw = self.cells is None or len(changed) > len(self.rects) // 4
+        self.cells = cells
+        if full_redraw:
+            return [self.area]
+        return [self.rects[position] for position, _, _ in changed]
+
+    def _changed_orders(self, solution):
+        solution_orders = solution["orders"]
+        cells = [(allocation["status"], allocation["operator"] if allocation["operator"] is not None else "N/A")
+                 for allocation in (solution_orders[order_id] for order_id in self.order_ids)]
+        previous = self.cells if isinstance(self.cells, list) else [None] * len(cells)
+        changed = [(position, status, label) for position, ((status, label), old) in enumerate(zip(cells, previous))
+                   if (status, label) != old]
+        return changed, cells
+
 # Função para renderizar texto na tela
 def draw_text(screen, text, x_position, y_position, color=(0, 0, 0), font_size=30, font='Arial'):
-    # Initialize Pygame font.
-    pygame.font.init()
-    
-    # Set the font and size.
-    font = pygame.font.SysFont(font, font_size)
+    """
+    Desenha um texto na tela e retorna o retângulo ocupado (para atualizações parciais da tela).
+    """
+    # Fonte em cache (criada apenas na primeira chamada com este nome e tamanho).
+    font = get_font(font, font_size)
     
     # Render the text
     text_surface = font.render(text, True, color)
@@ -150,4 +304,5 @@ def draw_text(screen, text, x_position, y_position, color=(0, 0, 0), font_size=3
     text_rect.topleft = (x_position, y_position)
     
     # Blit the text onto the screen.
-    screen.blit(text_surface, text_rect)
\ No newline at end of file
+    screen.blit(text_surface, text_rect)
+    return text_rect
@@ -0,0 +1,94 @@
+import time
+from .eligibility import EligibilityIndex
+
+def rolling_horizon_allocation(operators, orders, days, solve_window, window=5, step=1, index=None):
+    """
+    Aloca as ordens em um horizonte longo resolvendo janelas deslizantes de poucos dias.
+
+    Args:
+        operators (dict): Operadores disponíveis.
+        orders (dict): Ordens de serviço a serem alocadas.
+        days (int): Número total de dias do planejamento.
+        solve_window (callable): Função `solve_window(operators, orders, days, index)` que aloca as ordens
+                                 em uma janela de `days` dias (dias 1..days) e retorna a solução em dicionário.
+        window (int): Número de dias de cada janela.
+        step (int): Número de dias fixados ao fim de cada janela (deslocamento da janela).
+        index (EligibilityIndex, opcional): Índice de elegibilidade da instância (construído se não fornecido).
+
+    Returns:
+        dict: Solução no formato {"orders": {order_id: {"day", "operator", "status"}}, "fitness": 0}, com os dias
+              absolutos do horizonte e o resumo das janelas em `solution["stats"]`.
+
+    Detalhes:
+    - Cada janela começa no primeiro dia ainda não fixado. As alocações dos primeiros `step` dias da janela
+      são fixadas; as ordens alocadas depois deles ou não alocadas seguem para a próxima janela.
+    - Na última janela (que alcança o fim do horizonte), todas as alocações são fixadas.
+    - Dentro de uma janela, o dia esperado de início das ordens é deslocado para os dias relativos da janela,
+      então o atraso continua sendo medido em relação ao dia absoluto.
+    - As janelas são independentes: os dias fixados saem do horizonte, então não há capacidade residual a repassar.
+    """
+    if index is None:
+        index = EligibilityIndex(operators, orders)
+
+    solution = {
+        "orders": {},
+        "fitness": 0
+    }
+    pending = dict(orders)
+    windows = []
+
+    offset = 0
+    while offset < days and pending:
+        window_days = min(window, days - offset)
+        commit_days = window_days if offset + window_days >= days else min(step, window_days)
+
+        # Ordens pendentes com o dia esperado relativo à janela.
+        window_orders = {order_id: {**order, "expected_start_day": order["expected_start_day"] - offset}
+                         for order_id, order in pending.items()}
+
+        start_time = time.perf_counter()
+        window_solution = solve_window(operators, window_orders, window_days, index)
+        elapsed = time.perf_counter() - start_time
+
+        committed = 0
+        for order_id, allocation in window_solution["orders"].items():
+            if allocation["operator"] is None or allocation["day"] is None or allocation["day"] > commit_days:
+                continue
+            day = allocation["day"] + offset
+            status = "atrasada" if day > orders[order_id]["expected_start_day"] else "atendida"
+            solution["orders"][order_id] = {"day": day, "operator": allocation["operator"], "status": status}
+            del pending[order_id]
+            committed += 1
+
+        windows.append({"first_day": offset + 1, "days": window_days, "orders": len(window_orders),
+                        "committed": committed, "time": elapsed})
+        offset += commit_days
+
+    solution["stats"] = {
+        "windows": len(windows),
+        "window_details": windows,
+        "unassigned": len(pending),
+        "solve_time": sum(details["time"] for details in windows),
+    }
+    return solution
+
+def genetic_window_solver(**engine_options):
+    """
+    Cria uma função `solve_window` que aloca cada janela com o algoritmo genético.
+
+    Args:
+        **engine_options: Parâmetros repassados ao `GeneticEngine` (população, gerações, taxa de mutação...).
+
+    Returns:
+        callable: Função compatível com `rolling_horizon_allocation`.
+    """
+    # Importado aqui: o motor só é necessário quando o algoritmo genético é usado nas janelas.
+    from .genetic_engine import GeneticEngine
+
+    def solve_window(operators, orders, days, index):
+        # O índice de elegibilidade depende da ordem das ordens, então é reconstruído para as ordens pendentes.
+        engine = GeneticEngine(operators, orders, days=days, **engine_options)
+        best_solution = engine.run()
+        return {"orders": best_solution["orders"], "fitness": best_solution["fitness"]}
+
+    return solve_window
@@ -0,0 +1,205 @@
+import multiprocessing
+import queue
+import numpy as np
+from .chromosome import Chromosome, UNASSIGNED, STATUS_CODES
+from .generation_profiler import no_phase
+
+# Quadros aguardando na fila do visualizador; quadros novos são descartados enquanto ela estiver cheia.
+MAX_PENDING_FRAMES = 2
+
+def solution_snapshot(solution, layout):
+    """
+    Vetores compactos com o operador e o status de cada ordem de uma solução.
+
+    Args:
+        solution: Cromossomo ou solução no formato em dicionário.
+        layout (GenomeLayout): Índice da instância (ordem das ordens e dos operadores).
+
+    Returns:
+        tuple: (índice do operador de cada ordem, UNASSIGNED se não atribuída; código do status em `STATUS_CODES`).
+    """
+    if isinstance(solution, Chromosome):
+        return solution.operator.copy(), solution.status_codes()
+    codes = {status: code for code, status in enumerate(STATUS_CODES)}
+    solution_orders = solution["orders"]
+    allocations = [solution_orders[order_id] for order_id in layout.order_ids]
+    operator = np.fromiter((layout.operator_position[allocation["operator"]] if allocation["operator"] is not None
+                            else UNASSIGNED for allocation in allocations), dtype=np.int16, count=len(allocations))
+    status = np.fromiter((codes.get(allocation["status"], 0) for allocation in allocations),
+                         dtype=np.int8, count=len(allocations))
+    return operator, status
+
+class RemoteVisualizer:
+    """
+    Janela do pygame em um processo separado, alimentada por instantâneos da melhor solução de cada geração.
+
+    Args:
+        engine (GeneticEngine): Motor observado (registra `send` como callback).
+        window_size (tuple): Tamanho da janela (largura, altura).
+        fps (int): Quadros por segundo máximos da janela.
+        background (tuple): Cor de fundo da janela.
+
+    Detalhes:
+    - O otimizador nunca espera pela tela: cada instantâneo (fitness novos, operador e status das ordens) vai
+      para uma fila limitada com `put_nowait`; se a fila está cheia, o quadro é descartado e os fitness ainda
+      não enviados seguem no próximo quadro, então o gráfico não perde pontos.
+    - A janela esvazia a fila a cada quadro e desenha só o instantâneo mais recente (quadros atrasados são
+      descartados também do lado dela).
+    - Espaço congela a tela e "q" fecha a janela; o otimizador continua em qualquer caso.
+    """
+
+    def __init__(self, engine, window_size=(1000, 600), fps=10, background=(204, 204, 204)):
+        self.engine = engine
+        context = multiprocessing.get_context("spawn")
+        self.frames = context.Queue(maxsize=MAX_PENDING_FRAMES)
+        self.process = context.Process(target=run_viewer, daemon=True,
+                                       args=(self.frames, engine.layout.order_ids, engine.layout.operator_ids,
+                                             window_size, fps, background))
+        self.sent_fitness = 0
+        self.sent_frames = 0
+        self.dropped_frames = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close(wait=exc_info[0] is None)
+
+    def start(self):
+        self.process.start()
+        self.engine.add_callback(self.send)
+
+    def snapshot(self):
+        operator, status = solution_snapshot(self.engine.best_solution, self.engine.layout)
+        return {
+            "generation": self.engine.generation,
+            "fitness": list(self.engine.best_fitness_values[self.sent_fitness:]),
+            "operator": operator,
+            "status": status,
+            "finished": self.engine.finished,
+        }
+
+    def send(self, engine=None):
+        """
+        Envia o instantâneo da geração atual, sem bloquear (callback do motor).
+
+        Returns:
+            bool: Se o quadro foi enviado (False se a fila estava cheia ou a janela foi fechada).
+        """
+        if not self.process.is_alive():
+            return False
+        phase = self.engine.profiler.phase if self.engine.profiler is not None else no_phase
+        try:
+            with phase("snapshot"):
+                self.frames.put_nowait(self.snapshot())
+        except queue.Full:
+            self.dropped_frames += 1
+            return False
+        self.sent_fitness = len(self.engine.best_fitness_values)
+        self.sent_frames += 1
+        return True
+
+    def close(self, wait=True):
+        """
+        Envia o último quadro e encerra o visualizador.
+
+        Args:
+            wait (bool): Aguarda o usuário fechar a janela (True) ou fecha a janela imediatamente (False).
+        """
+        if wait:
+            # O último quadro sempre chega à janela, mesmo que ela esteja atrasada.
+            frame = self.snapshot()
+            while self.process.is_alive():
+                try:
+                    self.frames.put(frame, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            self.process.join()
+        elif self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.frames.cancel_join_thread()
+        print(f"Visualizador: {self.sent_frames} quadros enviados, {self.dropped_frames} descartados.")
+
+def _latest_frame(frames):
+    """
+    Esvazia a fila, sem esperar, e junta os quadros recebidos: fitness de todos, ordens e geração do mais recente.
+    """
+    merged = None
+    try:
+        while True:
+            frame = frames.get_nowait()
+            if merged is not None:
+                frame["fitness"] = merged["fitness"] + frame["fitness"]
+            merged = frame
+    except queue.Empty:
+        return merged
+
+def run_viewer(frames, order_ids, operator_ids, window_size, fps, background):
+    """
+    Processo da janela do pygame: desenha o gráfico do fitness e a matriz das ordens a partir dos quadros da fila.
+    """
+    # Imports para o funcionamento do PyGame (apenas no processo da janela).
+    import pygame
+    from . import pygame_functions as pgf
+
+    pygame.init()
+    screen = pygame.display.set_mode(window_size)
+    pygame.display.set_caption("Loop de Gerações")
+    clock = pygame.time.Clock()
+
+    chart = pgf.FitnessChart()
+    grid = pgf.OrderGrid(order_ids, window_size)
+    fitness_values = []
+    latest = None
+    text_rect = pygame.Rect(450, window_size[1] - 20, 0, 0)
+    full_redraw = True
+    pause = False
+    running = True
+
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    pause = not pause
+                    full_redraw = full_redraw or not pause  # Apaga o texto "PAUSADO".
+                elif event.key == pygame.K_q:
+                    running = False
+
+        # Quando pausado, os quadros continuam sendo consumidos e os fitness acumulando para o gráfico.
+        # A fila é lida sem bloquear: o ritmo do laço é dado apenas por `clock.tick`.
+        frame = _latest_frame(frames)
+        if frame is not None:
+            fitness_values.extend(frame["fitness"])
+            latest = frame
+
+        if pause:
+            rect = pgf.draw_text(screen, "PAUSADO", screen.get_width() // 2, screen.get_height() // 2, font_size=30, font='Courier New')
+            pygame.display.update(rect)
+        elif frame is not None or full_redraw:
+            if full_redraw:
+                screen.fill(background)
+                grid.invalidate()
+            dirty = []
+            if chart.update(fitness_values) or full_redraw:
+                dirty.append(chart.draw(screen, window_size))
+            if latest is not None:
+                dirty += grid.draw_codes(screen, latest["operator"], latest["status"], operator_ids)
+                final = " (final)" if latest["finished"] else ""
+                screen.fill(background, text_rect)
+                new_rect = pgf.draw_text(screen, f"Geração {latest['generation']} - Best Fitness: {fitness_values[-1]:.2f}{final}", 450, window_size[1] - 20, font_size=15, font="Courier New")
+                dirty.append(text_rect.union(new_rect))
+                text_rect = new_rect
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)  # Apenas as áreas alteradas.
+            full_redraw = False
+
+        clock.tick(fps)
+
+    pygame.quit()
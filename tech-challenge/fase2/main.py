@@ -4,31 +4,29 @@ from functions import common_functions as cf
 from functions import greedy_algorithm as ga
 from functions import linear_programming_algorithm as lp
 from functions import human_allocation as ha
-
-# Imports para o funcionamento do PyGame
-import pygame
-from pygame.locals import *
-from functions import pygame_functions as pgf
-import itertools
+from functions.eligibility import EligibilityIndex
+from functions.instance_generator import generate_instance
+from functions.instance_loader import load_operators, load_orders
+from functions.genetic_engine import GeneticEngine
+from functions.generation_profiler import GenerationProfiler
+from functions.checkpoint import Checkpointer, load_checkpoint_instance
+from functions.rolling_horizon import rolling_horizon_allocation, genetic_window_solver
 
 # Imports gerais
-import random
 import argparse
+import atexit
+import os
+import signal
 
 # TODO Colocar no streamlit, executar e print o DF (pandas) no final.
 # colocar disponivel para que uma pessoa possa colocar um arquivo de texto e que ela consiga colocar as orders e operadores pra rodar.
 # Tentar colocar no pygame uma "agenda" aparecendo as OS's alocadas para cada operador.
 
-# =========== INICIALIZADOR DE JANELA ===========
-# Cria a janela do Pygame
-window_size = (1000, 600)
-screen = pygame.display.set_mode(window_size)
-pygame.display.set_caption("Loop de Gerações")
-clock = pygame.time.Clock()
-
 # =========== VARs GLOBAIS ===========
 FPS = 10    # Velocidade de atualizaçao dos frames do PyGame
 cor_fundo = [204, 204, 204]
+window_size = (1000, 600)
+HEADLESS_LOG_INTERVAL = 10  # Intervalo de gerações entre as mensagens de progresso no modo --headless
 
 params = {
     "_N_ORDERS" : 100,
@@ -39,44 +37,162 @@ params = {
     "_ELITISM_SIZE" : 5,
     "_REINITIALIZE_INTERVAL" : 10,
     "_DAYS": 5,  
+    "_COMPACT_GENOME": True,    # Usa cromossomos compactos (vetores de inteiros) no lugar de dicionários.
+    "_FITNESS_CACHE_SIZE": 4096,    # Quantidade máxima de genomas no cache de fitness.
+    "_WORKERS": 1,    # Processos para gerar os filhos em paralelo (1 = sem paralelismo).
+    "_ISLANDS": 1,    # Número de ilhas (sub-populações em processos separados); 1 = população única.
+    "_MIGRATION_INTERVAL": 10,    # Gerações entre migrações no modelo de ilhas.
+    "_MIGRATION_SIZE": 2,    # Indivíduos da elite enviados por ilha em cada migração.
+    "_TOPOLOGY": "ring",    # Topologia da migração: "ring" ou "full".
+    "_LP_TIME_LIMIT": 60,    # Tempo máximo (s) de resolução da programação linear (None = sem limite).
+    "_LP_GAP": 0.01,    # Gap relativo aceito na programação linear (None = otimalidade).
+    "_LP_WARM_START": True,    # Usa a solução do algoritmo guloso como solução inicial da programação linear.
+    "_HORIZON_WINDOW": None,    # Dias de cada janela do horizonte rolante (None = horizonte inteiro de uma vez).
+    "_HORIZON_STEP": 1,    # Dias fixados a cada janela do horizonte rolante.
+    "_OUTPUT_FORMATS": ["csv", "parquet"],    # Formatos dos arquivos de resultado: "csv", "parquet", "feather" e/ou "xlsx".
+    "_OUTPUT_COMPRESSION": None,    # Compressão dos arquivos de resultado (ex.: "zstd" ou {"csv": "gzip", "parquet": "snappy"}); None = sem compressão.
+    "_BACKGROUND_WRITES": True,    # Grava os arquivos de resultado em uma thread separada.
+    "_CHECKPOINT_DIR": os.path.join(os.path.dirname(os.path.abspath(__file__)), "checkpoints", "genetic_algorithm"),    # Diretório dos checkpoints do algoritmo genético (junto aos diretórios `resultados_*`).
+    "_CHECKPOINT_INTERVAL": 10,    # Gerações entre checkpoints (0 = sem checkpoints).
 }
 
-def run_greedy_algorithm(operators, orders):
+def save_results(solution_df, algorithm_name='genetic_algorithm'):
+    cf.salvar_arquivos(solution_df, algorithm_name, formats=params["_OUTPUT_FORMATS"],
+                       compression=params["_OUTPUT_COMPRESSION"], background=params["_BACKGROUND_WRITES"])
+
+def run_greedy_algorithm(operators, orders, index=None):
     print("="*35 + " Greedy Algorithm " + "="*35)
-    solution = ga.greedy_allocation(operators, orders)
-    greedy_fitness = cf.calculate_fitness(solution, operators, orders, params["_DAYS"])
+    solution = ga.greedy_allocation(operators, orders, params["_DAYS"], index=index)
+    greedy_fitness = cf.calculate_fitness(solution, operators, orders, params["_DAYS"], index)
     solution_df, unassigned_orders = cf.solution_to_dataframe(solution, operators, orders)
     print("Fitness (Greedy Algorithm):", greedy_fitness)
     cf.imprimir_resultados_alocacao(solution_df, unassigned_orders, orders, "greedy_algorithm")
-    cf.salvar_arquivos(solution_df, 'greedy_algorithm')
+    save_results(solution_df, 'greedy_algorithm')
 
-def run_linear_algorithm(operators, orders):
+def run_linear_algorithm(operators, orders, index=None):
     print("="*30 + " Linear Programming Algorithm " + "="*29)
-    solution = lp.linear_programming_allocation(operators, orders)
-    linear_fitness = cf.calculate_fitness(solution, operators, orders, params["_DAYS"])
+    initial_solution = ga.greedy_allocation(operators, orders, params["_DAYS"], index=index) if params["_LP_WARM_START"] else None
+    solution = lp.linear_programming_allocation(operators, orders, params["_DAYS"], index=index,
+                                                time_limit=params["_LP_TIME_LIMIT"],
+                                                gap=params["_LP_GAP"],
+                                                initial_solution=initial_solution,
+                                                horizon_window=params["_HORIZON_WINDOW"],
+                                                horizon_step=params["_HORIZON_STEP"])
+    linear_fitness = cf.calculate_fitness(solution, operators, orders, params["_DAYS"], index)
     solution_df, unassigned_orders = cf.solution_to_dataframe(solution, operators, orders)
     print("Fitness (Linear Programming):", linear_fitness)
+    print("Modelo (Linear Programming):", solution["stats"])
     cf.imprimir_resultados_alocacao(solution_df, unassigned_orders, orders, "linear_programming")
-    cf.salvar_arquivos(solution_df, 'greedy_algorithm')
+    save_results(solution_df, 'greedy_algorithm')
 
-def run_human_allocation(operators, orders):
+def run_human_allocation(operators, orders, index=None):
     print("="*35 + " Human Allocation " + "="*35)
-    solution = ha.human_allocation(operators, orders)
-    human_allocation_fitness = cf.calculate_fitness(solution, operators, orders, params["_DAYS"])
+    solution = ha.human_allocation(operators, orders, params["_DAYS"], index=index)
+    human_allocation_fitness = cf.calculate_fitness(solution, operators, orders, params["_DAYS"], index)
     solution_df, unassigned_orders = cf.solution_to_dataframe(solution, operators, orders)
     print("Fitness (Alocação Humana):", human_allocation_fitness)
     cf.imprimir_resultados_alocacao(solution_df, unassigned_orders, orders, "human_allocation")
-    cf.salvar_arquivos(solution_df, 'human_allocation')
+    save_results(solution_df, 'human_allocation')
 
-def run_algorithm_comparison(operators, orders):
+def run_algorithm_comparison(operators, orders, index=None):
     if "greedy_algorithm" in algorithms_to_perform:
-        run_greedy_algorithm(operators, orders)
+        run_greedy_algorithm(operators, orders, index)
     
     if "linear_programming_algorithm" in algorithms_to_perform:
-        run_linear_algorithm(operators, orders)
+        run_linear_algorithm(operators, orders, index)
 
     if "human_allocation" in algorithms_to_perform:
-        run_human_allocation(operators, orders)
+        run_human_allocation(operators, orders, index)
+
+def report_genetic_algorithm(operators, orders, best_solution):
+    """
+    Imprime o relatório e salva os arquivos da melhor solução encontrada pelo algoritmo genético.
+    """
+    print('Otimização do melhor indivíduo encontrada!!!')
+
+    # Conversão dos dados de operadores e ordens em Dataframe.
+    operators_df, orders_df = cf.op_orders_to_dataframe(operators, orders)
+
+    # Conversão dos dados da melhor solução encontrada em Dataframe.
+    best_solution_df, unassigned_orders = cf.solution_to_dataframe(best_solution, operators, orders)
+
+    # Imprime relatorio
+    cf.imprimir_resultados_alocacao(best_solution_df, unassigned_orders, orders, "genetic_algorithm")
+
+    # Exibe os resultados.
+    print("Dados dos operadores: \n", operators_df)
+    print("Dados das ordens: \n", orders_df)
+    print(f"\nSolução final (shape = {best_solution_df.shape}):\n", 
+          best_solution_df.sort_values(["id_operador", "id_ordem", "dia"]))
+
+    if unassigned_orders:
+        print("\nOrdens não alocadas:\n", orders_df.loc[orders_df["id_ordem"].isin(unassigned_orders)])
+
+    # Salva os resultados em arquivo.
+    save_results(best_solution_df)
+
+def run_headless(engine):
+    """
+    Executa todas as gerações sem interface gráfica, na velocidade máxima da CPU.
+    """
+    def log_progress(engine):
+        if engine.generation % HEADLESS_LOG_INTERVAL == 0 or engine.finished:
+            print(f"Geração {engine.generation}: melhor fitness {engine.best_fitness:.2f}")
+
+    engine.add_callback(log_progress)
+    engine.run()
+    print("Cache de fitness:", engine.cache_stats())
+    report_genetic_algorithm(engine.operators, engine.orders, engine.best_solution)
+
+def run_islands(model):
+    """
+    Executa o modelo de ilhas sem interface gráfica, exibindo o progresso a cada migração.
+    """
+    def log_progress(model):
+        island_fitness = ", ".join(f"{fitness:.2f}" for fitness in model.island_best_fitness)
+        print(f"Geração {model.generation}: melhor fitness {model.best_fitness:.2f} (ilhas: {island_fitness})")
+
+    model.add_callback(log_progress)
+    model.run()
+    print("Cache de fitness:", model.cache_stats())
+    report_genetic_algorithm(model.operators, model.orders, model.best_solution)
+
+def run_rolling_horizon(operators, orders):
+    """
+    Executa o algoritmo genético em horizonte rolante: janelas de `_HORIZON_WINDOW` dias, fixando
+    `_HORIZON_STEP` dias por janela (sempre sem interface gráfica).
+    """
+    solve_window = genetic_window_solver(population_size=params["_POPULATION_SIZE"],
+                                         generations=params["_GENERATIONS"],
+                                         mutation_rate=params["_MUTATION_RATE"],
+                                         elitism_size=params["_ELITISM_SIZE"],
+                                         reinitialize_interval=params["_REINITIALIZE_INTERVAL"],
+                                         compact_genome=params["_COMPACT_GENOME"],
+                                         fitness_cache_size=params["_FITNESS_CACHE_SIZE"])
+    solution = rolling_horizon_allocation(operators, orders, params["_DAYS"], solve_window,
+                                          params["_HORIZON_WINDOW"], params["_HORIZON_STEP"])
+    for details in solution["stats"]["window_details"]:
+        print(f"Janela dia {details['first_day']} ({details['days']} dias): {details['committed']} de "
+              f"{details['orders']} ordens fixadas em {details['time']:.2f}s")
+    print("Fitness (horizonte rolante):", cf.calculate_fitness(solution, operators, orders, params["_DAYS"]))
+    report_genetic_algorithm(operators, orders, solution)
+
+def run_pygame(engine):
+    """
+    Executa todas as gerações na velocidade máxima, exibindo a evolução em uma janela do pygame em outro processo.
+
+    Detalhes:
+    - A janela recebe instantâneos da melhor solução por uma fila limitada e descarta os quadros atrasados,
+      então o algoritmo genético nunca espera pela tela.
+    - Espaço congela a tela e "q" fecha a janela, sem interromper o algoritmo genético.
+    """
+    from functions.visualizer import RemoteVisualizer
+
+    with RemoteVisualizer(engine, window_size, FPS, tuple(cor_fundo)):
+        engine.run()
+        print("Cache de fitness:", engine.cache_stats())
+        report_genetic_algorithm(engine.operators, engine.orders, engine.best_solution)
+        print("Feche a janela do pygame (ou tecle 'q') para encerrar.")
 
 if __name__ == '__main__':
     """
@@ -90,137 +206,151 @@ if __name__ == '__main__':
     algorithm_keys = list(algorithms.keys())
     parser = argparse.ArgumentParser(description="Escolha o algoritmo de alocação a ser utilizado.")
     parser.add_argument('--algorithm', choices=algorithm_keys, help="Algoritmo de alocação a ser utilizado: 'genetic_algorithm', 'greedy_algorithm', 'linear_programming_algorithm' ou 'human_allocation'")
+    parser.add_argument('--headless', action='store_true', help="Executa o algoritmo genético sem a janela do pygame, sem limite de FPS.")
+    parser.add_argument('--islands', type=int, default=params["_ISLANDS"], help="Número de ilhas do algoritmo genético (sub-populações em processos separados, sempre sem interface gráfica).")
+    parser.add_argument('--topology', choices=["ring", "full"], default=params["_TOPOLOGY"], help="Topologia da migração entre as ilhas.")
+    parser.add_argument('--workers', type=int, default=params["_WORKERS"], help="Número de processos para gerar os filhos do algoritmo genético em paralelo.")
+    parser.add_argument('--days', type=int, default=params["_DAYS"], help="Número de dias do planejamento.")
+    parser.add_argument('--horizon-window', type=int, default=params["_HORIZON_WINDOW"], help="Dias de cada janela do horizonte rolante (programação linear e algoritmo genético).")
+    parser.add_argument('--horizon-step', type=int, default=params["_HORIZON_STEP"], help="Dias fixados a cada janela do horizonte rolante.")
+    parser.add_argument('--n-orders', type=int, default=params["_N_ORDERS"], help="Número de ordens de serviço geradas.")
+    parser.add_argument('--n-operators', type=int, default=params["_N_OPERATORS"], help="Número de operadores gerados.")
+    parser.add_argument('--seed', type=int, help="Semente da instância: gera operadores e ordens com o gerador vetorizado e reproduzível.")
+    parser.add_argument('--operators-file', help="Arquivo (CSV, JSON Lines ou Parquet) com os operadores, no lugar dos operadores gerados.")
+    parser.add_argument('--orders-file', help="Arquivo (CSV, JSON Lines ou Parquet) com as ordens de serviço, no lugar das ordens geradas.")
+    parser.add_argument('--trace', help="Arquivo .json ou .csv com o tempo de cada fase e as métricas de cada geração do algoritmo genético.")
+    parser.add_argument('--profile-generations', nargs=2, type=int, metavar=("PRIMEIRA", "ULTIMA"), help="Intervalo de gerações analisado com o cProfile.")
+    parser.add_argument('--profile-output', help="Arquivo onde as estatísticas do cProfile são salvas (formato do pstats).")
+    parser.add_argument('--checkpoint-dir', default=params["_CHECKPOINT_DIR"], help="Diretório dos checkpoints do algoritmo genético.")
+    parser.add_argument('--checkpoint-interval', type=int, default=params["_CHECKPOINT_INTERVAL"], help="Gerações entre checkpoints do algoritmo genético (0 desativa os checkpoints).")
+    parser.add_argument('--resume', action='store_true', help="Retoma o algoritmo genético do último checkpoint (com a instância gravada nele).")
+    parser.add_argument('--output-formats', nargs='+', choices=list(cf.OUTPUT_FORMATS), default=params["_OUTPUT_FORMATS"], help="Formatos dos arquivos de resultado (o Excel é o mais lento).")
+    parser.add_argument('--output-compression', default=params["_OUTPUT_COMPRESSION"], help="Compressão dos arquivos de resultado: uma para os formatos que a aceitam (ex.: zstd) ou uma por formato (ex.: csv=gzip,parquet=snappy).")
+    parser.add_argument('--sync-writes', action='store_true', help="Grava os arquivos de resultado na thread principal.")
     args = parser.parse_args()
+    params["_OUTPUT_FORMATS"] = args.output_formats
+    try:
+        params["_OUTPUT_COMPRESSION"] = cf.output_compression(args.output_compression, args.output_formats)
+    except ValueError as e:
+        parser.error(str(e))
+    params["_BACKGROUND_WRITES"] = not args.sync_writes
+    # Espera as gravações em segundo plano em qualquer saída do programa.
+    atexit.register(cf.aguardar_arquivos)
+    params["_DAYS"] = args.days
+    params["_N_ORDERS"] = args.n_orders
+    params["_N_OPERATORS"] = args.n_operators
+    params["_HORIZON_WINDOW"] = args.horizon_window
+    params["_HORIZON_STEP"] = args.horizon_step
 
     # Escolha do algoritmo
     algorithms_to_perform = algorithm_keys if args.algorithm is None else [args.algorithm]
 
-    # Inicializa operadores e ordens iniciais.
-    operators, orders = cf.create_initial_data(params["_N_ORDERS"], params["_N_OPERATORS"])
+    # Inicializa operadores e ordens iniciais (com semente, pelo gerador vetorizado e reproduzível).
+    if args.seed is not None:
+        operators, orders = generate_instance(params["_N_ORDERS"], params["_N_OPERATORS"], seed=args.seed)
+    else:
+        operators, orders = cf.create_initial_data(params["_N_ORDERS"], params["_N_OPERATORS"])
+
+    # Operadores e ordens reais, carregados em blocos direto para tabelas colunares.
+    if args.operators_file:
+        operators = load_operators(args.operators_file)
+    if args.orders_file:
+        orders = load_orders(args.orders_file)
+
+    # Ao retomar, a instância é a gravada no checkpoint.
+    if args.resume:
+        if not os.path.exists(os.path.join(args.checkpoint_dir, "state.json")):
+            parser.error(f"Nenhum checkpoint encontrado em {args.checkpoint_dir}.")
+        operators, orders = load_checkpoint_instance(args.checkpoint_dir)
+        algorithms_to_perform = ["genetic_algorithm"]
 
-    # Executa os algoritmos de comparação
-    run_algorithm_comparison(operators, orders)    
+    # Índice de elegibilidade operador x ordem, construído uma única vez e compartilhado pelos algoritmos.
+    index = EligibilityIndex(operators, orders)
+
+    # Executa os algoritmos de comparação (não repetidos ao retomar o algoritmo genético).
+    if not args.resume:
+        run_algorithm_comparison(operators, orders, index)    
 
     if "genetic_algorithm" not in algorithms_to_perform:
         exit()
 
-    selected_algorithm = "genetic_algorithm"
-    
-    # Gera populaçao inicial com base nos operadores e ordens iniciais.
-    population = [algorithms[selected_algorithm].create_initial_solution(operators, orders, params["_DAYS"]) 
-                  for _ in range(params["_POPULATION_SIZE"])]
-
-    # =========== LOOP DO PYGAME ===========
-    pygame.init()
-
-    # Inicia o contador de geraçoes em 1.
-    generation_counter = itertools.count(start=1) 
-
-    # Salva os melhores fitness e geraçoes para plottar.
-    best_fitness_values = []
-    best_schedules = []
-
-    # Contador para imprimir FPS a cada 20 quadros
-    fps_counter = 0
-    fps_print_interval = 10
-        
-    # Main game loop
-    running = True
-    pause = False
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    pause = not pause
-                elif event.key == pygame.K_q:
-                    running = False  # Sai do jogo quando a tecla 'q' é apertada.
-
-        if not pause:
-            # Atualiza a geração.
-            generation = next(generation_counter)
-
-            # Limpa a tela.
-            screen.fill(cor_fundo)
-            
-            # population = sorted(population, key=calculate_fitness).
-            population = sorted(population, reverse=True, key=lambda individual: 
-                                algorithms[selected_algorithm].calculate_fitness(individual, operators, orders, params["_DAYS"]))
-            
-            # Exibição da aptidão da melhor solução da geração.
-            best_fitness = population[0]["fitness"]
-            best_schedule = population[0] 
-            best_fitness_values.append(best_fitness)
-            best_schedules.append(best_schedule)
-            
-            # Geração da nova população.
-            new_population = [population[0]]    # Preserva o melhor indivíduo (elitismo)
-            while len(new_population) < params["_POPULATION_SIZE"]:
-                parent1, parent2 = random.choices(population[:params["_ELITISM_SIZE"]], k=2)
-                child = algorithms[selected_algorithm].crossover(parent1, parent2, operators, orders, params["_DAYS"])
-                child = algorithms[selected_algorithm].mutate(child, operators, orders, params["_MUTATION_RATE"], params["_DAYS"])
-                new_population.append(child)
-
-            # Reinicialização da população a cada 'reinitalize_interval' gerações.
-            # Esta função aumenta a variabilidade na população, trocando a metade da populaçao com menor fit.
-            new_population = sorted(new_population, reverse=True, key=lambda individual: 
-                                individual["fitness"])
-            if generation % params["_REINITIALIZE_INTERVAL"] == 0:
-                num_to_reinitialize = params["_POPULATION_SIZE"] // 2
-                new_population[-num_to_reinitialize:] = [
-                    algorithms[selected_algorithm].create_initial_solution(operators, orders, params["_DAYS"]) 
-                    for _ in range(num_to_reinitialize)]
-                
-                # Recalcula o fitness da nova populaçao
-                for individual in new_population[-num_to_reinitialize:]:
-                    individual["fitness"] = algorithms[selected_algorithm].calculate_fitness(individual, operators, orders, params["_DAYS"])
-
-            population = new_population
-
-            # Encontrando a melhor solução com base no fitness
-            best_solution = max(best_schedules, key=lambda individual: individual["fitness"])
-            
-            # Desenha as informações na tela.
-            pgf.draw_plot(screen, list(range(len(best_fitness_values))), best_fitness_values, window_size)
-            pgf.draw_squares(screen, best_solution, orders, params["_N_ORDERS"], window_size)  
-            pgf.draw_text(screen, f"Best Fitness: {best_fitness:.2f}", 450, window_size[1] - 20, font_size=15, font="Courier New")
-            
-            # Atualiza a tela.
-            pygame.display.flip()
-            # Controla o FPS do jogo
-            clock.tick(FPS) 
-            
-            # TODO IF todas as ordens forem alocadas ou BEST FITNESS
-            # fazer tambem pelo numero de geraçoes em que nao teve melhora
-            if (generation > params["_GENERATIONS"] ):
-                pause = True
-                print('Otimização do melhor indivíduo encontrada!!!')
-
-                # Conversão dos dados de operadores e ordens em Dataframe.
-                operators_df, orders_df = algorithms[selected_algorithm].op_orders_to_dataframe(operators, orders)
-
-                # Conversão dos dados da melhor solução encontrada em Dataframe.
-                best_solution_df, unassigned_orders = algorithms[selected_algorithm].solution_to_dataframe(best_solution, operators, orders)
-
-                # Imprime relatorio
-                cf.imprimir_resultados_alocacao(best_solution_df, unassigned_orders, orders, selected_algorithm)
-
-                # Exibe os resultados.
-                print("Dados dos operadores: \n", operators_df)
-                print("Dados das ordens: \n", orders_df)
-                print(f"\nSolução final (shape = {best_solution_df.shape}):\n", 
-                      best_solution_df.sort_values(["id_operador", "id_ordem", "dia"]))
-            
-                if unassigned_orders:
-                    print("\nOrdens não alocadas:\n", orders_df.loc[orders_df["order_id"].isin(unassigned_orders)])
-
-                # Salva os resultados em arquivo.
-                cf.salvar_arquivos(best_solution_df)
-              
-        if pause:
-            pgf.draw_text(screen, "PAUSADO", screen.get_width() // 2, screen.get_height() // 2, font_size=30, font='Courier New')
-
-        
-    pygame.quit()
\ No newline at end of file
+    # Horizonte rolante: janelas de poucos dias em vez do horizonte inteiro.
+    if params["_HORIZON_WINDOW"] is not None and params["_HORIZON_WINDOW"] < params["_DAYS"]:
+        run_rolling_horizon(operators, orders)
+        exit()
+
+    # Modelo de ilhas: sub-populações independentes com migração periódica.
+    if args.islands > 1:
+        from functions.island_model import IslandModel
+        with IslandModel(operators, orders,
+                         islands=args.islands,
+                         days=params["_DAYS"],
+                         population_size=params["_POPULATION_SIZE"],
+                         generations=params["_GENERATIONS"],
+                         elitism_size=params["_ELITISM_SIZE"],
+                         migration_interval=params["_MIGRATION_INTERVAL"],
+                         migration_size=params["_MIGRATION_SIZE"],
+                         topology=args.topology,
+                         compact_genome=params["_COMPACT_GENOME"]) as model:
+            run_islands(model)
+        exit()
+
+    # Medição das fases das gerações, apenas quando pedida.
+    profiler = GenerationProfiler(args.profile_generations, args.profile_output) \
+        if args.trace or args.profile_generations else None
+
+    # Motor do algoritmo genético (independente do pygame).
+    engine = GeneticEngine(operators, orders,
+                           days=params["_DAYS"],
+                           population_size=params["_POPULATION_SIZE"],
+                           generations=params["_GENERATIONS"],
+                           mutation_rate=params["_MUTATION_RATE"],
+                           elitism_size=params["_ELITISM_SIZE"],
+                           reinitialize_interval=params["_REINITIALIZE_INTERVAL"],
+                           compact_genome=params["_COMPACT_GENOME"],
+                           fitness_cache_size=params["_FITNESS_CACHE_SIZE"],
+                           index=index,
+                           workers=args.workers,
+                           profiler=profiler)
+
+    # Checkpoints periódicos (e retomada do último checkpoint).
+    checkpointer = None
+    if args.checkpoint_interval > 0 or args.resume:
+        checkpointer = Checkpointer(args.checkpoint_dir, args.checkpoint_interval)
+        if args.resume:
+            checkpointer.restore(engine)
+            print(f"Retomando o algoritmo genético da geração {engine.generation} de {engine.generations}.")
+        engine.add_callback(checkpointer)
+
+        # Ctrl+C termina a geração atual, grava o checkpoint e encerra (um segundo Ctrl+C encerra na hora).
+        interrupted = False
+        def request_stop(signum, frame):
+            global interrupted
+            interrupted = True
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+
+        def stop_if_requested(engine):
+            if interrupted:
+                checkpointer.save(engine)
+                raise KeyboardInterrupt
+
+        signal.signal(signal.SIGINT, request_stop)
+        engine.add_callback(stop_if_requested)
+
+    # O rastro é gravado também quando a execução é interrompida (o motor encerra o cProfile ao sair do `with`).
+    try:
+        with engine:
+            try:
+                if args.headless:
+                    run_headless(engine)
+                else:
+                    run_pygame(engine)
+            except KeyboardInterrupt:
+                if checkpointer is None:
+                    raise
+                print(f"\nExecução interrompida na geração {engine.generation}; checkpoint salvo em {args.checkpoint_dir}. "
+                      "Use --resume para continuar.")
+                exit(1)
+    finally:
+        if args.trace:
+            profiler.write(args.trace)
@@ -0,0 +1,60 @@
+import pytest
+from functions.common_functions import priority_to_number
+from functions.eligibility import EligibilityIndex
+from functions.greedy_algorithm import greedy_allocation
+from functions.human_allocation import human_allocation
+from functions.instance_generator import generate_instance
+
+DAYS = 5
+
+def _reference_allocation(operators, orders, sorted_orders, days, index):
+    """
+    Alocação de referência: a busca original, que soma as horas das ordens já alocadas a cada verificação.
+    """
+    solution = {"orders": {}, "fitness": 0}
+    for order_id, order in sorted_orders:
+        assigned = False
+        for day in range(1, days + 1):
+            for operator_id in index.eligible_operators(order_id):
+                total_hours = sum(
+                    other["estimated_hours"]
+                    for other_id, other in orders.items()
+                    if other_id in solution["orders"] and
+                       solution["orders"][other_id]["operator"] == operator_id and
+                       solution["orders"][other_id]["day"] == day
+                )
+                if total_hours + order["estimated_hours"] <= operators[operator_id]["hours_per_day"]:
+                    solution["orders"][order_id] = {"day": day, "operator": operator_id, "status": "atendida"}
+                    assigned = True
+                    break
+            if assigned:
+                break
+    return solution
+
+def _reference_greedy(operators, orders, days, index):
+    sorted_orders = sorted(orders.items(), key=lambda x: (-priority_to_number(x[1]["priority"]),
+                                                          x[1]["expected_start_day"]))
+    return _reference_allocation(operators, orders, sorted_orders, days, index)
+
+def _reference_human(operators, orders, days, index):
+    priority_groups = {}
+    for order_id, order in orders.items():
+        priority_groups.setdefault(order["priority"], []).append((order_id, order))
+    sorted_orders = [item for priority in sorted(priority_groups, key=priority_to_number, reverse=True)
+                     for item in priority_groups[priority]]
+    return _reference_allocation(operators, orders, sorted_orders, days, index)
+
+# (ordens, operadores, semente): capacidade folgada e capacidade esgotada (ordens ficam sem operador).
+INSTANCES = [(60, 10, 1), (200, 6, 2), (300, 4, 3)]
+
+@pytest.mark.parametrize("as_table", [True, False], ids=["table", "dict"])
+@pytest.mark.parametrize("n_orders, n_operators, seed", INSTANCES)
+@pytest.mark.parametrize("allocation, reference", [(greedy_allocation, _reference_greedy),
+                                                   (human_allocation, _reference_human)],
+                         ids=["greedy", "human"])
+def test_allocation_matches_reference(allocation, reference, n_orders, n_operators, seed, as_table):
+    operators, orders = generate_instance(n_orders, n_operators, seed=seed, as_table=as_table)
+    index = EligibilityIndex(operators, orders)
+    solution = allocation(operators, orders, DAYS, index=index)
+    expected = reference(operators, orders, DAYS, index)
+    assert list(solution["orders"].items()) == list(expected["orders"].items())
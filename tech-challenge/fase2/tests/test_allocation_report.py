@@ -0,0 +1,238 @@
+import random
+import pytest
+from functions.allocation_report import compute_allocation_report, render_allocation_report
+from functions.common_functions import solution_to_dataframe
+from functions.eligibility import EligibilityIndex
+from functions.greedy_algorithm import greedy_allocation
+from functions.human_allocation import human_allocation
+from functions.instance_generator import generate_instance
+
+DAYS = 5
+
+def _reference_report(df, unassigned_orders, orders):
+    """
+    Relatório de referência: a implementação original linha a linha (filtros e iterrows), com o texto
+    acumulado em memória no lugar da impressão e do arquivo.
+    """
+    lines = []
+    write_output = lines.append
+
+    write_output("\n" + "=" * 80)
+    write_output("RELATÓRIO DETALHADO DE ALOCAÇÃO".center(80))
+    write_output("=" * 80)
+
+    # 1. Estatísticas Gerais
+    total_ordens = len(orders)
+    ordens_alocadas = len(df['id_ordem'].unique())
+    ordens_nao_alocadas = len(unassigned_orders)
+
+    write_output("\n1. ESTATÍSTICAS GERAIS")
+    write_output("-" * 40)
+    write_output(f"Total de Ordens: {total_ordens}")
+    write_output(
+        f"Ordens Alocadas: {ordens_alocadas} ({(ordens_alocadas / total_ordens) * 100:.1f}%)")
+    write_output(f"Ordens Não Alocadas: {ordens_nao_alocadas}")
+
+    # 2. Análise por Prioridade
+    write_output("\n2. ANÁLISE POR PRIORIDADE")
+    write_output("-" * 40)
+    for prioridade in ['urgente', 'alta', 'média', 'baixa']:
+        count = len(df[df['prioridade'] == prioridade])
+        if count > 0:
+            write_output(
+                f"Prioridade {prioridade:8s}: {count:3d} ordens ({(count / ordens_alocadas) * 100:5.1f}%)")
+
+    # 3. Análise por Operador
+    write_output("\n3. ANÁLISE POR OPERADOR")
+    write_output("-" * 40)
+    for operador in df['id_operador'].unique():
+        df_op = df[df['id_operador'] == operador]
+        horas_total = df_op['horas_estimadas'].sum()
+        horas_disp = df_op['horas_disponiveis'].iloc[0]
+        percentual = (horas_total / (horas_disp * 5)) * 100
+        n_ordens = len(df_op)
+        write_output(f"Operador {operador}:")
+        write_output(f"  - Ordens alocadas: {n_ordens}")
+        write_output(
+            f"  - Horas alocadas: {horas_total:.1f}h de {horas_disp * 5:.1f}h ({percentual:.1f}%)")
+    # 4. Análise de Prazos
+    write_output("\n4. ANÁLISE DE PRAZOS")
+    write_output("-" * 40)
+
+    ordens_no_prazo = len(df[df['atraso'] <= 0])
+    write_output(
+        f"Ordens no Prazo: {ordens_no_prazo} ({(ordens_no_prazo / ordens_alocadas) * 100:.1f}%)")
+
+    if len(df[df['atraso'] > 0]) > 0:
+        write_output("\nDetalhamento dos Atrasos:")
+        for _, row in df[df['atraso'] > 0].iterrows():
+            write_output(
+                f"  Ordem {row['id_ordem']}: {row['atraso']} dias de atraso (Prioridade: {row['prioridade']})")
+
+    # 5. Análise de Atendimentos por Fitness
+    write_output("\n5. ANÁLISE DE ATENDIMENTOS POR FITNESS")
+    write_output("-" * 40)
+
+    # Análise de atendimento baseada nos critérios do fitness
+    atendimentos = {
+        'total': [],
+        'parcial': [],
+        'inadequado': []
+    }
+
+    for _, row in df.iterrows():
+        # Converte strings de habilidades em conjuntos para comparação
+        required_skills = set(row['Serviços'].split(" | "))
+        operator_skills = set(row['habilidades_operador'].split(" | "))
+
+        # Calcula o percentual de match de habilidades
+        matching_skills = len(required_skills.intersection(operator_skills))
+        skill_match_percent = matching_skills / len(required_skills)
+
+        # Verifica condições de atendimento
+        dentro_prazo = row['atraso'] <= 0
+        horas_ok = row['horas_estimadas'] <= row['horas_disponiveis']
+
+        # Classifica o atendimento
+        if skill_match_percent == 1 and dentro_prazo and horas_ok:
+            atendimentos['total'].append(row['id_ordem'])
+        elif skill_match_percent >= 0.5:
+            atendimentos['parcial'].append(row['id_ordem'])
+        else:
+            atendimentos['inadequado'].append(row['id_ordem'])
+
+    # Imprime estatísticas gerais
+    total_atendidos = len(atendimentos['total'])
+    parcial_atendidos = len(atendimentos['parcial'])
+    inadequados = len(atendimentos['inadequado'])
+
+    write_output("Estatísticas Gerais de Atendimento:")
+    write_output(f"  - Atendimento Total:    {total_atendidos:3d} ordens ({(total_atendidos / ordens_alocadas) * 100:5.1f}%)")
+    write_output(f"  - Atendimento Parcial:  {parcial_atendidos:3d} ordens ({(parcial_atendidos / ordens_alocadas) * 100:5.1f}%)")
+    write_output(f"  - Atendimento Inadequado: {inadequados:3d} ordens ({(inadequados / ordens_alocadas) * 100:5.1f}%)")
+
+    # Análise detalhada por tipo de atendimento
+    write_output("\nDetalhamento dos Atendimentos:")
+
+    if atendimentos['total']:
+        write_output("\nOrdens com Atendimento Total:")
+        for ordem_id in atendimentos['total']:
+            ordem = df[df['id_ordem'] == ordem_id].iloc[0]
+            write_output(f"  ✓ Ordem {ordem_id}: "
+                         f"Skills={ordem['Serviços']}, "
+                         f"Operador={ordem['id_operador']}, "
+                         f"Inicio Esperado={ordem['inicio_esperado']}, "
+                         f"Dia Alocado={ordem['dia']}")
+
+    if atendimentos['parcial']:
+        write_output("\nOrdens com Atendimento Parcial:")
+        for ordem_id in atendimentos['parcial']:
+            ordem = df[df['id_ordem'] == ordem_id].iloc[0]
+            write_output(f"  ⚠ Ordem {ordem_id}: "
+                         f"Skills={ordem['Serviços']}, "
+                         f"Operador={ordem['id_operador']} ({ordem['habilidades_operador']}), "
+                         f"Inicio Esperado={ordem['inicio_esperado']}, "
+                         f"Dia Alocado={ordem['dia']}")
+
+    if atendimentos['inadequado']:
+        write_output("\nOrdens com Atendimento Inadequado:")
+        for ordem_id in atendimentos['inadequado']:
+            ordem = df[df['id_ordem'] == ordem_id].iloc[0]
+            write_output(f"  ✗ Ordem {ordem_id}: "
+                         f"Skills={ordem['Serviços']}, "
+                         f"Operador={ordem['id_operador']} ({ordem['habilidades_operador']}), "
+                         f"Inicio Esperado={ordem['inicio_esperado']}, "
+                         f"Dia Alocado={ordem['dia']}")
+
+    # 6. Análise por Dia
+    write_output("\n6. DISTRIBUIÇÃO POR DIA")
+    write_output("-" * 40)
+    for dia in sorted(df['dia'].unique()):
+        df_dia = df[df['dia'] == dia]
+        write_output(f"\nDia {dia}:")
+        write_output(f"  - Total de Ordens: {len(df_dia)}")
+        write_output(
+            f"  - Horas Alocadas: {df_dia['horas_estimadas'].sum():.1f}h")
+        write_output(f"  - Distribuição de Prioridades:")
+        for prioridade in ['urgente', 'alta', 'média', 'baixa']:
+            count = len(df_dia[df_dia['prioridade'] == prioridade])
+            if count > 0:
+                write_output(f"    * {prioridade:8s}: {count:3d}")
+
+    # 7. Ordens Não Alocadas
+    if unassigned_orders:
+        write_output("\n7. ORDENS NÃO ALOCADAS")
+        write_output("-" * 40)
+        write_output(f"Total de ordens não alocadas: {len(unassigned_orders)}")
+
+        # Agrupa por prioridade
+        unassigned_by_priority = {}
+        for order_id in unassigned_orders:
+            priority = orders[order_id]['priority']
+            if priority not in unassigned_by_priority:
+                unassigned_by_priority[priority] = []
+            unassigned_by_priority[priority].append(order_id)
+
+        for priority in ['urgente', 'alta', 'média', 'baixa']:
+            if priority in unassigned_by_priority:
+                orders_list = unassigned_by_priority[priority]
+                write_output(
+                    f"\nPrioridade {priority}: {len(orders_list)} ordens")
+                for order_id in orders_list:
+                    order = orders[order_id]
+                    write_output(f"  - {order_id}: "
+                                 f"Skills={', '.join(order['required_skills'])}, "
+                                 f"Horas={order['estimated_hours']}, "
+                                 f"Prazo={order['expected_start_day']}")
+
+    write_output("\n" + "=" * 80)
+    write_output("FIM DO RELATÓRIO".center(80))
+    write_output("=" * 80)
+
+    metrics = {
+        'total_ordens': total_ordens,
+        'ordens_alocadas': ordens_alocadas,
+        'ordens_nao_alocadas': ordens_nao_alocadas,
+        'taxa_alocacao': (ordens_alocadas/total_ordens)*100,
+        'matches_perfeitos': total_atendidos,
+        'taxa_matches_perfeitos': (total_atendidos/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
+        'compatibilidade_media': df['compatibilidade_os_op'].mean()*100 if not df.empty else 0,
+        'ordens_no_prazo': ordens_no_prazo,
+        'taxa_cumprimento_prazo': (ordens_no_prazo/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
+        'atendimento_total': total_atendidos,
+        'atendimento_parcial': parcial_atendidos,
+        'atendimento_inadequado': inadequados,
+        'taxa_atendimento_total': (total_atendidos/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
+        'taxa_atendimento_parcial': (parcial_atendidos/ordens_alocadas)*100 if ordens_alocadas > 0 else 0,
+        'taxa_atendimento_inadequado': (inadequados/ordens_alocadas)*100 if ordens_alocadas > 0 else 0
+    }
+    return "".join(line + "\n" for line in lines), metrics
+
+def _random_allocation(operators, orders, days, index=None):
+    """
+    Alocação aleatória (inclui operadores sem as habilidades exigidas, para a seção de atendimento inadequado).
+    """
+    generator = random.Random(len(orders))
+    operator_ids = list(operators)
+    solution = {"orders": {}, "fitness": 0}
+    for order_id in orders:
+        if generator.random() < 0.9:
+            solution["orders"][order_id] = {"day": generator.randint(1, days),
+                                            "operator": generator.choice(operator_ids), "status": "atendida"}
+    return solution
+
+# (ordens, operadores, semente): com e sem ordens não alocadas.
+INSTANCES = [(80, 10, 1), (250, 5, 2)]
+
+@pytest.mark.parametrize("n_orders, n_operators, seed", INSTANCES)
+@pytest.mark.parametrize("allocation", [greedy_allocation, human_allocation, _random_allocation],
+                         ids=["greedy", "human", "random"])
+def test_report_matches_reference(allocation, n_orders, n_operators, seed):
+    operators, orders = generate_instance(n_orders, n_operators, seed=seed)
+    solution = allocation(operators, orders, DAYS, index=EligibilityIndex(operators, orders))
+    df, unassigned_orders = solution_to_dataframe(solution, operators, orders)
+
+    report = compute_allocation_report(df, unassigned_orders, orders)
+    expected_text, expected_metrics = _reference_report(df, unassigned_orders, orders)
+    assert render_allocation_report(report, orders) == expected_text
+    assert report["metrics"] == expected_metrics
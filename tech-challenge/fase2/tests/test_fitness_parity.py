@@ -0,0 +1,61 @@
+import random
+import pytest
+from functions import common_functions as cf
+from functions.chromosome import GenomeLayout, set_seed
+from functions.eligibility import EligibilityIndex
+from functions.genetic_engine import GeneticEngine
+from functions.greedy_algorithm import greedy_allocation
+from functions.human_allocation import human_allocation
+from functions.instance_generator import generate_instance
+from functions.linear_programming_algorithm import linear_programming_allocation
+from functions.population_fitness import evaluate_population
+
+DAYS = 5
+
+# Ordens com até 2 habilidades têm soma exata; com 3, a soma depende da ordem das parcelas.
+@pytest.fixture(scope="module", params=[(1, 2), (1, 3)], ids=["exact", "sequential"])
+def instance(request):
+    operators, orders = generate_instance(120, 8, seed=7, order_skill_counts=request.param)
+    index = EligibilityIndex(operators, orders)
+    return operators, orders, index, GenomeLayout(operators, orders, DAYS, index)
+
+def _solutions(operators, orders, index):
+    random.seed(7)
+    set_seed(7)
+    solutions = {
+        "greedy": greedy_allocation(operators, orders, DAYS, index=index),
+        "human": human_allocation(operators, orders, DAYS, index=index),
+        "lp": linear_programming_allocation(operators, orders, DAYS, index=index, time_limit=20),
+    }
+    for compact_genome in (True, False):
+        with GeneticEngine(operators, orders, DAYS, population_size=12, generations=3,
+                           compact_genome=compact_genome, index=index) as engine:
+            best = engine.run()
+        solutions["ga-compact" if compact_genome else "ga-dict"] = best
+    return solutions
+
+def test_vectorized_fitness_matches_calculate_fitness(instance):
+    operators, orders, index, layout = instance
+    for name, solution in _solutions(operators, orders, index).items():
+        expected = cf.calculate_fitness(solution.to_solution() if not isinstance(solution, dict) else dict(solution),
+                                        operators, orders, DAYS, index)
+        assert evaluate_population([solution], layout)[0] == expected, name
+
+def test_dict_status_controls_lateness(instance):
+    operators, orders, index, layout = instance
+    solution = greedy_allocation(operators, orders, DAYS, index=index)
+    late = [allocation for allocation in solution["orders"].values() if allocation["operator"] is not None]
+    for allocation in late:
+        allocation["day"] = DAYS
+        allocation["status"] = "atendida"
+    expected = cf.calculate_fitness(dict(solution), operators, orders, DAYS, index)
+    assert evaluate_population([solution], layout)[0] == expected
+
+def test_dict_order_does_not_change_fitness(instance):
+    operators, orders, index, layout = instance
+    solution = greedy_allocation(operators, orders, DAYS, index=index)
+    order_ids = list(solution["orders"])
+    random.Random(3).shuffle(order_ids)
+    shuffled = {"orders": {order_id: solution["orders"][order_id] for order_id in order_ids}, "fitness": 0}
+    expected = cf.calculate_fitness(dict(shuffled), operators, orders, DAYS, index)
+    assert evaluate_population([shuffled], layout)[0] == expected
@@ -0,0 +1,48 @@
+from functions.instance_generator import generate_instance
+from functions.linear_programming_algorithm import LinearProgrammingAllocator, linear_programming_allocation
+
+DAYS = 5
+
+# Ordem que nenhum operador atende (habilidade fora das habilidades geradas).
+UNSERVABLE_ORDER = {"required_skills": ["mergulho"], "estimated_hours": 2, "priority": "alta",
+                    "expected_start_day": 1, "status": "não atendida"}
+
+def _instance():
+    operators, orders = generate_instance(12, 6, seed=5, as_table=False)
+    orders["OS_SEM_OPERADOR"] = dict(UNSERVABLE_ORDER)
+    return operators, orders
+
+def test_order_without_eligible_operator_does_not_make_model_infeasible():
+    operators, orders = _instance()
+    solution = linear_programming_allocation(operators, orders, DAYS, time_limit=30)
+
+    assert solution["stats"]["status"] == "Optimal"
+    assert solution["stats"]["fallback"] is None
+    assert solution["stats"]["unservable_orders"] == ["OS_SEM_OPERADOR"]
+    assert "OS_SEM_OPERADOR" not in solution["orders"]
+    # As demais ordens continuam com atribuição obrigatória.
+    assert set(solution["orders"]) == set(orders) - {"OS_SEM_OPERADOR"}
+
+def test_added_order_without_eligible_operator():
+    operators, orders = generate_instance(12, 6, seed=5, as_table=False)
+    allocator = LinearProgrammingAllocator(operators, orders, DAYS)
+    allocator.add_order("OS_SEM_OPERADOR", dict(UNSERVABLE_ORDER))
+    solution = allocator.solve(time_limit=30)
+
+    assert solution["stats"]["status"] == "Optimal"
+    assert solution["stats"]["unservable_orders"] == ["OS_SEM_OPERADOR"]
+    assert set(solution["orders"]) == set(orders)
+
+    allocator.remove_order("OS_SEM_OPERADOR")
+    assert allocator.solve(time_limit=30)["stats"]["unservable_orders"] == []
+
+def test_infeasible_model_is_reported_as_infeasible():
+    # Duas ordens de 6 horas para um único operador de 8 horas em um único dia.
+    operators = {"OP1": {"skills": ["solda"], "level": "sênior", "shift": "manhã", "hours_per_day": 8}}
+    orders = {order_id: {"required_skills": ["solda"], "estimated_hours": 6, "priority": "alta",
+                         "expected_start_day": 1, "status": "não atendida"} for order_id in ("OS1", "OS2")}
+    solution = linear_programming_allocation(operators, orders, days=1, time_limit=30)
+
+    assert solution["stats"]["status"] == "Infeasible"
+    assert solution["stats"]["fallback"] == "empty"
+    assert solution["orders"] == {}